@@ -5,8 +5,9 @@ Component simple pour les actions contextuelles
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
-from core.component import Component
+from core.component import Component, ComponentType, register_component
 
+@register_component(ComponentType.ACTION)
 @dataclass
 class ActionComponent(Component):
     """
@@ -1,10 +1,22 @@
 """
 ActionMenu Component V2.0 - Gestion menus contextuels et navigation
 """
-from core.component import Component
-from typing import Dict, List, Any, Optional
+from core.component import Component, ComponentType, register_component
+from core.history import HistoryBuffer, history_record, history_field
+from core.clock import current_clock, tick_ns
+from typing import Dict, List, Any, Optional, NamedTuple
 from dataclasses import dataclass, field
-from datetime import datetime
+
+SELECTION_HISTORY_SIZE = 100
+
+@history_record
+class ActionSelection(NamedTuple):
+    """Entrée d'historique des sélections (timestamp lisible calculé depuis tick)"""
+    action_id: str
+    menu_state: str
+    turn: int
+    tick: int
+    location: str
 
 @dataclass
 class MenuAction:
@@ -21,6 +33,7 @@ class MenuAction:
     confidence_impact: int = 1
     availability_context: List[str] = field(default_factory=list)
 
+@register_component(ComponentType.ACTION_MENU)
 @dataclass
 class ActionMenuComponent(Component):
     """Component pour gestion menus actions contextuelles"""
@@ -32,7 +45,7 @@ class ActionMenuComponent(Component):
     menu_state: str = "main"  # main, dialogue, physical, clothing, items, etc.
 
     # Historique sélections pour analytics
-    selection_history: List[Dict[str, Any]] = field(default_factory=list)
+    selection_history: HistoryBuffer = field(default_factory=history_field(SELECTION_HISTORY_SIZE))
 
     # Actions récemment utilisées (pour optimisation affichage)
     recent_actions: List[str] = field(default_factory=list)
@@ -73,13 +86,10 @@ class ActionMenuComponent(Component):
 
     def record_action_selection(self, action_id: str, context: Dict[str, Any]) -> None:
         """Enregistre sélection action pour analytics"""
-        # Historique complet
-        self.selection_history.append({
-            "action_id": action_id,
-            "menu_state": self.menu_state,
-            "timestamp": datetime.now().isoformat(),
-            "context": context.copy()
-        })
+        # Historique borné (plus anciennes sélections écrasées)
+        # Lieu seul: pas de copie du contexte complet par sélection
+        self.selection_history.append(ActionSelection(action_id, self.menu_state, current_clock().turn,
+                                                      tick_ns(), context.get("location", "")))
 
         # Actions récentes (max 10)
         if action_id in self.recent_actions:
@@ -93,10 +103,6 @@ class ActionMenuComponent(Component):
             self.favorite_actions[action_id] = 0
         self.favorite_actions[action_id] += 1
 
-        # Limite historique pour performance
-        if len(self.selection_history) > 100:
-            self.selection_history = self.selection_history[-50:]
-
         self.mark_dirty()
 
     def get_favorite_actions(self, limit: int = 5) -> List[tuple]:
@@ -5,8 +5,9 @@ Système complexe sans memory leaks pour gameplay immersif
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
-from core.component import Component
+from core.component import Component, ComponentType, register_component
 
+@register_component(ComponentType.CLOTHING)
 @dataclass
 class ClothingComponent(Component):
     """
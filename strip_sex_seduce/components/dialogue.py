@@ -4,9 +4,21 @@ Génération de textes selon stats, vêtements et personnalité
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
-from core.component import Component
+from typing import Dict, List, Any, Optional, NamedTuple
+from core.component import Component, ComponentType, register_component
+from core.history import HistoryBuffer, history_record, history_field
 
+DIALOGUE_HISTORY_SIZE = 50
+
+@history_record
+class DialogueLine(NamedTuple):
+    """Entrée d'historique des répliques"""
+    type: str
+    content: str
+    action_type: str
+    location: str
+
+@register_component(ComponentType.DIALOGUE)
 @dataclass
 class DialogueComponent(Component):
     """
@@ -29,7 +41,7 @@ class DialogueComponent(Component):
     context_flags: List[str] = field(default_factory=list)
 
     # Historique dialogue pour cohérence
-    dialogue_history: List[Dict[str, str]] = field(default_factory=list)
+    dialogue_history: HistoryBuffer = field(default_factory=history_field(DIALOGUE_HISTORY_SIZE))
 
     # Cache des réponses générées pour performance
     _response_cache: Dict[str, List[str]] = field(default_factory=dict)
@@ -73,17 +85,8 @@ class DialogueComponent(Component):
         self.npc_response = response
         self.npc_action_type = action_type
 
-        # Ajout à l'historique
-        self.dialogue_history.append({
-            "type": "npc_response",
-            "content": response,
-            "action_type": action_type,
-            "location": self.current_location
-        })
-
-        # Limitation historique pour mémoire
-        if len(self.dialogue_history) > 50:
-            self.dialogue_history = self.dialogue_history[-40:]
+        # Ajout à l'historique (borné pour mémoire)
+        self.dialogue_history.append(DialogueLine("npc_response", response, action_type, self.current_location))
 
         self.mark_dirty()
 
@@ -1,7 +1,7 @@
 """
 Inventory Component V2.0 - Gestion items érotiques et équipements
 """
-from core.component import Component
+from core.component import Component, ComponentType, register_component
 from typing import Dict, List, Any, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -24,7 +24,8 @@ class InventoryItem:
     combination_effects: Dict[str, Dict] = field(default_factory=dict)
     unlock_requirements: str = ""
 
-@dataclass  
+@register_component(ComponentType.INVENTORY)
+@dataclass
 class InventoryComponent(Component):
     """Component inventory avec gestion équipements et effets"""
 
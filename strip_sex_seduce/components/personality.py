@@ -4,10 +4,26 @@ IA comportementale qui s'adapte selon résistance joueur
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
-from core.component import Component
-
-@dataclass  
+from typing import Dict, List, Any, Optional, NamedTuple
+from core.component import Component, ComponentType, register_component
+from core.history import HistoryBuffer, history_record, history_field
+
+ADAPTATION_HISTORY_SIZE = 20
+
+@history_record
+class AdaptationRecord(NamedTuple):
+    """Entrée d'historique d'adaptation"""
+    resistance_level: float
+    success: bool
+    old_strategy: str
+    new_strategy: str
+    old_rate: float
+    new_rate: float
+    success_rate: float
+    encounter_count: int
+
+@register_component(ComponentType.PERSONALITY)
+@dataclass
 class PersonalityComponent(Component):
     """
     Component gérant la personnalité adaptative du NPC
@@ -43,7 +59,7 @@ class PersonalityComponent(Component):
     })
 
     # Historique adaptation
-    adaptation_history: List[Dict[str, Any]] = field(default_factory=list)
+    adaptation_history: HistoryBuffer = field(default_factory=history_field(ADAPTATION_HISTORY_SIZE))
 
     # État session
     session_seed: int = 0                # Seed pour cohérence
@@ -139,20 +155,10 @@ class PersonalityComponent(Component):
 
         # Enregistrement historique adaptation
         if old_modifier != self.strategy_modifier or abs(old_rate - self.escalation_rate) > 0.1:
-            self.adaptation_history.append({
-                "resistance_level": resistance_level,
-                "success": success,
-                "old_strategy": old_modifier,
-                "new_strategy": self.strategy_modifier,
-                "old_rate": old_rate,
-                "new_rate": self.escalation_rate,
-                "success_rate": success_rate,
-                "encounter_count": self.resistance_encounters
-            })
-
-            # Limite historique
-            if len(self.adaptation_history) > 20:
-                self.adaptation_history = self.adaptation_history[-15:]
+            self.adaptation_history.append(AdaptationRecord(
+                resistance_level, success, old_modifier, self.strategy_modifier,
+                old_rate, self.escalation_rate, success_rate, self.resistance_encounters
+            ))
 
         self.mark_dirty()
 
@@ -1,11 +1,25 @@
 """
 Progression Component V2.0 - Système unlocks et achievements
 """
-from core.component import Component
-from typing import Dict, List, Any, Optional, Set
+from core.component import Component, ComponentType, register_component
+from core.history import HistoryBuffer, history_record, history_field
+from core.clock import current_clock, tick_ns
+from typing import Dict, List, Any, Optional, Set, NamedTuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+UNLOCK_HISTORY_SIZE = 200
+
+@history_record
+class UnlockRecord(NamedTuple):
+    """Entrée d'historique des unlocks"""
+    type: str
+    id: str
+    source: str
+    turn: int
+    tick: int
+    progression_points: int
+
 @dataclass
 class Achievement:
     """Achievement du jeu"""
@@ -27,6 +41,7 @@ class UnlockRequirement:
     current_value: Any = 0
     is_met: bool = False
 
+@register_component(ComponentType.PROGRESSION)
 @dataclass
 class ProgressionComponent(Component):
     """Component progression avec unlocks et achievements"""
@@ -66,7 +81,7 @@ class ProgressionComponent(Component):
     pending_unlocks: Dict[str, UnlockRequirement] = field(default_factory=dict)
 
     # Historique unlocks
-    unlock_history: List[Dict[str, Any]] = field(default_factory=list)
+    unlock_history: HistoryBuffer = field(default_factory=history_field(UNLOCK_HISTORY_SIZE))
 
     def unlock_action(self, action_id: str, source: str = "progression") -> bool:
         """Débloque nouvelle action"""
@@ -139,17 +154,8 @@ class ProgressionComponent(Component):
 
     def _record_unlock(self, unlock_type: str, unlock_id: str, source: str) -> None:
         """Enregistre unlock dans historique"""
-        self.unlock_history.append({
-            "type": unlock_type,
-            "id": unlock_id,
-            "source": source,
-            "timestamp": datetime.now().isoformat(),
-            "progression_points": self.progression_points
-        })
-
-        # Limite historique
-        if len(self.unlock_history) > 200:
-            self.unlock_history = self.unlock_history[-100:]
+        self.unlock_history.append(UnlockRecord(unlock_type, unlock_id, source, current_clock().turn,
+                                                tick_ns(), self.progression_points))
 
     def update_metric(self, metric_name: str, value: Any, operation: str = "set") -> None:
         """Met à jour métrique progression"""
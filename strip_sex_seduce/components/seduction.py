@@ -1,10 +1,23 @@
 """
 Seduction Component V2.0 - Mécaniques séduction et techniques
 """
-from core.component import Component
-from typing import Dict, List, Any, Optional, Set
+from core.component import Component, ComponentType, register_component
+from core.history import HistoryBuffer, history_record, history_field
+from core.clock import current_clock, tick_ns
+from typing import Dict, List, Any, Optional, Set, NamedTuple
 from dataclasses import dataclass, field
-from datetime import datetime
+
+SUCCESS_HISTORY_SIZE = 100
+
+@history_record
+class TechniqueUse(NamedTuple):
+    """Entrée d'historique des techniques"""
+    technique_id: str
+    success: bool
+    effectiveness: float
+    turn: int
+    tick: int
+    context: Dict[str, Any]
 
 @dataclass
 class SeductionTechnique:
@@ -17,7 +30,9 @@ class SeductionTechnique:
     unlock_requirements: Dict[str, Any] = field(default_factory=dict)
     mastery_level: int = 1  # 1-10
     usage_count: int = 0
+    cooldown_turns: int = 0  # Tours d'attente après usage (lu par use_technique)
 
+@register_component(ComponentType.SEDUCTION)
 @dataclass
 class SeductionComponent(Component):
     """Component séduction avec techniques et progression"""
@@ -35,7 +50,7 @@ class SeductionComponent(Component):
     success_rate: float = 0.5
 
     # Historique succès/échecs pour analytics
-    success_history: List[Dict[str, Any]] = field(default_factory=list)
+    success_history: HistoryBuffer = field(default_factory=history_field(SUCCESS_HISTORY_SIZE))
 
     # Bonus selon situation
     situational_bonuses: Dict[str, float] = field(default_factory=dict)
@@ -69,8 +84,11 @@ class SeductionComponent(Component):
             return True
         return False
 
-    def use_technique(self, technique_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Utilise technique de séduction"""
+    def use_technique(self, technique_id: str, context: Dict[str, Any], rng) -> Dict[str, Any]:
+        """
+        Utilise technique de séduction
+        rng: flux RNG de session du system appelant (self.rng), pour rester rejouable
+        """
         if technique_id not in self.mastered_techniques:
             return {"success": False, "error": "Technique inconnue"}
 
@@ -87,8 +105,7 @@ class SeductionComponent(Component):
         final_effectiveness = min(1.0, base_effectiveness + style_bonus + situational_bonus)
 
         # Jet de succès
-        import random
-        success = random.random() < final_effectiveness
+        success = rng.random() < final_effectiveness
 
         # Mise à jour statistiques
         technique.usage_count += 1
@@ -145,23 +162,14 @@ class SeductionComponent(Component):
 
     def _record_technique_use(self, technique_id: str, success: bool, effectiveness: float, context: Dict[str, Any]) -> None:
         """Enregistre utilisation technique"""
-        self.success_history.append({
-            "technique_id": technique_id,
-            "success": success,
-            "effectiveness": effectiveness,
-            "timestamp": datetime.now().isoformat(),
-            "context": context.copy()
-        })
+        self.success_history.append(TechniqueUse(technique_id, success, effectiveness, current_clock().turn,
+                                                 tick_ns(), context.copy()))
 
         # Mise à jour success rate global
         if len(self.success_history) > 0:
-            recent_successes = sum(1 for h in self.success_history[-20:] if h['success'])
+            recent_successes = sum(1 for h in self.success_history.latest(20) if h.success)
             self.success_rate = recent_successes / min(20, len(self.success_history))
 
-        # Limite historique
-        if len(self.success_history) > 100:
-            self.success_history = self.success_history[-50:]
-
     def _gain_experience(self, xp: int) -> bool:
         """Gagne XP et vérifie level up"""
         self.experience_points += xp
@@ -1,11 +1,31 @@
 """
 StatsComponent V3.0 - Gestion stats avec seuils automatiques
 """
-from core.component import Component
-from typing import Dict, List, Any, Optional
+from core.component import Component, ComponentType, register_component
+from core.history import HistoryBuffer, history_record, history_field, record_dicts
+from core.clock import current_clock, tick_ns, format_tick
+from core.events import ThresholdCrossed, StatChanged
+from typing import Dict, List, Any, Optional, NamedTuple
 from dataclasses import dataclass, field
-from datetime import datetime
 
+STATS_HISTORY_SIZE = 200
+
+# Ordre des seuils pour la détection des bascules (cf. _update_thresholds)
+THRESHOLD_NAMES = ("vulnerable", "aroused", "submissive", "climax_ready")
+
+@history_record
+class StatChange(NamedTuple):
+    """Entrée d'historique d'apply_modifier (timestamp lisible calculé depuis tick)"""
+    turn: int
+    tick: int
+    stat: str
+    old_value: int
+    new_value: int
+    modifier: int
+    actual_change: int
+    source: str
+
+@register_component(ComponentType.STATS)
 @dataclass
 class StatsComponent(Component):
     """Component stats avec gestion automatique seuils et modifications"""
@@ -25,11 +45,11 @@ class StatsComponent(Component):
     # Modificateurs temporaires
     modifiers: dict = field(default_factory=dict)
 
-    # Historique pour debug et analytics
-    history: list = field(default_factory=list)
+    # Historique pour debug et analytics (borné, plus anciennes entrées écrasées)
+    history: HistoryBuffer = field(default_factory=history_field(STATS_HISTORY_SIZE))
 
     # Métadonnées
-    last_modified: str = ""
+    last_modified: int = 0      # Tick core.clock (formaté dans to_dict)
     is_dirty: bool = False      # Flag pour optimisation affichage
 
     def apply_modifier(self, stat_name: str, value: int, source: str = "unknown") -> Dict[str, Any]:
@@ -49,22 +69,24 @@ class StatsComponent(Component):
         actual_change = new_value - old_value
 
         # Logging modification
-        self.history.append({
-            "timestamp": datetime.now().isoformat(),
-            "stat": stat_name,
-            "old_value": old_value,
-            "new_value": new_value,
-            "modifier": value,
-            "actual_change": actual_change,
-            "source": source
-        })
-
-        # Update seuils automatiques
-        self._update_thresholds()
+        tick = tick_ns()
+        self.history.append(StatChange(current_clock().turn, tick, stat_name, old_value,
+                                       new_value, value, actual_change, source))
+
+        # Update seuils automatiques (+ événements si rattaché à un World)
+        world = self._world
+        if world is not None:
+            previous = self._threshold_values()
+            self._update_thresholds()
+            if actual_change:
+                world.events.emit(StatChanged(self._entity_id, stat_name, old_value, new_value, source))
+            self._emit_threshold_changes(previous)
+        else:
+            self._update_thresholds()
 
         # Marquer comme modifié pour affichage
         self.mark_dirty()
-        self.last_modified = datetime.now().isoformat()
+        self.last_modified = tick
 
         return {
             "success": True,
@@ -80,6 +102,20 @@ class StatsComponent(Component):
         self.thresholds["submissive"] = self.volonte < 20
         self.thresholds["climax_ready"] = self.excitation > 85
 
+    def _threshold_values(self) -> tuple:
+        thresholds = self.thresholds
+        return tuple(thresholds.get(name, False) for name in THRESHOLD_NAMES)
+
+    def _emit_threshold_changes(self, previous: tuple):
+        """ThresholdCrossed pour chaque seuil qui a basculé depuis `previous`"""
+        if previous == self._threshold_values():
+            return
+        events = self._world.events
+        for name, was_active in zip(THRESHOLD_NAMES, previous):
+            if self.thresholds.get(name, False) != was_active:
+                events.emit(ThresholdCrossed(self._entity_id, name, not was_active,
+                                             self.volonte, self.excitation))
+
     def apply_temporary_effects_decay(self, decay_rate: float = 0.95):
         """Applique decay aux effets temporaires"""
         for effect, value in self.modifiers.items():
@@ -99,6 +135,7 @@ class StatsComponent(Component):
     def mark_dirty(self):
         """Marque component comme modifié pour affichage"""
         self.is_dirty = True
+        self._notify_change()
 
     def mark_clean(self):
         """Marque component comme traité pour affichage"""
@@ -123,7 +160,8 @@ class StatsComponent(Component):
             "excitation": self.excitation,
             "thresholds": self.thresholds,
             "modifiers": self.modifiers,
-            "last_modified": self.last_modified,
+            "last_modified": format_tick(self.last_modified) if self.last_modified else "",
+            "history": record_dicts(self.history),
             "history_count": len(self.history)
         }
 
@@ -0,0 +1,181 @@
+"""
+Core - Index des alias d'actions
+Construit une fois depuis les catalogues (actions NPC de balance.json, actions
+joueuse de actions_config.json, catalogues Python enregistrés par les systems et
+entities qui les définissent) et partagé par tous les systems:
+nom exact -> dict, alias partiel -> table de tokens, résultat mémoïsé par entrée
+
+Chaque action connue reçoit un identifiant entier dense (actions NPC d'abord):
+les systems indexent leurs tables par id et masques de bits, les noms ne
+servent qu'à l'affichage et aux sauvegardes
+"""
+
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from core.assets import AssetRegistry
+from utils.performance import LRUCache
+import re
+
+ACTIONS_CONFIG_PATH = "assets/config/actions_config.json"
+BALANCE_PATH = "assets/config/balance.json"
+CATALOGS_KEY = "actions:catalogs"
+INDEX_KEY = "actions:index"
+DEFAULT_NPC_ACTION = "compliment"
+
+# Verbes génériques -> action NPC (ordre = priorité si plusieurs correspondent)
+ACTION_ALIASES = (
+    ("regarder", "regard_insistant"),
+    ("complimenter", "compliment"),
+    ("parler", "conversation_charme"),
+    ("toucher", "contact_epaule"),
+    ("se_rapprocher", "rapprochement_physique"),
+    ("caresser", "caresses_douces"),
+    ("embrasser", "baiser_leger")
+)
+
+_TOKEN_SPLIT = re.compile(r"[\s_\-/]+")
+
+# Catalogues enregistrés: nom -> (actions, actions NPC ?)
+_catalogs: Dict[str, Tuple[Tuple[str, ...], bool]] = {}
+
+class ActionIndex:
+    """
+    Résolution nom d'action -> action NPC connue
+    Ordre: nom exact, tokens d'alias, sous-chaîne d'alias (rare, mémoïsé), défaut
+    Ids: 0..len(npc_actions)-1 pour les actions NPC, puis joueuse, puis extra
+    """
+
+    def __init__(self, npc_actions: Iterable[str], player_actions: Iterable[str] = (),
+                 aliases: Iterable[Tuple[str, str]] = ACTION_ALIASES,
+                 default: str = DEFAULT_NPC_ACTION, memo_size: int = 1024,
+                 extra_actions: Iterable[str] = ()):
+        self.npc_actions = tuple(dict.fromkeys(npc_actions))
+        self.player_actions = frozenset(player_actions)
+        self.default = default
+
+        # Table d'internement: nom <-> id dense
+        self.names: Tuple[str, ...] = tuple(dict.fromkeys((*self.npc_actions, *player_actions, *extra_actions)))
+        self.ids: Dict[str, int] = {name: action_id for action_id, name in enumerate(self.names)}
+
+        self._exact: Dict[str, str] = {name: name for name in self.npc_actions}
+        self._aliases = tuple((alias, target) for alias, target in aliases if target in self._exact)
+        # Alias d'un seul token ("caresser") ou en plusieurs ("se_rapprocher")
+        self._token_aliases: Dict[Tuple[str, ...], Tuple[int, str]] = {
+            tuple(_TOKEN_SPLIT.split(alias)): (rank, target)
+            for rank, (alias, target) in enumerate(self._aliases)
+        }
+        self._max_alias_tokens = max((len(tokens) for tokens in self._token_aliases), default=0)
+        self._memo = LRUCache(max_size=memo_size)
+
+    def resolve(self, name: str) -> str:
+        """Action NPC pour un nom quelconque (mémoïsé)"""
+        action = self._exact.get(name)
+        if action is not None:
+            return action
+
+        action = self._memo.get(name)
+        if action is None:
+            action = self._resolve_alias(name)
+            self._memo.put(name, action)
+        return action
+
+    def _resolve_alias(self, name: str) -> str:
+        lowered = name.lower()
+        action = self._exact.get(lowered)
+        if action is not None:
+            return action
+
+        tokens = [token for token in _TOKEN_SPLIT.split(lowered) if token]
+        best: Optional[Tuple[int, str]] = None
+        for size in range(1, self._max_alias_tokens + 1):
+            for start in range(len(tokens) - size + 1):
+                match = self._token_aliases.get(tuple(tokens[start:start + size]))
+                if match is not None and (best is None or match[0] < best[0]):
+                    best = match
+        if best is not None:
+            return best[1]
+
+        # Alias collé à un autre mot ("recaresser"): balayage des sous-chaînes
+        for alias, target in self._aliases:
+            if alias in lowered:
+                return target
+        return self.default
+
+    def resolve_id(self, name: str) -> int:
+        """Id de l'action NPC résolue (toujours une action NPC, donc < len(npc_actions))"""
+        return self.ids[self.resolve(name)]
+
+    def get_id(self, name: str, default: int = -1) -> int:
+        """Id d'un nom exact, `default` si l'action n'est dans aucun catalogue"""
+        return self.ids.get(name, default)
+
+    def name_of(self, action_id: int) -> str:
+        return self.names[action_id]
+
+    def mask(self, names: Iterable[str]) -> int:
+        """Ensemble de noms -> masque de bits (noms inconnus ignorés)"""
+        ids = self.ids
+        result = 0
+        for name in names:
+            action_id = ids.get(name)
+            if action_id is not None:
+                result |= 1 << action_id
+        return result
+
+    def names_in(self, mask: int) -> List[str]:
+        """Masque de bits -> noms, dans l'ordre des ids"""
+        names = []
+        while mask:
+            low = mask & -mask
+            names.append(self.names[low.bit_length() - 1])
+            mask ^= low
+        return names
+
+    def is_npc_action(self, name: str) -> bool:
+        return name in self._exact
+
+    def is_player_action(self, name: str) -> bool:
+        return name in self.player_actions
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "npc_actions": len(self.npc_actions),
+            "interned": len(self.names),
+            "player_actions": len(self.player_actions),
+            "aliases": len(self._aliases),
+            "memo": self._memo.get_stats()
+        }
+
+def register_action_catalog(name: str, actions: Iterable[str], npc: bool = False):
+    """
+    Catalogue d'actions fourni par une couche supérieure (à l'import du module qui le définit)
+    npc=True: actions NPC (ids bas, cibles des alias), sinon internées après les actions joueuse
+    """
+    _catalogs[name] = (tuple(actions), npc)
+    AssetRegistry.put(CATALOGS_KEY, _catalogs_asset())  # Nouvelle version: index reconstruit
+
+def _catalogs_asset() -> Dict[str, Any]:
+    return {name: {"actions": actions, "npc": npc} for name, (actions, npc) in sorted(_catalogs.items())}
+
+def action_catalog_sources() -> List[str]:
+    """Assets dont dépend l'index (versions suivies pour le rechargement à chaud)"""
+    return [ACTIONS_CONFIG_PATH, BALANCE_PATH, CATALOGS_KEY]
+
+def build_action_index() -> ActionIndex:
+    """Index depuis les catalogues courants de l'AssetRegistry"""
+    catalogs = AssetRegistry.get(CATALOGS_KEY, _catalogs_asset)
+    balance = AssetRegistry.load_json(BALANCE_PATH, dict).get("stats_effects", {})
+    npc_actions = list(balance.get("action_effects") or ())
+    extra_actions = []
+    for catalog in catalogs.values():
+        (npc_actions if catalog["npc"] else extra_actions).extend(catalog["actions"])
+
+    player_actions = AssetRegistry.load_json(ACTIONS_CONFIG_PATH, dict).get("actions", {})
+    return ActionIndex(npc_actions, player_actions, extra_actions=extra_actions)
+
+def get_action_index() -> ActionIndex:
+    """Index partagé par le process, reconstruit (même clé) quand un catalogue change de version"""
+    # Catalogues chargés avant le calcul des versions: elles ne bougent pas pendant la construction
+    AssetRegistry.load_json(ACTIONS_CONFIG_PATH, dict)
+    AssetRegistry.load_json(BALANCE_PATH, dict)
+    AssetRegistry.get(CATALOGS_KEY, _catalogs_asset)
+    return AssetRegistry.get_derived(INDEX_KEY, action_catalog_sources(), build_action_index)
@@ -0,0 +1,132 @@
+"""
+Core - Bundle d'assets précompilé
+Tous les JSON de assets/config, assets/dialogues et assets/personalities
+parsés une fois par scripts/build_assets.py et écrits en un seul fichier marshal
+
+Le bundle porte l'empreinte de ses sources: au démarrage, un bundle périmé
+(source modifiée, ajoutée ou supprimée) est ignoré et les JSON sont relus
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from core.assets import AssetRegistry
+import hashlib
+import marshal
+import struct
+import json
+import sys
+import os
+
+BUNDLE_MAGIC = b"SSAB"
+BUNDLE_VERSION = 1
+DEFAULT_BUNDLE_PATH = "assets/assets.bundle"
+ASSET_DIRS = ("assets/config", "assets/dialogues", "assets/personalities")
+
+_HEADER = struct.Struct("<4sHI")  # magic, version, longueur de l'index
+
+# Le format marshal dépend de la version de Python
+_FORMAT_TAG = f"{marshal.version}:{sys.version_info[0]}.{sys.version_info[1]}"
+
+_status: Dict[str, Any] = {"attempted": False, "loaded": False, "reason": "non chargé", "files": 0}
+
+def source_files(root: str = ".") -> List[str]:
+    """Chemins relatifs (style 'assets/config/x.json') des sources du bundle, triés"""
+    files = []
+    for directory in ASSET_DIRS:
+        full = os.path.join(root, directory)
+        if not os.path.isdir(full):
+            continue
+        for name in sorted(os.listdir(full)):
+            if name.endswith(".json"):
+                files.append(f"{directory}/{name}")
+    return files
+
+def _stat_fingerprint(root: str, files: List[str]) -> List[Tuple[str, int, int]]:
+    """Empreinte rapide (taille, mtime): évite de relire les sources si rien n'a bougé"""
+    fingerprint = []
+    for rel in files:
+        st = os.stat(os.path.join(root, rel))
+        fingerprint.append((rel, st.st_size, st.st_mtime_ns))
+    return fingerprint
+
+def sources_digest(root: str = ".", files: Optional[List[str]] = None) -> str:
+    """Hash du contenu des sources (chemins + octets)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_FORMAT_TAG.encode())
+    for rel in (files if files is not None else source_files(root)):
+        with open(os.path.join(root, rel), 'rb') as f:
+            content = f.read()
+        digest.update(rel.encode() + b"\0" + struct.pack("<Q", len(content)))
+        digest.update(content)
+    return digest.hexdigest()
+
+def build_bundle(root: str = ".", path: str = DEFAULT_BUNDLE_PATH) -> Dict[str, Any]:
+    """Parse toutes les sources et écrit le bundle (écriture atomique)"""
+    files = source_files(root)
+    assets = {}
+    for rel in files:
+        with open(os.path.join(root, rel), 'r', encoding='utf-8') as f:
+            assets[rel] = json.load(f)
+
+    index = marshal.dumps({
+        "format": _FORMAT_TAG,
+        "digest": sources_digest(root, files),
+        "stat": _stat_fingerprint(root, files)
+    })
+    blob = _HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index)) + index + marshal.dumps(assets)
+
+    full_path = os.path.join(root, path)
+    tmp_path = full_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp_path, full_path)
+    return {"files": len(files), "bytes": len(blob), "path": full_path}
+
+def read_bundle(root: str = ".", path: str = DEFAULT_BUNDLE_PATH) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Assets du bundle s'il est à jour, sinon (None, raison)"""
+    try:
+        with open(os.path.join(root, path), 'rb') as f:
+            blob = f.read()
+    except FileNotFoundError:
+        return None, "absent"
+
+    if len(blob) < _HEADER.size:
+        return None, "tronqué"
+    magic, version, index_length = _HEADER.unpack_from(blob)
+    if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+        return None, "format inconnu"
+
+    try:
+        index = marshal.loads(blob[_HEADER.size:_HEADER.size + index_length])
+        if index.get("format") != _FORMAT_TAG:
+            return None, "autre version de Python"
+
+        files = source_files(root)
+        stat = [tuple(entry) for entry in index["stat"]]
+        # Tailles/mtimes identiques: sources inchangées; sinon vérification du contenu
+        if stat != _stat_fingerprint(root, files) and index["digest"] != sources_digest(root, files):
+            return None, "périmé"
+
+        return marshal.loads(blob[_HEADER.size + index_length:]), "ok"
+    except (ValueError, EOFError, TypeError, KeyError, OSError):
+        return None, "illisible"
+
+def preload_assets(root: str = ".", path: str = DEFAULT_BUNDLE_PATH, force: bool = False) -> bool:
+    """
+    Installe le bundle dans l'AssetRegistry (une fois par process)
+    Retourne False si le bundle est absent ou périmé: les JSON sont alors lus à la demande
+    """
+    if _status["attempted"] and not force:
+        return _status["loaded"]
+
+    assets, reason = read_bundle(root, path)
+    _status.update(attempted=True, loaded=False, reason=reason)
+    if assets is None:
+        return False
+
+    for rel, value in assets.items():
+        AssetRegistry.put(rel, value)
+    _status.update(loaded=True, files=len(assets))
+    return True
+
+def get_bundle_status() -> Dict[str, Any]:
+    return dict(_status)
@@ -0,0 +1,117 @@
+"""
+Core - Rechargement à chaud des assets
+Polling (stat puis hash du contenu) des JSON de assets/: seul le fichier
+modifié est relu, puis remplacé dans l'AssetRegistry. Les systems qui en
+dépendent se rechargent entre deux tours (SystemManager.refresh_assets)
+"""
+
+from typing import Dict, List, Optional, Tuple
+from core.assets import AssetRegistry
+from core.asset_bundle import source_files
+import hashlib
+import json
+import time
+import os
+
+class AssetWatcher:
+    """
+    Surveille les sources d'assets par polling, bibliothèque standard uniquement
+    poll() est limité à un passage par `interval` secondes (force=True pour ignorer)
+    """
+
+    def __init__(self, root: str = ".", interval: float = 1.0, paths: Optional[List[str]] = None):
+        self.root = root
+        self.interval = interval
+        self._fixed_paths = list(paths) if paths is not None else None
+        self._last_poll = time.monotonic()
+        # chemin relatif -> (taille, mtime_ns, hash du contenu)
+        self._seen: Dict[str, Tuple[int, int, str]] = {}
+        self.stats = {"polls": 0, "reloads": 0, "errors": 0, "last_reload_ms": 0.0}
+
+        for rel in self._paths():
+            entry = self._fingerprint(rel)
+            if entry is not None:
+                self._seen[rel] = entry
+
+    def _paths(self) -> List[str]:
+        return self._fixed_paths if self._fixed_paths is not None else source_files(self.root)
+
+    def _fingerprint(self, rel: str, content: Optional[bytes] = None) -> Optional[Tuple[int, int, str]]:
+        full = os.path.join(self.root, rel)
+        try:
+            st = os.stat(full)
+            if content is None:
+                with open(full, 'rb') as f:
+                    content = f.read()
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns, hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    def poll(self, force: bool = False) -> List[str]:
+        """Recharge les fichiers modifiés, ajoutés ou supprimés; retourne leurs chemins"""
+        now = time.monotonic()
+        if not force and now - self._last_poll < self.interval:
+            return []
+        self._last_poll = now
+        self.stats["polls"] += 1
+
+        changed = []
+        paths = self._paths()
+        for rel in paths:
+            full = os.path.join(self.root, rel)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+
+            previous = self._seen.get(rel)
+            if previous is not None and previous[:2] == (st.st_size, st.st_mtime_ns):
+                continue
+            if self._reload(rel, previous):
+                changed.append(rel)
+
+        # Fichiers supprimés: retour aux valeurs par défaut des systems
+        for rel in [r for r in self._seen if r not in paths or not os.path.exists(os.path.join(self.root, r))]:
+            del self._seen[rel]
+            AssetRegistry.invalidate(rel)
+            changed.append(rel)
+
+        return changed
+
+    def _reload(self, rel: str, previous: Optional[Tuple[int, int, str]]) -> bool:
+        """Relit et parse un seul fichier; l'ancienne version reste en place si le JSON est invalide"""
+        start = time.perf_counter()
+        try:
+            with open(os.path.join(self.root, rel), 'rb') as f:
+                content = f.read()
+        except OSError:
+            return False
+
+        entry = self._fingerprint(rel, content)
+        if entry is None:
+            return False
+        self._seen[rel] = entry
+        # mtime changé mais contenu identique (touch, checkout)
+        if previous is not None and previous[2] == entry[2]:
+            return False
+
+        try:
+            data = json.loads(content.decode('utf-8'))
+        except (ValueError, UnicodeDecodeError) as e:
+            self.stats["errors"] += 1
+            print(f"⚠️ Asset {rel} invalide, version précédente conservée: {e}")
+            return False
+
+        AssetRegistry.put(rel, data)
+        self.stats["reloads"] += 1
+        self.stats["last_reload_ms"] = (time.perf_counter() - start) * 1000
+        return True
+
+_shared_watcher: Optional[AssetWatcher] = None
+
+def get_shared_watcher(interval: float = 1.0) -> AssetWatcher:
+    """Watcher unique par process: toutes les sessions partagent l'AssetRegistry"""
+    global _shared_watcher
+    if _shared_watcher is None:
+        _shared_watcher = AssetWatcher(interval=interval)
+    return _shared_watcher
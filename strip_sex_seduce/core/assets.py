@@ -0,0 +1,125 @@
+"""
+Core - Registre d'assets process-wide
+Chaque asset (JSON ou table construite en Python) est chargé une seule fois,
+figé en lecture seule (MappingProxyType, tuples, frozensets) et partagé par
+toutes les sessions et tous les systems du process
+"""
+
+from typing import Dict, Any, Callable, Optional, Sequence, Tuple
+from types import MappingProxyType
+import threading
+import json
+
+def freeze(value: Any) -> Any:
+    """Copie figée récursive: dict -> MappingProxyType, list -> tuple, set -> frozenset"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """Copie mutable d'un asset figé (pour l'état propre à une session)"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    if isinstance(value, frozenset):
+        return set(thaw(item) for item in value)
+    return value
+
+class AssetRegistry:
+    """
+    Cache d'assets figés partagé par le process
+    La construction est protégée par un verrou: une seule construction par clé
+    """
+
+    _assets: Dict[str, Any] = {}
+    _versions: Dict[str, int] = {}  # Incrémenté à chaque (re)chargement: détection côté systems
+    _stamps: Dict[str, Tuple] = {}  # (source, version) d'un asset dérivé à sa construction
+    _lock = threading.Lock()
+    _stats = {"loads": 0, "hits": 0}
+
+    @classmethod
+    def get(cls, key: str, builder: Callable[[], Any]) -> Any:
+        """Asset figé pour `key`, construit par `builder` au premier appel"""
+        try:
+            asset = cls._assets[key]
+            cls._stats["hits"] += 1
+            return asset
+        except KeyError:
+            pass
+
+        with cls._lock:
+            if key not in cls._assets:
+                cls._assets[key] = freeze(builder())
+                cls._versions[key] = cls._versions.get(key, 0) + 1
+                cls._stats["loads"] += 1
+            return cls._assets[key]
+
+    @classmethod
+    def get_derived(cls, key: str, sources: Sequence[str], builder: Callable[[], Any]) -> Any:
+        """
+        Asset construit depuis d'autres assets (index, tables): clé fixe, reconstruit
+        et remplacé quand une source change de version (les sources doivent être
+        chargées avant l'appel)
+        """
+        stamp = tuple((rel, cls._versions.get(rel, 0)) for rel in sources)
+        if cls._stamps.get(key) == stamp and key in cls._assets:
+            cls._stats["hits"] += 1
+            return cls._assets[key]
+
+        with cls._lock:
+            if cls._stamps.get(key) != stamp or key not in cls._assets:
+                cls._assets[key] = freeze(builder())
+                cls._stamps[key] = stamp
+                cls._versions[key] = cls._versions.get(key, 0) + 1
+                cls._stats["loads"] += 1
+            return cls._assets[key]
+
+    @classmethod
+    def load_json(cls, path: str, default: Optional[Callable[[], Any]] = None) -> Any:
+        """Fichier JSON figé (default() si le fichier n'existe pas)"""
+        def builder():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except FileNotFoundError:
+                if default is None:
+                    raise
+                return default()
+        return cls.get(path, builder)
+
+    @classmethod
+    def put(cls, key: str, value: Any) -> Any:
+        """Installe un asset déjà chargé (bundle, rechargement à chaud), remplace l'existant"""
+        frozen = freeze(value)
+        with cls._lock:
+            cls._assets[key] = frozen
+            cls._versions[key] = cls._versions.get(key, 0) + 1
+            cls._stats["loads"] += 1
+        return frozen
+
+    @classmethod
+    def contains(cls, key: str) -> bool:
+        return key in cls._assets
+
+    @classmethod
+    def version(cls, key: str) -> int:
+        """Version courante d'un asset (0: jamais chargé)"""
+        return cls._versions.get(key, 0)
+
+    @classmethod
+    def invalidate(cls, key: Optional[str] = None):
+        """Oublie un asset (ou tous): reconstruit au prochain get"""
+        with cls._lock:
+            keys = list(cls._assets) if key is None else [key]
+            for name in keys:
+                if cls._assets.pop(name, None) is not None:
+                    cls._versions[name] = cls._versions.get(name, 0) + 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        return {"assets": len(cls._assets), **cls._stats}
@@ -0,0 +1,54 @@
+"""
+Core - Horloge de session
+Les historiques enregistrent (tour, tick) à coût constant: le tick est un
+compteur monotone en nanosecondes, recalé une fois sur l'epoch au démarrage
+du process. L'horodatage lisible n'est formaté qu'à l'export ou l'affichage
+"""
+
+from datetime import datetime
+import time
+
+# monotonic_ns + décalage = ns depuis l'epoch, sans appel à l'horloge murale par entrée
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+def tick_ns() -> int:
+    """Tick courant: monotone dans le process, comparable entre process (à la dérive près)"""
+    return time.monotonic_ns() + _EPOCH_OFFSET_NS
+
+def format_tick(tick: int) -> str:
+    """Tick -> horodatage ISO local (affichage, export)"""
+    return datetime.fromtimestamp(tick / 1e9).isoformat()
+
+class SessionClock:
+    """Tour courant d'une session + ticks; la session active est celle du dernier start_turn"""
+
+    __slots__ = ("turn", "started_tick")
+
+    def __init__(self):
+        self.turn = 0
+        self.started_tick = tick_ns()
+
+    def start_turn(self, turn: int):
+        """Appelé au début de chaque tour par la session"""
+        global _current_clock
+        self.turn = turn
+        _current_clock = self
+
+    @staticmethod
+    def tick() -> int:
+        return tick_ns()
+
+    def elapsed_ns(self) -> int:
+        return tick_ns() - self.started_tick
+
+    def __repr__(self) -> str:
+        return f"SessionClock(turn={self.turn}, elapsed={self.elapsed_ns() / 1e9:.1f}s)"
+
+# Horloge par défaut (tests, systems utilisés hors session)
+_current_clock = SessionClock()
+
+def current_clock() -> SessionClock:
+    return _current_clock
+
+def current_turn() -> int:
+    return _current_clock.turn
@@ -4,8 +4,8 @@ Architecture Entity-Component-System stricte
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Type, Union, Callable
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum
 import json
 
@@ -16,6 +16,100 @@ class ComponentType(Enum):
     DIALOGUE = "dialogue"
     PERSONALITY = "personality"
     ACTION = "action"
+    INVENTORY = "inventory"
+    SEDUCTION = "seduction"
+    PROGRESSION = "progression"
+    ACTION_MENU = "action_menu"
+
+# Clé de stockage d'un component: son ComponentType, ou sa classe
+# pour les components enregistrés sans type dédié
+ComponentKey = Union[ComponentType, type]
+
+class ComponentRegistry:
+    """
+    Registre central classe de component -> clé de stockage
+    Chaque classe s'enregistre une seule fois, les lookups sont des accès dict O(1)
+    """
+
+    _class_to_key: Dict[type, ComponentKey] = {}
+    _key_to_class: Dict[ComponentKey, type] = {}
+
+    # Cache des résolutions par MRO (sous-classes non enregistrées)
+    _resolved: Dict[type, Optional[ComponentKey]] = {}
+
+    @classmethod
+    def register(cls, component_class: type,
+                 component_type: Optional[ComponentType] = None) -> type:
+        """
+        Enregistre une classe de component
+        Sans component_type, la classe devient sa propre clé de stockage
+        """
+        key = component_type if component_type is not None else component_class
+
+        existing = cls._key_to_class.get(key)
+        if existing is not None and existing is not component_class:
+            # Redéfinition d'une classe au rechargement du module: on remplace
+            if existing.__qualname__ != component_class.__qualname__:
+                raise ValueError(
+                    f"{key} déjà enregistré pour {existing.__name__}, "
+                    f"impossible d'enregistrer {component_class.__name__}"
+                )
+            del cls._class_to_key[existing]
+
+        cls._class_to_key[component_class] = key
+        cls._key_to_class[key] = component_class
+        cls._resolved.clear()
+        return component_class
+
+    @classmethod
+    def key_for(cls, component_class: type) -> Optional[ComponentKey]:
+        """Retourne la clé de stockage d'une classe (None si non enregistrée)"""
+        key = cls._class_to_key.get(component_class)
+        if key is not None:
+            return key
+
+        try:
+            return cls._resolved[component_class]
+        except KeyError:
+            pass
+
+        # Sous-classe d'un component enregistré: résolution MRO une seule fois
+        resolved = None
+        for base in getattr(component_class, "__mro__", ())[1:]:
+            if base in cls._class_to_key:
+                resolved = cls._class_to_key[base]
+                break
+
+        cls._resolved[component_class] = resolved
+        return resolved
+
+    @classmethod
+    def resolve_key(cls, key_or_class: Union[ComponentKey, type]) -> Optional[ComponentKey]:
+        """Accepte un ComponentType ou une classe et retourne la clé de stockage"""
+        if isinstance(key_or_class, ComponentType):
+            return key_or_class
+        return cls.key_for(key_or_class)
+
+    @classmethod
+    def class_for(cls, key: ComponentKey) -> Optional[type]:
+        """Retourne la classe enregistrée pour une clé"""
+        return cls._key_to_class.get(key)
+
+    @classmethod
+    def key_name(cls, key: ComponentKey) -> str:
+        """Nom sérialisable d'une clé"""
+        return key.value if isinstance(key, ComponentType) else key.__name__
+
+    @classmethod
+    def registered_keys(cls) -> Dict[ComponentKey, type]:
+        """Retourne une copie du registre clé -> classe"""
+        return dict(cls._key_to_class)
+
+def register_component(component_type: Optional[ComponentType] = None) -> Callable[[type], type]:
+    """Décorateur d'enregistrement d'une classe de component"""
+    def decorator(component_class: type) -> type:
+        return ComponentRegistry.register(component_class, component_type)
+    return decorator
 
 class Component(ABC):
     """
@@ -23,6 +117,11 @@ class Component(ABC):
     Un component ne contient que des données, pas de logique
     """
 
+    # Défauts de classe: les components dataclass n'appellent pas toujours __init__
+    _entity_id = None
+    _dirty = False
+    _world = None  # World de rattachement, reçoit les change sets
+
     def __init__(self):
         self._entity_id: Optional[str] = None
         self._dirty = False  # Flag pour optimisation updates
@@ -42,6 +141,12 @@ class Component(ABC):
     def mark_dirty(self):
         """Marque le component comme modifié"""
         self._dirty = True
+        self._notify_change()
+
+    def _notify_change(self):
+        """Enregistre la modification dans le change set du World"""
+        if self._world is not None:
+            self._world.record_change(self)
 
     def mark_clean(self):
         """Marque le component comme synchronisé"""
@@ -55,6 +160,17 @@ class Component(ABC):
             "dirty": self._dirty
         }
 
+    def get_snapshot_state(self) -> Dict[str, Any]:
+        """État complet pour snapshot (champs dataclass, sinon attributs publics)"""
+        if is_dataclass(self):
+            return {f.name: getattr(self, f.name) for f in fields(self)}
+        return {k: v for k, v in vars(self).items() if not k.startswith("_")}
+
+    def restore_snapshot_state(self, state: Dict[str, Any]):
+        """Restaure l'état capturé par get_snapshot_state"""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Component':
         """Désérialise depuis dictionnaire"""
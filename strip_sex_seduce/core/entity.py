@@ -3,8 +3,8 @@ Core ECS - Entity Management
 Une Entity est un conteneur d'ID avec des Components
 """
 
-from typing import Dict, List, Optional, Type, TypeVar
-from core.component import Component, ComponentType
+from typing import Dict, List, Optional, Type, TypeVar, Union
+from core.component import Component, ComponentType, ComponentKey, ComponentRegistry
 import uuid
 
 T = TypeVar('T', bound=Component)
@@ -15,45 +15,58 @@ class Entity:
     Contient uniquement un ID et gère ses components
     """
 
+    # Empreinte mémoire minimale pour les entities en masse
+    __slots__ = ("id", "_components", "_world", "__weakref__")
+
     def __init__(self, entity_id: str = None):
         self.id = entity_id or f"entity_{uuid.uuid4().hex[:8]}"
-        self._components: Dict[ComponentType, Component] = {}
+        self._components: Dict[ComponentKey, Component] = {}
+        self._world = None  # World de rattachement, notifié des changements
 
     def add_component(self, component: Component) -> 'Entity':
         """
         Ajoute un component à l'entity
-        Auto-détection du type de component
+        Type résolu via le ComponentRegistry
         """
-        # Détection automatique du type
         component_type = self._detect_component_type(component)
 
         if component_type:
             component.entity_id = self.id
             self._components[component_type] = component
+            if self._world is not None:
+                self._world._on_component_added(self, component_type, component)
         else:
             raise ValueError(f"Type de component non reconnu: {type(component)}")
 
         return self
 
-    def get_component(self, component_type: ComponentType) -> Optional[Component]:
-        """Récupère un component par son type"""
-        return self._components.get(component_type)
+    def mark_dirty(self):
+        """Attributs d'instance modifiés: enregistré dans le change log du World (sauvegarde incrémentale)"""
+        if self._world is not None:
+            self._world.record_entity_change(self)
+
+    def get_component(self, component_type: Union[ComponentType, Type[T]]) -> Optional[Component]:
+        """Récupère un component par son type (ou sa classe)"""
+        return self._components.get(ComponentRegistry.resolve_key(component_type))
 
     def get_component_of_type(self, component_class: Type[T]) -> Optional[T]:
         """Récupère un component par sa classe"""
-        for component in self._components.values():
-            if isinstance(component, component_class):
-                return component
+        component = self._components.get(ComponentRegistry.key_for(component_class))
+        if component is not None and isinstance(component, component_class):
+            return component
         return None
 
-    def has_component(self, component_type: ComponentType) -> bool:
+    def has_component(self, component_type: Union[ComponentType, Type[Component]]) -> bool:
         """Vérifie la présence d'un component"""
-        return component_type in self._components
+        return ComponentRegistry.resolve_key(component_type) in self._components
 
-    def remove_component(self, component_type: ComponentType) -> bool:
+    def remove_component(self, component_type: Union[ComponentType, Type[Component]]) -> bool:
         """Supprime un component"""
-        if component_type in self._components:
-            del self._components[component_type]
+        key = ComponentRegistry.resolve_key(component_type)
+        if key in self._components:
+            component = self._components.pop(key)
+            if self._world is not None:
+                self._world._on_component_removed(self, key, component)
             return True
         return False
 
@@ -61,29 +74,62 @@ class Entity:
         """Retourne tous les components de l'entity"""
         return list(self._components.values())
 
-    def _detect_component_type(self, component: Component) -> Optional[ComponentType]:
-        """Détecte automatiquement le type d'un component"""
-        class_name = component.__class__.__name__.lower()
-
-        if "stats" in class_name:
-            return ComponentType.STATS
-        elif "clothing" in class_name:
-            return ComponentType.CLOTHING
-        elif "dialogue" in class_name:
-            return ComponentType.DIALOGUE
-        elif "personality" in class_name:
-            return ComponentType.PERSONALITY
-        elif "action" in class_name:
-            return ComponentType.ACTION
+    def _detect_component_type(self, component: Component) -> Optional[ComponentKey]:
+        """Résout la clé de stockage d'un component depuis le registre"""
+        return ComponentRegistry.key_for(type(component))
 
-        return None
+    # Attributs d'instance exclus des snapshots (recréés par la session)
+    _snapshot_exclude = ("rng",)
+
+    def get_snapshot_state(self) -> Dict:
+        """État complet: attributs d'instance + état de chaque component"""
+        attrs = getattr(self, "__dict__", {})
+        return {
+            "id": self.id,
+            "attrs": {k: v for k, v in attrs.items() if k not in self._snapshot_exclude},
+            "components": {
+                ComponentRegistry.key_name(key): (type(comp).__name__, comp.get_snapshot_state())
+                for key, comp in self._components.items()
+            }
+        }
+
+    def restore_snapshot_state(self, state: Dict):
+        """
+        Restaure attributs et components
+        Les components existants sont mis à jour en place (références World conservées)
+        """
+        for name, value in state.get("attrs", {}).items():
+            setattr(self, name, value)
+        if state.get("attrs"):
+            self.mark_dirty()
+
+        keys_by_name = {ComponentRegistry.key_name(key): key for key in ComponentRegistry.registered_keys()}
+        restored = set()
+        for key_name, (class_name, comp_state) in state.get("components", {}).items():
+            key = keys_by_name.get(key_name)
+            if key is None:
+                continue
+            restored.add(key)
+
+            component = self._components.get(key)
+            if component is None or type(component).__name__ != class_name:
+                component_class = ComponentRegistry.class_for(key)
+                component = component_class.__new__(component_class)
+                component.restore_snapshot_state(comp_state)
+                self.add_component(component)
+            else:
+                component.restore_snapshot_state(comp_state)
+                component._notify_change()
+
+        for key in [k for k in self._components if k not in restored]:
+            self.remove_component(key)
 
     def to_dict(self) -> Dict:
         """Sérialise l'entity complète"""
         return {
             "id": self.id,
             "components": {
-                comp_type.value: comp.to_dict() 
+                ComponentRegistry.key_name(comp_type): comp.to_dict()
                 for comp_type, comp in self._components.items()
             }
         }
@@ -0,0 +1,112 @@
+"""
+Core - Bus d'événements
+Événements typés (NamedTuple) publiés par les components et entities d'un
+World, reçus par les abonnés de leur type exact. Synchrone par défaut: emit()
+appelle les handlers immédiatement; un abonnement deferred=True reçoit ses
+événements au flush() de fin de tour. Sans abonné, emit() coûte un lookup dict
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+import threading
+
+# Événements
+
+class ThresholdCrossed(NamedTuple):
+    """Seuil StatsComponent atteint (active=True) ou quitté"""
+    entity_id: Optional[str]
+    threshold: str
+    active: bool
+    volonte: int
+    excitation: int
+
+class StatChanged(NamedTuple):
+    """Stat modifiée par StatsComponent.apply_modifier (changement réel non nul)"""
+    entity_id: Optional[str]
+    stat: str
+    old_value: int
+    new_value: int
+    source: str
+
+class LocationChanged(NamedTuple):
+    """Changement de lieu (GameState.change_location)"""
+    old_location: str
+    new_location: str
+    turn: int
+
+Handler = Callable[[Any], None]
+
+class EventBus:
+    """
+    Abonnements par type d'événement
+    Les handlers différés sont mis en file (thread-safe) jusqu'au flush()
+    """
+
+    def __init__(self):
+        self._handlers: Dict[type, Tuple[Handler, ...]] = {}
+        self._deferred_handlers: Dict[type, Tuple[Handler, ...]] = {}
+        self._queue: List[Tuple[Handler, Any]] = []
+        self._queue_lock = threading.Lock()
+        self.emitted = 0  # Compteur d'événements publiés (avec abonnés)
+
+    def subscribe(self, event_type: Type, handler: Handler, deferred: bool = False) -> Handler:
+        """Abonne handler aux événements event_type (deferred: livrés au flush)"""
+        table = self._deferred_handlers if deferred else self._handlers
+        table[event_type] = table.get(event_type, ()) + (handler,)
+        return handler
+
+    def unsubscribe(self, event_type: Type, handler: Handler) -> bool:
+        """Retire un abonnement (synchrone ou différé), False si absent"""
+        for table in (self._handlers, self._deferred_handlers):
+            handlers = table.get(event_type, ())
+            if handler in handlers:
+                remaining = tuple(h for h in handlers if h != handler)
+                if remaining:
+                    table[event_type] = remaining
+                else:
+                    del table[event_type]
+                return True
+        return False
+
+    def has_subscribers(self, event_type: Type) -> bool:
+        return event_type in self._handlers or event_type in self._deferred_handlers
+
+    def emit(self, event: Any):
+        """Publie un événement: handlers synchrones appelés, différés mis en file"""
+        event_type = type(event)
+        handlers = self._handlers.get(event_type)
+        deferred = self._deferred_handlers.get(event_type)
+        if handlers is None and deferred is None:
+            return
+        self.emitted += 1
+        if deferred is not None:
+            with self._queue_lock:
+                self._queue.extend((handler, event) for handler in deferred)
+        if handlers is not None:
+            for handler in handlers:
+                handler(event)
+
+    def flush(self) -> int:
+        """Livre la file différée (fin de tour), retourne le nombre de livraisons"""
+        delivered = 0
+        while self._queue:
+            with self._queue_lock:
+                queue, self._queue = self._queue, []
+            # Les événements émis par un handler sont livrés dans ce même flush
+            for handler, event in queue:
+                handler(event)
+            delivered += len(queue)
+        return delivered
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def clear(self):
+        """Retire abonnements et file (fin de session)"""
+        self._handlers.clear()
+        self._deferred_handlers.clear()
+        with self._queue_lock:
+            self._queue = []
+
+    def __repr__(self) -> str:
+        types = set(self._handlers) | set(self._deferred_handlers)
+        return f"EventBus({len(types)} types, {len(self._queue)} en attente)"
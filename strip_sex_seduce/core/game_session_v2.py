@@ -7,6 +7,16 @@ Version avec signature record_player_action() CORRECTE
 # Core ECS imports
 from core.system import SystemManager
 from core.entity import Entity
+from core.world import World
+from core.rng import SessionRNG
+from core.turn_log import TURN_LOG_VERSION, stats_delta, counts_delta
+from core.snapshot import capture_session, apply_snapshot, write_snapshot
+from core.save_journal import SaveJournal, load_with_journal
+from core.assets import AssetRegistry, thaw
+from core.asset_bundle import preload_assets
+from core.asset_watcher import get_shared_watcher
+from core.clock import SessionClock
+from core.events import StatChanged, LocationChanged
 
 # Entities avec NOMS CORRECTS du GitHub
 from entities.player import PlayerCharacter
@@ -70,9 +80,16 @@ try:
 except ImportError:
     MiniGameSystem = None
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, NamedTuple
 import time
 import json
+import os
+
+class TurnOutcome(NamedTuple):
+    """Résultat de GameSessionV2.play_turn"""
+    player_input: Optional[str]  # None: source d'input épuisée
+    played: bool  # False: input vide ou commande hors tour (aide, stats...)
+    end_condition: Optional[str]  # Fin de partie, "quit", ou None si la partie continue
 
 class GameSessionV2:
     """
@@ -80,7 +97,8 @@ class GameSessionV2:
     Version avec signature record_player_action() CORRECTE
     """
 
-    def __init__(self, config_path: str = "assets/config/settings.json"):
+    def __init__(self, config_path: str = "assets/config/settings.json",
+                 config: Optional[Dict[str, Any]] = None, seed: Optional[int] = None):
         # Logging et monitoring
         try:
             self.logger = GameLogger()
@@ -89,8 +107,12 @@ class GameSessionV2:
             self.logger = self._create_basic_logger()
             self.performance_monitor = self._create_basic_monitor()
 
-        # Configuration
-        self.config = self._load_config(config_path)
+        # Bundle d'assets précompilé (une fois par process, JSON si absent ou périmé)
+        preload_assets()
+
+        # Configuration (dict déjà chargé fourni par les batchs de simulation)
+        self.config_path = config_path
+        self.config = config if config is not None else self._load_config(config_path)
 
         # Entities principales avec fallbacks
         try:
@@ -128,19 +150,47 @@ class GameSessionV2:
         # Entities list
         self.entities = [self.player, self.npc, self.game_state] + list(self.environments.values())
 
+        # World: stockage par archétype pour les systems
+        self.world = World()
+        self.world.add_entities(e for e in self.entities if isinstance(e, Entity))
+
         # Systems manager
         try:
-            self.system_manager = SystemManager()
+            self.system_manager = SystemManager(
+                world=self.world,
+                max_workers=self.config.get("performance", {}).get("system_workers", 1)
+            )
             self._setup_systems()
         except Exception as e:
             print(f"⚠️ Erreur SystemManager: {e}")
             self.system_manager = self._create_basic_system_manager()
 
+        # RNG de session: un sous-flux indépendant par system/entity
+        self._setup_rng(seed)
+
+        # Rechargement à chaud des assets (watcher partagé par le process)
+        game_config = self.config.get("game", {})
+        self.asset_watcher = (get_shared_watcher(game_config.get("hot_reload_interval", 1.0))
+                              if game_config.get("hot_reload") else None)
+
+        # Horloge de session: tour + ticks pour les historiques
+        self.clock = SessionClock()
+
+        # Escalation réévaluée seulement après un changement de stats joueur ou de lieu
+        self._escalation_pending = True
+        self.world.events.subscribe(StatChanged, self._on_player_stat_changed)
+        self.world.events.subscribe(LocationChanged, self._on_location_changed)
+
         # Game loop state
         self.running = False
         self.paused = False
         self.last_update_time = 0.0
 
+        # Journal de tours (optionnel, voir attach_turn_log)
+        self.turn_log = None
+        self._turn_record = None
+        self._save_journal = None  # Autosave incrémental (auto_save_mode "delta")
+
         # Cache
         self.input_cache = {}
         self.response_cache = {}
@@ -152,6 +202,134 @@ class GameSessionV2:
         print("✅ GameSession V2.0 STANDALONE initialisée avec succès")
         print(f"📊 {len(self.entities)} entities, mode Reverse Seduction activé")
 
+    def _setup_rng(self, seed: Optional[int] = None):
+        """
+        Seed explicite > GameState.npc_personality_seed > seed tiré au hasard
+        Le seed retenu est conservé dans le GameState (rejouable)
+        """
+        if seed is None:
+            seed = getattr(self.game_state, "npc_personality_seed", 0) or None
+
+        self.rng = SessionRNG(seed)
+        self.game_state.npc_personality_seed = self.rng.seed
+
+        if isinstance(self.system_manager, SystemManager):
+            self.system_manager.set_rng(self.rng)
+        self.npc.rng = self.rng.stream("npc")
+        for location, environment in self.environments.items():
+            environment.rng = self.rng.stream(f"env_{location}")
+        self.session_rng = self.rng.stream("session")
+
+    def save(self, path: str) -> int:
+        """Snapshot binaire complet de la session, retourne la taille écrite"""
+        return write_snapshot(path, capture_session(self))
+
+    @classmethod
+    def load(cls, path: str, config_path: str = "assets/config/settings.json",
+             config: Optional[Dict[str, Any]] = None) -> 'GameSessionV2':
+        """Recrée une session jouable depuis un snapshot (+ journal de deltas s'il existe)"""
+        data, _ = load_with_journal(path)
+        session = cls(config_path, config=config, seed=data["seed"])
+        apply_snapshot(session, data)
+        return session
+
+    def get_auto_save_path(self) -> str:
+        save_dir = self.config['gameplay'].get('save_directory', 'saves')
+        return os.path.join(save_dir, f"{self.game_state.session_id}.snap")
+
+    def _auto_save(self):
+        """
+        Sauvegarde de fin de tour si gameplay.auto_save
+        Mode "delta": journal incrémental, snapshot complet tous les compact_every tours
+        """
+        gameplay = self.config['gameplay']
+        if not gameplay.get('auto_save'):
+            return
+        try:
+            if gameplay.get('auto_save_mode', 'snapshot') == 'delta':
+                if self._save_journal is None:
+                    self._save_journal = SaveJournal(self, self.get_auto_save_path(),
+                                                     gameplay.get('compact_every', 50))
+                self._save_journal.save_delta()
+            else:
+                self.save(self.get_auto_save_path())
+        except Exception as e:
+            print(f"⚠️ Erreur sauvegarde auto: {e}")
+
+    def _refresh_assets(self):
+        """Entre deux tours: relit les assets modifiés et recharge les systems concernés"""
+        if self.asset_watcher is None or not isinstance(self.system_manager, SystemManager):
+            return
+        self.asset_watcher.poll()
+        reloaded = self.system_manager.refresh_assets()
+        if reloaded:
+            print(f"♻️ Assets rechargés: {', '.join(reloaded)}")
+
+    def attach_turn_log(self, turn_log):
+        """Active l'enregistrement des tours (header de session écrit immédiatement)"""
+        self.turn_log = turn_log
+        turn_log.append({
+            "type": "session",
+            "version": TURN_LOG_VERSION,
+            "seed": self.rng.seed,
+            "config_path": self.config_path,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S")
+        })
+
+    def _begin_turn_record(self):
+        """Début de tour: horloge de session, photo des stats et compteurs RNG avant le tour NPC"""
+        self.clock.start_turn(self.game_state.turn_count)
+        if self.turn_log is None:
+            return
+        self._turn_record = (time.perf_counter_ns(), self._get_player_stats(), self.rng.draw_counts())
+
+    def _record_turn(self, player_input: str, npc_action: Optional[Dict[str, Any]],
+                     end_condition: Optional[str] = None):
+        """Écrit l'événement du tour: input, action NPC, tirages RNG, deltas stats"""
+        if self.turn_log is None or self._turn_record is None:
+            return
+        start_ns, stats_before, draws_before = self._turn_record
+        self._turn_record = None
+
+        event = {
+            "type": "turn",
+            "turn": self.game_state.turn_count,
+            "input": player_input,
+            "npc_action": npc_action.get("action") if npc_action else None,
+            "rng": counts_delta(draws_before, self.rng.draw_counts()),
+            "stats": stats_delta(stats_before, self._get_player_stats()),
+            "location": self.current_environment.location,
+            "ms": round((time.perf_counter_ns() - start_ns) / 1e6, 3)
+        }
+        if end_condition:
+            event["end"] = end_condition
+        self.turn_log.append(event)
+
+    def _get_player_stats(self) -> Dict[str, Any]:
+        try:
+            return dict(self.player.get_current_state_summary().get("stats", {}))
+        except Exception:
+            return {}
+
+    def _on_player_stat_changed(self, event: StatChanged):
+        if event.entity_id == getattr(self.player, "id", None):
+            self._escalation_pending = True
+
+    def _on_location_changed(self, event: LocationChanged):
+        self._escalation_pending = True
+
+    def _display_threshold_feedback(self):
+        """Messages des seuils franchis pendant le tour (ThresholdCrossed -> StatsSystem)"""
+        stats_system = self.system_manager.get_system("StatsSystem")
+        if stats_system is None:
+            return
+        for message in stats_system.pop_threshold_messages(self.player.id):
+            print(message)
+
+    def _end_turn_events(self):
+        """Fin de tour: livraison des événements différés du bus du World"""
+        self.world.events.flush()
+
     def _create_basic_logger(self):
         """Logger basique fallback"""
         class BasicLogger:
@@ -198,9 +376,8 @@ class GameSessionV2:
             def __init__(self):
                 self.display_name = "Marcus"
             def choose_next_action(self, resistance, context):
-                import random
                 actions = ["conversation_charme", "compliment", "regard_insistant", "rapprochement"]
-                return random.choice(actions)
+                return self.rng.choice(actions)
         return BasicNPC()
 
     def _create_basic_game_state(self):
@@ -257,22 +434,29 @@ class GameSessionV2:
             def __len__(self): return len(self.systems)
         return BasicSystemManager()
 
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
+    @staticmethod
+    def _load_config(config_path: str) -> Dict[str, Any]:
         """Charge configuration avec fallback"""
         default_config = {
             "game": {
                 "title": "Strip, Sex & Seduce V2.0 - Reverse Seduction",
                 "version": "2.0.0",
-                "debug_mode": False
+                "debug_mode": False,
+                "hot_reload": False,
+                "hot_reload_interval": 1.0
             },
             "performance": {
                 "max_memory_mb": 8,
                 "target_response_ms": 50,
-                "cache_enabled": True
+                "cache_enabled": True,
+                "system_workers": 1
             },
             "gameplay": {
                 "difficulty": "normal",
                 "auto_save": False,
+                "auto_save_mode": "snapshot",
+                "compact_every": 50,
+                "save_directory": "saves",
                 "auto_escalation": True,
                 "reverse_seduction_mode": True
             },
@@ -284,8 +468,8 @@ class GameSessionV2:
         }
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            # Copie mutable propre à la session
+            config = thaw(AssetRegistry.load_json(config_path))
             # Merge avec défauts
             for section in default_config:
                 if section not in config:
@@ -339,46 +523,21 @@ class GameSessionV2:
             while self.running:
                 loop_start = time.perf_counter()
 
-                # 1. État actuel
+                # État actuel puis tour complet (NPC, input, systems, fin de tour)
                 self._display_current_state()
-
-                # 2. Tour NPC
-                npc_action = self._process_npc_turn()
-                if npc_action:
-                    print(f"\n{npc_action['description']}")
-                    if npc_action.get('adaptation_message'):
-                        print(f"💭 {npc_action['adaptation_message']}")
-
-                # 3. Input joueur V2.0
-                player_input = self._get_v2_player_input()
-
-                # 4. Traitement input
-                if not self._process_player_input(player_input):
+                outcome = self.play_turn(self._get_v2_player_input)
+                if not outcome.played:
                     continue
-
-                # 5. Update systems
-                self._update_systems()
-
-                # 6. Escalation auto
-                if self.config['gameplay']['auto_escalation']:
-                    self._check_auto_escalation()
-
-                # 7. Conditions fin
-                end_condition = self._check_end_conditions()
-                if end_condition:
-                    self._handle_game_end(end_condition)
+                if outcome.end_condition:
                     break
 
-                # 8. Performance tracking
-                loop_end = time.perf_counter()
-                loop_time = (loop_end - loop_start) * 1000
+                # Performance tracking
+                loop_time = (time.perf_counter() - loop_start) * 1000
                 self.performance_monitor.record_loop_time(loop_time)
 
                 if loop_time > 100:
                     print(f"⚠️ Performance lente: {loop_time:.1f}ms")
 
-                self.game_state.advance_turn()
-
         except KeyboardInterrupt:
             print("\n\n⚠️ Reverse Seduction interrompue par l'utilisateur")
         except Exception as e:
@@ -388,6 +547,53 @@ class GameSessionV2:
         finally:
             self._cleanup_session()
 
+    def play_turn(self, next_input: Callable[[], Optional[str]]) -> TurnOutcome:
+        """
+        Tour complet, commun à la boucle console et aux sessions headless:
+        tour NPC, input joueur, systems, escalation, seuils, conditions de fin,
+        puis (partie en cours) événements différés, tour suivant, sauvegarde et assets
+
+        next_input est appelé après l'affichage de l'action NPC (None: plus d'input)
+        """
+        self._begin_turn_record()
+
+        # 1. Tour NPC
+        npc_action = self._process_npc_turn()
+        if npc_action:
+            print(f"\n{npc_action['description']}")
+            if npc_action.get('adaptation_message'):
+                print(f"💭 {npc_action['adaptation_message']}")
+
+        # 2. Input joueur
+        player_input = next_input()
+        if player_input is None:
+            return TurnOutcome(None, False, None)
+        if not self._process_player_input(player_input):
+            self._record_turn(player_input, npc_action)
+            return TurnOutcome(player_input, False, None)
+
+        # 3. Update systems + escalation auto
+        self._update_systems()
+        if self.config['gameplay']['auto_escalation']:
+            self._check_auto_escalation()
+        self._display_threshold_feedback()
+
+        # 4. Conditions fin
+        end_condition = self._check_end_conditions()
+        self._record_turn(player_input, npc_action, end_condition)
+        if end_condition:
+            self._handle_game_end(end_condition)
+            return TurnOutcome(player_input, True, end_condition)
+        if not self.running:
+            return TurnOutcome(player_input, True, "quit")
+
+        # 5. Fin de tour
+        self._end_turn_events()
+        self.game_state.advance_turn()
+        self._auto_save()
+        self._refresh_assets()
+        return TurnOutcome(player_input, True, None)
+
     def _display_reverse_seduction_intro(self):
         """Intro V2.0"""
         print("\n" + "="*70)
@@ -424,14 +630,17 @@ class GameSessionV2:
             "turn_count": self.game_state.turn_count
         }
 
+        adaptation_message = None
         try:
             chosen_action = self.npc.choose_next_action(
                 self.player.get_resistance_level(), context
             )
+            # NPCMale retourne (action, message d'adaptation)
+            if isinstance(chosen_action, tuple):
+                chosen_action, adaptation_message = chosen_action
         except:
-            import random
             actions = ["te regarde intensément", "se rapproche", "sourit charmeur"]
-            chosen_action = random.choice(actions)
+            chosen_action = self.session_rng.choice(actions)
 
         # Génération description
         descriptions = {
@@ -446,6 +655,7 @@ class GameSessionV2:
         return {
             'action': chosen_action,
             'description': description,
+            'adaptation_message': adaptation_message,
             'effects': {"success": True}
         }
 
@@ -488,8 +698,7 @@ class GameSessionV2:
             "😏 'Non, on ne devrait pas...' dis-tu avec un sourire coquin."
         ]
 
-        import random
-        print(f"\n{random.choice(resistance_lines)}")
+        print(f"\n{self.session_rng.choice(resistance_lines)}")
         print("💭 Tu sais que ta résistance ne fait qu'attiser son désir...")
 
         # CORRECTION: Récupération stats AVANT action
@@ -521,8 +730,7 @@ class GameSessionV2:
             "💋 Tu lui donnes le feu vert avec un sourire sexy..."
         ]
 
-        import random
-        print(f"\n{random.choice(allow_lines)}")
+        print(f"\n{self.session_rng.choice(allow_lines)}")
         print("🔥 Tu prends le contrôle de la séduction...")
 
         # CORRECTION: Récupération stats AVANT action
@@ -562,8 +770,7 @@ class GameSessionV2:
         difficulty = self.current_environment.escape_difficulty
         success_chance = max(0.1, base_chance - difficulty)
 
-        import random
-        success = random.random() < success_chance
+        success = self.session_rng.random() < success_chance
 
         if success:
             print("✅ Tu réussis à t'éloigner de lui !")
@@ -670,7 +877,10 @@ class GameSessionV2:
             pass
 
     def _check_auto_escalation(self):
-        """Escalation automatique"""
+        """Escalation automatique (rien à relire sans StatChanged/LocationChanged depuis le dernier passage)"""
+        if not self._escalation_pending:
+            return
+        self._escalation_pending = False
         try:
             player_summary = self.player.get_current_state_summary()
             current_loc = self.current_environment.location
@@ -758,5 +968,22 @@ class GameSessionV2:
         except Exception:
             print("\n👋 Session terminée. Merci d'avoir joué !")
 
+        self.close_session()
+
+    def close_session(self, close_turn_log: bool = True):
+        """
+        Fin de session, quel que soit le motif: journal de tours vidé (et fermé
+        s'il appartient à la session), journal de deltas libéré
+        close_turn_log=False: journal fourni par l'appelant, qui le ferme lui-même
+        """
+        if self.turn_log is not None:
+            if close_turn_log:
+                self.turn_log.close()
+            else:
+                self.turn_log.sync()
+        if self._save_journal is not None:
+            self._save_journal.close()
+            self._save_journal = None
+
     def __repr__(self) -> str:
         return f"GameSessionV2(V2.0-ReverseSeduction, turn={self.game_state.turn_count}, loc={self.current_environment.location})"
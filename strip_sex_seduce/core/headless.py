@@ -0,0 +1,222 @@
+"""
+Headless - Sessions GameSessionV2 sans console
+Sources d'input interchangeables (script, politique aléatoire, replay)
+et sorties nulles ou capturées, pour benchmarks de throughput
+"""
+
+from typing import Dict, List, Any, Optional, Iterable, Sequence
+from contextlib import redirect_stdout
+from core.game_session_v2 import GameSessionV2
+from utils.performance import LatencyHistogram
+import random
+import json
+import time
+
+# Sources d'input
+
+class InputSource:
+    """Fournit l'input joueur à chaque tour (None = fin de session)"""
+
+    def next_input(self, session: GameSessionV2) -> Optional[str]:
+        raise NotImplementedError
+
+class ScriptedInput(InputSource):
+    """Liste de commandes jouée dans l'ordre, éventuellement en boucle"""
+
+    def __init__(self, commands: Sequence[str], loop: bool = False):
+        self.commands = list(commands)
+        self.loop = loop
+        self._index = 0
+
+    def next_input(self, session: GameSessionV2) -> Optional[str]:
+        if self._index >= len(self.commands):
+            if not self.loop or not self.commands:
+                return None
+            self._index = 0
+        command = self.commands[self._index]
+        self._index += 1
+        return command
+
+class RandomPolicyInput(InputSource):
+    """Politique aléatoire pondérée sur les actions de jeu"""
+
+    DEFAULT_WEIGHTS = {"r": 0.3, "a": 0.6, "f": 0.1}
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, seed: Optional[int] = None):
+        weights = weights or self.DEFAULT_WEIGHTS
+        self.choices = list(weights.keys())
+        self.weights = list(weights.values())
+        self.rng = random.Random(seed)
+
+    def next_input(self, session: GameSessionV2) -> Optional[str]:
+        return self.rng.choices(self.choices, weights=self.weights)[0]
+
+class ReplayInput(ScriptedInput):
+    """
+    Rejoue un fichier: une commande par ligne, ou JSON lines avec clé "input"
+    Lignes vides et commentaires (#) ignorés
+    """
+
+    def __init__(self, path: str):
+        super().__init__(self._load(path))
+
+    @staticmethod
+    def _load(path: str) -> List[str]:
+        commands = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("{"):
+                    event = json.loads(line)
+                    if "input" in event:
+                        commands.append(event["input"])
+                else:
+                    commands.append(line)
+        return commands
+
+# Sorties
+
+class NullOutput:
+    """Sortie ignorée (file-like)"""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self):
+        pass
+
+class CaptureOutput(NullOutput):
+    """Sortie capturée en mémoire"""
+
+    def __init__(self):
+        self._chunks: List[str] = []
+
+    def write(self, text: str) -> int:
+        self._chunks.append(text)
+        return len(text)
+
+    def getvalue(self) -> str:
+        return "".join(self._chunks)
+
+    def lines(self) -> List[str]:
+        return self.getvalue().splitlines()
+
+# Runner
+
+class HeadlessRunner:
+    """
+    Joue une session complète sans input()/console
+    Chaque tour passe par GameSessionV2.play_turn: le runner fournit l'input
+    et collecte les métriques
+    """
+
+    def __init__(self, input_source: InputSource, output=None, max_turns: int = 100,
+                 config_path: str = "assets/config/settings.json", max_idle_inputs: int = 20,
+                 config: Optional[Dict[str, Any]] = None, seed: Optional[int] = None,
+                 turn_log=None):
+        self.input_source = input_source
+        self.output = output if output is not None else NullOutput()
+        self.max_turns = max_turns
+        self.config_path = config_path
+        self.config = config
+        self.seed = seed  # Seed RNG de session (None = aléatoire)
+        self.turn_log = turn_log  # Journal de tours (core.turn_log)
+        self.max_idle_inputs = max_idle_inputs  # Inputs non-tour consécutifs (aide, stats...)
+        self.session: Optional[GameSessionV2] = None
+
+    def create_session(self) -> GameSessionV2:
+        return GameSessionV2(self.config_path, config=self.config, seed=self.seed)
+
+    def run(self) -> Dict[str, Any]:
+        """Exécute la session et retourne le rapport de throughput"""
+        with redirect_stdout(self.output):
+            self.session = self.create_session()
+            if self.turn_log is not None:
+                self.session.attach_turn_log(self.turn_log)
+            try:
+                return self._run_session(self.session)
+            finally:
+                # Toutes les sorties (max_turns, input épuisé, inactivité, erreur):
+                # journaux vidés; le TurnLog fourni reste ouvert pour la session suivante
+                self.session.close_session(close_turn_log=False)
+
+    def _run_session(self, session: GameSessionV2) -> Dict[str, Any]:
+        latency = LatencyHistogram()
+        location_path = [session.current_environment.location]
+        end_condition = None
+        idle_inputs = 0
+
+        session.running = True
+        start = time.perf_counter()
+
+        while session.running:
+            turn_start = time.perf_counter_ns()
+            outcome = session.play_turn(lambda: self.input_source.next_input(session))
+
+            if outcome.player_input is None:
+                end_condition = "input_exhausted"
+                break
+            if not outcome.played:
+                idle_inputs += 1
+                if idle_inputs >= self.max_idle_inputs:
+                    end_condition = "idle_inputs"
+                    break
+                continue
+            idle_inputs = 0
+
+            latency.record_ns(time.perf_counter_ns() - turn_start)
+            location = session.current_environment.location
+            if location != location_path[-1]:
+                location_path.append(location)
+
+            end_condition = outcome.end_condition
+            if end_condition:
+                break
+            if session.game_state.turn_count >= self.max_turns:
+                end_condition = "max_turns"
+                break
+
+        duration = time.perf_counter() - start
+        session.running = False
+        return self._build_report(session, end_condition, latency, duration, location_path)
+
+    def _build_report(self, session: GameSessionV2, end_condition: Optional[str],
+                      latency: LatencyHistogram, duration: float,
+                      location_path: List[str]) -> Dict[str, Any]:
+        try:
+            final_stats = session.player.get_current_state_summary().get("stats", {})
+        except Exception:
+            final_stats = {}
+
+        turns = latency.count
+        return {
+            "end_condition": end_condition,
+            "turns": turns,
+            "duration_seconds": duration,
+            "turns_per_sec": turns / duration if duration > 0 else 0.0,
+            "latency_ms": {
+                "avg": latency.total_ns / turns / 1e6 if turns else 0.0,
+                "p50": latency.percentile_ns(50) / 1e6,
+                "p95": latency.percentile_ns(95) / 1e6,
+                "p99": latency.percentile_ns(99) / 1e6,
+                "max": latency.max_ns / 1e6
+            },
+            "seed": getattr(session.rng, "seed", None),
+            "final_stats": dict(final_stats),
+            "location_path": location_path
+        }
+
+def run_headless_sessions(input_factory, sessions: int = 1, output_factory=NullOutput,
+                          base_seed: Optional[int] = None, **runner_kwargs) -> List[Dict[str, Any]]:
+    """
+    Enchaîne plusieurs sessions headless (une source d'input neuve par session)
+    Avec base_seed, la session i est seedée base_seed + i
+    """
+    reports = []
+    for index in range(sessions):
+        seed = None if base_seed is None else base_seed + index
+        runner = HeadlessRunner(input_factory(index), output_factory(), seed=seed, **runner_kwargs)
+        reports.append(runner.run())
+    return reports
@@ -0,0 +1,147 @@
+"""
+Core - Historiques bornés
+Tampon circulaire de capacité fixe: append O(1) dans un tableau préalloué,
+sans recopie de liste pour tailler, itération du plus ancien au plus récent.
+Les entrées sont des NamedTuple typés (@history_record), lisibles aussi par
+clé comme les anciens dicts (entry["action"]); un champ `tick` (core.clock)
+donne un `timestamp` lisible calculé seulement à la lecture
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from itertools import chain, islice
+from core.clock import format_tick
+
+def _record_getitem(self, key):
+    if isinstance(key, str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    return tuple.__getitem__(self, key)
+
+def _record_get(self, key: str, default: Any = None) -> Any:
+    return getattr(self, key, default) if key in self._fields or key == "timestamp" else default
+
+def _record_to_dict(self) -> Dict[str, Any]:
+    data = self._asdict()
+    if "tick" in data:
+        data["timestamp"] = format_tick(data["tick"])
+    return data
+
+# Classes d'enregistrement déclarées (autorisées au chargement des snapshots)
+HISTORY_RECORDS: List[type] = []
+
+def history_record(cls):
+    """Décorateur NamedTuple: accès par clé, get() et to_dict() pour l'export"""
+    HISTORY_RECORDS.append(cls)
+    cls.__getitem__ = _record_getitem
+    cls.get = _record_get
+    cls.to_dict = _record_to_dict
+    if "tick" in cls._fields and "timestamp" not in cls._fields:
+        cls.timestamp = property(lambda self: format_tick(self.tick))
+    return cls
+
+class HistoryBuffer:
+    """
+    Historique circulaire: au-delà de `capacity`, l'entrée la plus ancienne est écrasée
+    total compte tous les ajouts (deltas de sauvegarde), generation change à chaque clear()
+    """
+
+    __slots__ = ("capacity", "_slots", "_head", "_size", "total", "generation")
+
+    def __init__(self, capacity: int, items: Iterable = ()):
+        if capacity <= 0:
+            raise ValueError(f"Capacité invalide: {capacity}")
+        self.capacity = capacity
+        self._slots: List[Any] = [None] * capacity
+        self._head = 0  # Prochain emplacement écrit
+        self._size = 0
+        self.total = 0
+        self.generation = 0
+        self.extend(items)
+
+    def append(self, item: Any):
+        head = self._head
+        self._slots[head] = item
+        head += 1
+        self._head = 0 if head == self.capacity else head
+        if self._size < self.capacity:
+            self._size += 1
+        self.total += 1
+
+    def extend(self, items: Iterable):
+        for item in items:
+            self.append(item)
+
+    def clear(self):
+        self._slots = [None] * self.capacity
+        self._head = 0
+        self._size = 0
+        self.generation += 1
+
+    def latest(self, count: int) -> List[Any]:
+        """Les `count` entrées les plus récentes, de la plus ancienne à la plus récente"""
+        count = min(max(count, 0), self._size)
+        slots, head = self._slots, self._head
+        start = head - count
+        if start >= 0:
+            return slots[start:head]
+        return slots[start:] + slots[:head]
+
+    def to_list(self) -> List[Any]:
+        return self.latest(self._size)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._size < self.capacity:
+            return islice(self._slots, self._size)
+        return chain(islice(self._slots, self._head, None), islice(self._slots, self._head))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("index hors de l'historique")
+        return self._slots[(self._head - self._size + index) % self.capacity]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, HistoryBuffer):
+            return self.capacity == other.capacity and self.to_list() == other.to_list()
+        return NotImplemented
+
+    # Snapshot: entrées dans l'ordre, sans les emplacements vides
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"capacity": self.capacity, "items": self.to_list(),
+                "total": self.total, "generation": self.generation}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state["capacity"], state["items"])
+        self.total = state["total"]
+        self.generation = state["generation"]
+
+    def copy(self) -> "HistoryBuffer":
+        clone = HistoryBuffer.__new__(HistoryBuffer)
+        clone.__setstate__(self.__getstate__())
+        return clone
+
+    def __repr__(self) -> str:
+        return f"HistoryBuffer({self._size}/{self.capacity}, total={self.total})"
+
+def history_field(capacity: int):
+    """default_factory pour un champ dataclass historique"""
+    return lambda: HistoryBuffer(capacity)
+
+def record_dicts(entries: Iterable[Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Entrées -> dicts pour l'export ou l'affichage (les `limit` plus récentes)"""
+    entries = list(entries)
+    if limit is not None:
+        entries = entries[-limit:] if limit else []
+    return [entry.to_dict() if hasattr(entry, "to_dict") else entry for entry in entries]
@@ -0,0 +1,91 @@
+"""
+Core - Replay déterministe d'un journal de tours
+Reconstruit l'état de n'importe quel tour sans input(), en rejouant les
+inputs enregistrés avec le seed de session, et vérifie chaque événement
+"""
+
+from typing import Dict, List, Any, Optional
+from core.headless import HeadlessRunner, ScriptedInput, NullOutput
+from core.turn_log import MemoryTurnLog, load_sessions
+
+# Champs comparés entre journal enregistré et replay ("ms" varie forcément)
+REPLAY_FIELDS = ("turn", "input", "npc_action", "rng", "stats", "location", "end")
+
+class ReplayEngine:
+    """Rejoue une session d'un journal (la dernière par défaut)"""
+
+    def __init__(self, path: str, session_index: int = -1, config: Optional[Dict[str, Any]] = None):
+        sessions = load_sessions(path)
+        if not sessions:
+            raise ValueError(f"Aucune session dans le journal: {path}")
+
+        session = sessions[session_index]
+        self.header: Dict[str, Any] = session["header"]
+        self.events: List[Dict[str, Any]] = session["events"]
+        self.config = config
+
+    @property
+    def seed(self) -> int:
+        return self.header["seed"]
+
+    @property
+    def last_turn(self) -> int:
+        return self.events[-1]["turn"] if self.events else 0
+
+    def replay(self, until_turn: Optional[int] = None, output=None) -> Dict[str, Any]:
+        """
+        Rejoue jusqu'au tour `until_turn` inclus (tout le journal par défaut)
+        Retourne la session reconstruite, la première divergence et les tours rejoués
+        """
+        events = self.events
+        if until_turn is not None:
+            events = [e for e in events if e["turn"] <= until_turn]
+
+        replayed_log = MemoryTurnLog()
+        runner = HeadlessRunner(
+            ScriptedInput([e["input"] for e in events]),
+            output if output is not None else NullOutput(),
+            max_turns=len(events) + 1,
+            max_idle_inputs=len(events) + 1,
+            config_path=self.header.get("config_path", "assets/config/settings.json"),
+            config=self.config,
+            seed=self.seed,
+            turn_log=replayed_log
+        )
+        report = runner.run()
+        replayed = [e for e in replayed_log.events if e.get("type") == "turn"]
+
+        return {
+            "session": runner.session,
+            "report": report,
+            "events": replayed,
+            "divergence": self.find_divergence(events, replayed)
+        }
+
+    @staticmethod
+    def find_divergence(recorded: List[Dict[str, Any]],
+                        replayed: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Premier écart entre événements enregistrés et rejoués (None = identiques)"""
+        for index, (expected, actual) in enumerate(zip(recorded, replayed)):
+            for field in REPLAY_FIELDS:
+                if expected.get(field) != actual.get(field):
+                    return {
+                        "index": index,
+                        "turn": expected.get("turn"),
+                        "field": field,
+                        "recorded": expected.get(field),
+                        "replayed": actual.get(field)
+                    }
+        if len(recorded) != len(replayed):
+            return {
+                "index": min(len(recorded), len(replayed)),
+                "turn": None,
+                "field": "length",
+                "recorded": len(recorded),
+                "replayed": len(replayed)
+            }
+        return None
+
+    def slowest_turns(self, count: int = 5) -> List[Dict[str, Any]]:
+        """Tours les plus lents du journal (cibles de reproduction)"""
+        return sorted(self.events, key=lambda e: e.get("ms", 0.0), reverse=True)[:count]
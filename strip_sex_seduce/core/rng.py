@@ -0,0 +1,92 @@
+"""
+Core - RNG de session
+Un flux random.Random indépendant par consommateur (system, NPC, lieu...),
+dérivé de façon stable du seed de session
+"""
+
+from typing import Dict, Optional
+import hashlib
+import random
+
+class CountingRandom(random.Random):
+    """
+    random.Random qui compte ses tirages (journal de tours, replay)
+    Mêmes séquences que random.Random pour un même seed
+    """
+
+    def __init__(self, seed=None):
+        self.draws = 0
+        self.words = 0  # Mots 32 bits consommés depuis le seed (position du flux)
+        super().__init__(seed)
+
+    def random(self) -> float:
+        self.draws += 1
+        self.words += 2
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.draws += 1
+        self.words += (k + 31) // 32
+        return super().getrandbits(k)
+
+    def fast_forward(self, words: int):
+        """Avance le flux de `words` mots 32 bits (sans compter de tirage)"""
+        remaining = words
+        while remaining > 0:
+            chunk = min(remaining, 1 << 16)
+            super().getrandbits(32 * chunk)
+            remaining -= chunk
+        self.words += words
+
+class SessionRNG:
+    """
+    Générateur de flux seedés pour une session
+    Même seed + même nom de flux = même séquence, quel que soit le process
+    ou le nombre de sessions partageant l'interpréteur
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(1, 2 ** 63)
+        self.seed = seed
+        self._streams: Dict[str, CountingRandom] = {}
+
+    def stream(self, name: str) -> CountingRandom:
+        """Flux dédié à un consommateur (créé à la première demande)"""
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = CountingRandom(self.derive_seed(name))
+            self._streams[name] = rng
+        return rng
+
+    def derive_seed(self, name: str) -> int:
+        """Seed du sous-flux: hash stable (indépendant de PYTHONHASHSEED)"""
+        digest = hashlib.blake2b(f"{self.seed}:{name}".encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def draw_counts(self) -> Dict[str, int]:
+        """Nombre de tirages cumulés par flux"""
+        return {name: rng.draws for name, rng in self._streams.items()}
+
+    def get_positions(self) -> Dict[str, int]:
+        """Position (mots consommés) de chaque flux ouvert, état compact"""
+        return {name: rng.words for name, rng in self._streams.items()}
+
+    def set_positions(self, positions: Dict[str, int]):
+        """Replace chaque flux à sa position: re-seed puis avance rapide"""
+        for name, words in positions.items():
+            rng = self.stream(name)
+            rng.seed(self.derive_seed(name))
+            rng.words = 0
+            rng.fast_forward(words)
+
+    def get_state(self) -> Dict[str, object]:
+        """États des flux ouverts (pour snapshots)"""
+        return {name: rng.getstate() for name, rng in self._streams.items()}
+
+    def set_state(self, states: Dict[str, object]):
+        for name, state in states.items():
+            self.stream(name).setstate(state)
+
+    def __repr__(self) -> str:
+        return f"SessionRNG(seed={self.seed}, streams={len(self._streams)})"
@@ -0,0 +1,293 @@
+"""
+Core - Sauvegarde incrémentale
+Snapshot de base + journal append-only de deltas: seuls les components et
+attributs d'entity signalés par le change log du World (Component.mark_dirty,
+ajout, retrait, Entity.mark_dirty) sont relus et comparés à chaque tour.
+Une écriture qui contourne ces API n'est sauvegardée qu'à la prochaine base
+"""
+
+from typing import Dict, List, Any, Optional, Set, Tuple
+from core.component import ComponentRegistry
+from core.snapshot import capture_session, write_snapshot, read_snapshot, restricted_loads
+from core.history import HistoryBuffer
+import hashlib
+import pickle
+import struct
+import zlib
+import os
+
+_RECORD = struct.Struct("<IIH")  # longueur, crc32, flags
+FLAG_COMPRESSED = 0x1
+COMPRESS_THRESHOLD = 512  # Octets: les petits deltas ne sont pas compressés
+
+JOURNAL_OWNER = "save_journal"
+
+def _digest(value: Any) -> bytes:
+    """Empreinte 16 octets du pickle d'une valeur (mémoire fixe par champ suivi)"""
+    return hashlib.blake2b(pickle.dumps(value, protocol=5), digest_size=16).digest()
+
+def journal_path_for(snapshot_path: str) -> str:
+    return os.path.splitext(snapshot_path)[0] + ".journal"
+
+class SaveJournal:
+    """
+    Autosave incrémental d'une session
+    save_delta() à chaque tour, compaction (nouveau snapshot de base) tous les `compact_every` deltas
+
+    Les deltas sont au niveau du champ: ("set", valeur) ou, pour une liste
+    qui n'a fait que grandir, ("extend", éléments ajoutés), pour un
+    HistoryBuffer qui n'a reçu que des append, ("append", entrées ajoutées)
+    """
+
+    def __init__(self, session, snapshot_path: str, compact_every: int = 50):
+        self.session = session
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path_for(snapshot_path)
+        self.compact_every = compact_every
+
+        self.deltas_since_base = 0
+        self.bytes_written = 0
+        self._has_base = False
+        self._cursor = 0
+        # (entity_id, portée, champ) -> (longueur ou position d'historique, empreinte du pickle sauvegardé)
+        self._fingerprints: Dict[Tuple[str, str, str], Tuple[Any, bytes]] = {}
+        self._saved_components: Set[Tuple[str, str]] = set()
+        self._rng_positions: Dict[str, int] = {}
+
+    def _entities(self) -> List:
+        session = self.session
+        return [session.player, session.npc, session.game_state] + list(session.environments.values())
+
+    # Écriture
+
+    def save_base(self) -> int:
+        """
+        Snapshot complet + journal remis à zéro (compaction)
+        Le journal porte l'identifiant de sa base: un crash entre les deux
+        écritures laisse un journal périmé, ignoré au chargement
+        """
+        world = self.session.world
+        journal_id = os.urandom(8).hex()
+        data = capture_session(self.session)
+        data["journal_id"] = journal_id
+        size = write_snapshot(self.snapshot_path, data)
+
+        with open(self.journal_path, 'wb') as f:
+            f.write(self._encode_record({"journal_id": journal_id}))
+
+        self._cursor = world.change_seq
+        world.retain_changes(JOURNAL_OWNER, self._cursor)
+
+        self._fingerprints = {}
+        self._saved_components = set()
+        for entity in self._entities():
+            state = entity.get_snapshot_state()
+            self._diff_fields(entity.id, "attrs", state["attrs"])
+            for key_name, (_, component_state) in state["components"].items():
+                self._diff_fields(entity.id, key_name, component_state)
+                self._saved_components.add((entity.id, key_name))
+
+        self._rng_positions = self.session.rng.get_positions()
+        self.deltas_since_base = 0
+        self._has_base = True
+        self.bytes_written += size
+        return size
+
+    def save_delta(self) -> int:
+        """Ajoute au journal ce qui a changé depuis la dernière sauvegarde"""
+        if not self._has_base or self.deltas_since_base >= self.compact_every:
+            return self.save_base()
+
+        delta = self.build_delta()
+        size = self._append(delta)
+        self.deltas_since_base += 1
+        return size
+
+    def build_delta(self) -> Dict[str, Any]:
+        session = self.session
+        world = session.world
+        seq = world.change_seq
+        changes = world.changes_since(self._cursor, ComponentRegistry.registered_keys())
+
+        # Components: seulement ceux du change log (mark_dirty, ajout, retrait)
+        components: Dict[str, Dict[str, Any]] = {}
+        for key in ComponentRegistry.registered_keys():
+            key_name = ComponentRegistry.key_name(key)
+            for entity_id in changes.entity_ids(key):
+                entity = world.get_entity(entity_id)
+                if entity is None:
+                    continue
+                component = entity._components.get(key)
+                slot = (entity_id, key_name)
+
+                if component is None:
+                    op = None
+                    self._saved_components.discard(slot)
+                elif slot not in self._saved_components:
+                    state = component.get_snapshot_state()
+                    self._diff_fields(entity_id, key_name, state)
+                    self._saved_components.add(slot)
+                    op = ("replace", type(component).__name__, state)
+                else:
+                    fields = self._diff_fields(entity_id, key_name, component.get_snapshot_state())
+                    if not fields:
+                        continue
+                    op = ("update", fields)
+                components.setdefault(entity_id, {})[key_name] = op
+
+        # Attributs des seules entities marquées (Entity.mark_dirty): comparaison champ par champ
+        attrs = {}
+        for entity_id in world.entity_changes_since(self._cursor):
+            entity = world.get_entity(entity_id)
+            if entity is None:
+                continue
+            fields = self._diff_fields(entity_id, "attrs", entity.get_snapshot_state()["attrs"])
+            if fields:
+                attrs[entity_id] = fields
+
+        positions = session.rng.get_positions()
+        rng = {name: words for name, words in positions.items() if self._rng_positions.get(name) != words}
+        self._rng_positions = positions
+
+        self._cursor = seq
+        world.retain_changes(JOURNAL_OWNER, seq)
+        return {
+            "seq": seq,
+            "location": session.current_environment.location,
+            "components": components,
+            "attrs": attrs,
+            "rng": rng
+        }
+
+    def _diff_fields(self, entity_id: str, scope: str, state: Dict[str, Any]) -> Dict[str, tuple]:
+        """Champs modifiés depuis la dernière sauvegarde (et mise à jour des empreintes)"""
+        ops = {}
+        for name, value in state.items():
+            fingerprint_key = (entity_id, scope, name)
+            digest = _digest(value)
+            previous = self._fingerprints.get(fingerprint_key)
+            if previous is not None and previous[1] == digest:
+                continue
+
+            op = ("set", value)
+            marker = None
+            if isinstance(value, list):
+                marker = len(value)
+                if previous is not None and isinstance(previous[0], int):
+                    saved_len = previous[0]
+                    if len(value) > saved_len and _digest(value[:saved_len]) == previous[1]:
+                        op = ("extend", value[saved_len:])
+            elif isinstance(value, HistoryBuffer):
+                # Entrées immuables, seul append fait avancer total: les nouvelles suffisent
+                marker = (value.capacity, value.generation, value.total)
+                if previous is not None and isinstance(previous[0], tuple) and previous[0][:2] == marker[:2]:
+                    added = value.total - previous[0][2]
+                    if 0 < added <= value.capacity:
+                        op = ("append", value.latest(added))
+
+            self._fingerprints[fingerprint_key] = (marker, digest)
+            ops[name] = op
+        return ops
+
+    def _append(self, delta: Dict[str, Any]) -> int:
+        record = self._encode_record(delta)
+        with open(self.journal_path, 'ab') as f:
+            f.write(record)
+        self.bytes_written += len(record)
+        return len(record)
+
+    @staticmethod
+    def _encode_record(value: Dict[str, Any]) -> bytes:
+        payload = pickle.dumps(value, protocol=5)
+        flags = 0
+        if len(payload) > COMPRESS_THRESHOLD:
+            payload = zlib.compress(payload, 1)
+            flags |= FLAG_COMPRESSED
+        return _RECORD.pack(len(payload), zlib.crc32(payload), flags) + payload
+
+    def close(self):
+        self.session.world.release_changes(JOURNAL_OWNER)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "deltas_since_base": self.deltas_since_base,
+            "bytes_written": self.bytes_written
+        }
+
+# Lecture
+
+def read_journal(path: str) -> List[Dict[str, Any]]:
+    """
+    Enregistrements du journal: header {"journal_id"} puis deltas
+    S'arrête au premier enregistrement tronqué ou corrompu
+    """
+    deltas = []
+    if not os.path.exists(path):
+        return deltas
+
+    with open(path, 'rb') as f:
+        blob = f.read()
+
+    offset = 0
+    while offset + _RECORD.size <= len(blob):
+        length, checksum, flags = _RECORD.unpack_from(blob, offset)
+        start = offset + _RECORD.size
+        payload = blob[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            break
+        if flags & FLAG_COMPRESSED:
+            payload = zlib.decompress(payload)
+        deltas.append(restricted_loads(payload))
+        offset = start + length
+    return deltas
+
+def _apply_fields(state: Dict[str, Any], fields: Dict[str, tuple]):
+    for name, op in fields.items():
+        if op[0] == "extend":
+            state[name] = list(state.get(name, [])) + op[1]
+        elif op[0] == "append":
+            history = state[name].copy()
+            history.extend(op[1])
+            state[name] = history
+        else:
+            state[name] = op[1]
+
+def fold_deltas(data: Dict[str, Any], deltas: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Applique les deltas à un état de snapshot (base + deltas = état courant)"""
+    states = {data[role]["id"]: data[role] for role in ("player", "npc", "game_state")}
+    for environment in data["environments"].values():
+        states[environment["id"]] = environment
+
+    positions = data.setdefault("rng_positions", {})
+    for delta in deltas:
+        for entity_id, components in delta["components"].items():
+            state = states.get(entity_id)
+            if state is None:
+                continue
+            for key_name, op in components.items():
+                if op is None:
+                    state["components"].pop(key_name, None)
+                elif op[0] == "replace":
+                    state["components"][key_name] = (op[1], op[2])
+                elif key_name in state["components"]:
+                    _apply_fields(state["components"][key_name][1], op[1])
+
+        for entity_id, fields in delta["attrs"].items():
+            if entity_id in states:
+                _apply_fields(states[entity_id]["attrs"], fields)
+
+        positions.update(delta["rng"])
+        data["location"] = delta["location"]
+    return data
+
+def load_with_journal(snapshot_path: str) -> Tuple[Dict[str, Any], int]:
+    """État base + deltas, et nombre de deltas rejoués"""
+    data = read_snapshot(snapshot_path)
+    records = read_journal(journal_path_for(snapshot_path))
+
+    # Journal d'une autre base (compaction interrompue) ou absent: base seule
+    if not records or records[0].get("journal_id") != data.get("journal_id"):
+        return data, 0
+
+    deltas = records[1:]
+    return fold_deltas(data, deltas), len(deltas)
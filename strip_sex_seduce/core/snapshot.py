@@ -0,0 +1,165 @@
+"""
+Core - Snapshots binaires versionnés d'une session
+Joueuse, NPC, GameState, lieux, tous les components et l'état RNG
+
+Format: header fixe (magic, version, flags, crc32) + pickle protocole 5 compressé zlib
+Le chargement n'accepte qu'une liste explicite de classes: components
+enregistrés, entities, enregistrements d'historique et quelques types stdlib
+"""
+
+from typing import Dict, Any, FrozenSet, Tuple
+from core.component import ComponentRegistry, ComponentType
+from core.entity import Entity
+from core.history import HistoryBuffer, HISTORY_RECORDS
+from array import array
+import pickle
+import struct
+import zlib
+import io
+import os
+
+SNAPSHOT_MAGIC = b"SSSN"
+SNAPSHOT_VERSION = 1
+FLAG_COMPRESSED = 0x1
+
+_HEADER = struct.Struct("<4sHHI")
+
+# Types stdlib pouvant apparaître dans un état capturé
+_ALLOWED_GLOBALS = {
+    ("datetime", "datetime"),
+    ("datetime", "date"),
+    ("datetime", "timedelta"),
+    ("collections", "deque"),
+}
+
+class SnapshotError(Exception):
+    """Snapshot illisible, corrompu ou de version inconnue"""
+
+def _entity_classes():
+    pending = [Entity]
+    while pending:
+        entity_class = pending.pop()
+        yield entity_class
+        pending.extend(entity_class.__subclasses__())
+
+def allowed_globals() -> FrozenSet[Tuple[str, str]]:
+    """(module, nom) des classes recréables au chargement (registres lus à l'appel)"""
+    classes = [HistoryBuffer, ComponentType, *HISTORY_RECORDS, *_entity_classes()]
+    classes.extend(ComponentRegistry.registered_keys().values())
+    return frozenset(_ALLOWED_GLOBALS) | frozenset((c.__module__, c.__qualname__) for c in classes)
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    Unpickler restreint à une liste explicite de classes
+    Noms pointés refusés: pas d'accès aux attributs d'un module autorisé
+    """
+
+    def __init__(self, file):
+        super().__init__(file)
+        self._allowed = allowed_globals()
+
+    def find_class(self, module: str, name: str):
+        if "." not in name and (module, name) in self._allowed:
+            found = super().find_class(module, name)
+            if isinstance(found, type):
+                return found
+        raise SnapshotError(f"Classe interdite dans un snapshot: {module}.{name}")
+
+# Capture / restauration
+
+def capture_session(session) -> Dict[str, Any]:
+    """État complet d'une GameSessionV2 en structures sérialisables"""
+    return {
+        "version": SNAPSHOT_VERSION,
+        "seed": session.rng.seed,
+        "rng": {name: _pack_rng_state(rng) for name, rng in session.rng._streams.items() if rng.draws},
+        "location": session.current_environment.location,
+        "player": session.player.get_snapshot_state(),
+        "npc": session.npc.get_snapshot_state(),
+        "game_state": session.game_state.get_snapshot_state(),
+        "environments": {
+            location: environment.get_snapshot_state()
+            for location, environment in session.environments.items()
+        }
+    }
+
+def apply_snapshot(session, data: Dict[str, Any]):
+    """Restaure un état capturé dans une session fraîchement créée (même seed)"""
+    session.player.restore_snapshot_state(data["player"])
+    session.npc.restore_snapshot_state(data["npc"])
+    session.game_state.restore_snapshot_state(data["game_state"])
+    for location, state in data["environments"].items():
+        if location in session.environments:
+            session.environments[location].restore_snapshot_state(state)
+
+    session.current_environment = session.environments.get(data["location"], session.current_environment)
+
+    for name, packed in data["rng"].items():
+        _unpack_rng_state(session.rng.stream(name), packed)
+    # Positions de flux écrites par le journal incrémental (prioritaires)
+    session.rng.set_positions(data.get("rng_positions", {}))
+
+# État Mersenne Twister compacté (624 mots 32 bits en bytes)
+
+def _pack_rng_state(rng) -> Tuple[bytes, int, Any, int, int]:
+    version, internal, gauss_next = rng.getstate()
+    return array("I", internal[:-1]).tobytes(), internal[-1], gauss_next, rng.draws, rng.words
+
+def _unpack_rng_state(rng, packed: Tuple[bytes, int, Any, int, int]):
+    state_words, position, gauss_next, draws, words = packed
+    internal = array("I")
+    internal.frombytes(state_words)
+    rng.setstate((3, tuple(internal) + (position,), gauss_next))
+    rng.draws = draws
+    rng.words = words
+
+# Encodage binaire
+
+def encode_snapshot(data: Dict[str, Any], compress: bool = True) -> bytes:
+    payload = pickle.dumps(data, protocol=5)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 6)
+        flags |= FLAG_COMPRESSED
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, zlib.crc32(payload)) + payload
+
+def decode_snapshot(blob: bytes) -> Dict[str, Any]:
+    if len(blob) < _HEADER.size:
+        raise SnapshotError("Snapshot tronqué")
+
+    magic, version, flags, checksum = _HEADER.unpack_from(blob)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Fichier qui n'est pas un snapshot")
+    if version > SNAPSHOT_VERSION:
+        raise SnapshotError(f"Version de snapshot non supportée: {version}")
+
+    payload = blob[_HEADER.size:]
+    if zlib.crc32(payload) != checksum:
+        raise SnapshotError("Snapshot corrompu (checksum)")
+    if flags & FLAG_COMPRESSED:
+        payload = zlib.decompress(payload)
+
+    return restricted_loads(payload)
+
+def restricted_loads(payload: bytes) -> Any:
+    """Désérialise un pickle en n'autorisant que les classes de allowed_globals()"""
+    return _SnapshotUnpickler(io.BytesIO(payload)).load()
+
+# Fichiers
+
+def write_snapshot(path: str, data: Dict[str, Any], compress: bool = True) -> int:
+    """Écriture atomique (fichier temporaire + rename), retourne la taille"""
+    blob = encode_snapshot(data, compress)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return len(blob)
+
+def read_snapshot(path: str) -> Dict[str, Any]:
+    with open(path, 'rb') as f:
+        return decode_snapshot(f.read())
@@ -0,0 +1,134 @@
+"""
+Core - Stockage vectorisé des stats (optionnel, NumPy)
+Struct-of-arrays pour simulations en lot et scènes à nombreux personnages:
+volonte, excitation et seuils de N StatsComponent dans des tableaux indexés
+par ligne. Effets d'actions, modificateurs de lieu, bornes, seuils et decay
+en une opération par tableau; flush() réécrit les components, qui restent
+l'API par objet. Sans NumPy, StatsSystem.apply_npc_action_batch boucle sur
+apply_npc_action (mêmes résultats)
+"""
+
+from typing import Dict, Any, List, Optional, Sequence
+from components.stats import StatsComponent, StatChange, THRESHOLD_NAMES
+from core.clock import current_clock, tick_ns
+from core.events import StatChanged
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+STAT_MIN, STAT_MAX = 0, 100
+
+# Colonnes de `thresholds`: THRESHOLD_NAMES, mêmes règles que StatsComponent._update_thresholds
+
+class StatStore:
+    """
+    Stats de N components en colonnes (ligne i = components[i])
+    Les components ne sont mis à jour qu'au flush()
+    """
+
+    def __init__(self, components: Sequence[StatsComponent]):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("StatStore nécessite NumPy (pip install numpy)")
+
+        self.components: List[StatsComponent] = list(components)
+        self.volonte = np.array([c.volonte for c in self.components], dtype=np.int16)
+        self.excitation = np.array([c.excitation for c in self.components], dtype=np.int16)
+        self.thresholds = np.zeros((len(self.components), len(THRESHOLD_NAMES)), dtype=bool)
+        self._update_thresholds()
+
+        # Dernière application par ligne (historique écrit au flush)
+        self._pending: List[tuple] = []
+        self._touched = np.zeros(len(self.components), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def _update_thresholds(self):
+        self.thresholds[:, 0] = self.volonte < 40
+        self.thresholds[:, 1] = self.excitation > 60
+        self.thresholds[:, 2] = self.volonte < 20
+        self.thresholds[:, 3] = self.excitation > 85
+
+    def apply_deltas(self, volonte_delta, excitation_delta, sources: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Ajoute un delta par ligne (tableaux ou scalaires), bornes 0-100
+        Retourne les changements réels par stat
+        """
+        volonte_delta = np.broadcast_to(np.asarray(volonte_delta, dtype=np.int32), self.volonte.shape)
+        excitation_delta = np.broadcast_to(np.asarray(excitation_delta, dtype=np.int32), self.excitation.shape)
+
+        old_volonte, old_excitation = self.volonte.copy(), self.excitation.copy()
+        self.volonte = np.clip(old_volonte + volonte_delta, STAT_MIN, STAT_MAX).astype(np.int16)
+        self.excitation = np.clip(old_excitation + excitation_delta, STAT_MIN, STAT_MAX).astype(np.int16)
+        self._update_thresholds()
+        self._touched[:] = True
+
+        if sources is not None:
+            self._pending.append((old_volonte, old_excitation, volonte_delta, excitation_delta,
+                                  self.volonte.copy(), self.excitation.copy(), list(sources)))
+
+        return {
+            "volonte": self.volonte - old_volonte,
+            "excitation": self.excitation - old_excitation
+        }
+
+    def apply_actions(self, effect_table, action_rows, location_rows,
+                      sources: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Effets d'actions déjà modulés par lieu, une action par ligne
+        effect_table: (n_actions, n_lieux, 2) [volonte, excitation], cf. StatsSystem.effect_table
+        """
+        deltas = np.asarray(effect_table, dtype=np.int32)[action_rows, location_rows]
+        return self.apply_deltas(deltas[:, 0], deltas[:, 1], sources)
+
+    @staticmethod
+    def decay_modifiers(values, decay_rate: float = 0.95, epsilon: float = 0.1):
+        """Decay vectorisé d'une colonne de modificateurs (valeurs sous epsilon -> 0)"""
+        values = np.asarray(values, dtype=np.float64) * decay_rate
+        values[np.abs(values) < epsilon] = 0.0
+        return values
+
+    def flush(self, record_history: bool = True):
+        """
+        Réécrit valeurs, seuils et historique dans les components (marqués dirty)
+        record_history=False: pas d'entrées StatChange (foules, simulations longues)
+        """
+        tick, turn = tick_ns(), current_clock().turn
+        volonte, excitation, thresholds = self.volonte.tolist(), self.excitation.tolist(), self.thresholds.tolist()
+        # Conversion en listes une fois: l'accès élément par élément aux tableaux est lent
+        pending = [tuple(array.tolist() if hasattr(array, "tolist") else array for array in entry)
+                   for entry in self._pending] if record_history else []
+
+        for row in np.flatnonzero(self._touched).tolist():
+            component = self.components[row]
+            history = component.history
+            for old_v, old_e, delta_v, delta_e, new_v, new_e, sources in pending:
+                source = sources[row]
+                history.append(StatChange(turn, tick, "volonte", old_v[row], new_v[row],
+                                          delta_v[row], new_v[row] - old_v[row], source))
+                history.append(StatChange(turn, tick, "excitation", old_e[row], new_e[row],
+                                          delta_e[row], new_e[row] - old_e[row], source))
+
+            world = component._world
+            if world is not None:
+                previous = component._threshold_values()
+                old_values = (component.volonte, component.excitation)
+            component.volonte = volonte[row]
+            component.excitation = excitation[row]
+            component.thresholds.update(zip(THRESHOLD_NAMES, thresholds[row]))
+            if world is not None:
+                # Mêmes événements qu'apply_modifier (bus du World), un par stat modifiée
+                for stat, old_value, new_value in zip(("volonte", "excitation"), old_values,
+                                                      (volonte[row], excitation[row])):
+                    if new_value != old_value:
+                        world.events.emit(StatChanged(component.entity_id, stat, old_value, new_value, "stat_store"))
+                component._emit_threshold_changes(previous)
+            component.last_modified = tick
+            component.mark_dirty()
+
+        self._pending = []
+        self._touched[:] = False
@@ -4,26 +4,60 @@ Systems contiennent la logique et opèrent sur entities/components
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Type, Iterator, Iterable, Union
 from core.entity import Entity
-from core.component import Component, ComponentType
+from core.component import Component, ComponentType, ComponentRegistry
+from core.world import World, Archetype, ChangeSet
+from core.events import EventBus
+from core.rng import SessionRNG
+from core.assets import AssetRegistry
+from utils.performance import LatencyHistogram
+from concurrent.futures import ThreadPoolExecutor
+import random
 import time
 
+# Clé d'accès déclarée: type/classe de component ou ressource nommée ("random"...)
+AccessKey = Union[ComponentType, Type[Component], str]
+
 class System(ABC):
     """
     Base class pour tous les systems ECS
     Un system contient la logique métier et opère sur les entities
     """
 
+    # Components requis: avec un World, le SystemManager ne transmet
+    # que les entities (et colonnes) des archétypes correspondants
+    required_components: Tuple[Union[ComponentType, Type[Component]], ...] = ()
+
+    # Components surveillés: avec un World, le system reçoit le kwarg
+    # `changes` (ChangeSet depuis son dernier passage) et peut se limiter
+    # aux entities modifiées
+    watched_components: Tuple[Union[ComponentType, Type[Component]], ...] = ()
+
+    # Accès déclarés pour le scheduler parallèle (lectures implicites:
+    # required + watched). writes = None: accès inconnus, exécution isolée
+    reads: Tuple[AccessKey, ...] = ()
+    writes: Optional[Tuple[AccessKey, ...]] = None
+
+    # Clés AssetRegistry dont dépendent les tables du system: quand l'une
+    # change (rechargement à chaud), reload_assets() est appelé entre deux tours
+    asset_keys: Tuple[str, ...] = ()
+
     def __init__(self, name: str = None):
         self.name = name or self.__class__.__name__
         self.enabled = True
+        self._world: Optional[World] = None
+        self._events: Optional[EventBus] = None  # Bus du World, None hors World
+        self._change_cursor = 0  # Séquence World vue au dernier passage
+        self.rng = random.Random()  # Remplacé par le flux de session via bind_rng
         self._performance_stats = {
             "total_calls": 0,
             "total_time": 0.0,
             "avg_time": 0.0,
             "last_update_time": 0.0
         }
+        self._latency = LatencyHistogram()  # Percentiles, mémoire fixe
+        self._asset_versions: Tuple[int, ...] = ()
 
     @abstractmethod
     def update(self, entities: List[Entity], delta_time: float = 0.0, **kwargs) -> None:
@@ -38,6 +72,7 @@ class System(ABC):
         """
         Filtre les entities qui possèdent tous les components requis
         Optimisation pour éviter de traiter des entities non pertinentes
+        (requête en cache du World: query())
         """
         filtered = []
         for entity in entities:
@@ -45,6 +80,84 @@ class System(ABC):
                 filtered.append(entity)
         return filtered
 
+    def bind_world(self, world: Optional[World]):
+        """Rattache le system au World dont il interroge les requêtes en cache"""
+        self._world = world
+        self._events = world.events if world is not None else None
+        if self._events is not None:
+            self.subscribe_events(self._events)
+
+    def subscribe_events(self, events: EventBus):
+        """
+        Abonnements au bus du World (surchargé par les systems réactifs)
+        Les handlers synchrones s'exécutent dans le system émetteur: les garder légers
+        """
+        pass
+
+    def bind_rng(self, session_rng: SessionRNG):
+        """Branche le system sur son sous-flux RNG de session"""
+        self.rng = session_rng.stream(self.name)
+
+    def reload_assets(self):
+        """
+        Reconstruit les tables depuis l'AssetRegistry (surchargé par les systems à assets)
+        Construire dans des variables locales puis affecter: le swap reste atomique
+        """
+        pass
+
+    def track_assets(self):
+        """Mémorise les versions des assets actuellement chargés"""
+        self._asset_versions = tuple(AssetRegistry.version(key) for key in self.asset_keys)
+
+    def assets_changed(self) -> bool:
+        return bool(self.asset_keys) and \
+            tuple(AssetRegistry.version(key) for key in self.asset_keys) != self._asset_versions
+
+    def query(self) -> List[Entity]:
+        """Entities correspondant à required_components (requête en cache, copie de la liste)"""
+        if self._world is None:
+            raise RuntimeError(f"{self.name} n'est rattaché à aucun World")
+        return list(self._world.entity_query(*self.required_components).entities)
+
+    def get_access(self) -> Optional[Tuple[frozenset, frozenset]]:
+        """(lectures, écritures) résolues, None si non déclarées"""
+        if self.writes is None:
+            return None
+        reads = self.reads + tuple(self.required_components) + tuple(self.watched_components)
+        return (frozenset(_resolve_access(k) for k in reads),
+                frozenset(_resolve_access(k) for k in self.writes))
+
+    def iter_components(self, entities: List[Entity], component_class: Type[Component],
+                        archetypes: Optional[List[Archetype]] = None) -> Iterator[Tuple[Entity, Component]]:
+        """
+        Itère les couples (entity, component)
+        Parcourt directement les colonnes si des archétypes sont fournis
+        """
+        if archetypes is not None:
+            key = ComponentRegistry.key_for(component_class)
+            for archetype in archetypes:
+                yield from zip(archetype.entities, archetype.columns[key])
+            return
+
+        for entity in entities:
+            component = entity.get_component_of_type(component_class)
+            if component:
+                yield entity, component
+
+    def iter_changed(self, changes: ChangeSet, component_class: Type[Component],
+                     extra_ids: Iterable[str] = ()) -> Iterator[Tuple[Entity, Component]]:
+        """
+        Itère les couples (entity, component) des seules entities modifiées
+        extra_ids: entities à traiter malgré tout (timers en cours...)
+        """
+        entity_ids = changes.entity_ids(component_class)
+        entity_ids.update(extra_ids)
+        for entity_id in entity_ids:
+            entity = self._world.get_entity(entity_id) if self._world else None
+            component = entity.get_component_of_type(component_class) if entity else None
+            if component:
+                yield entity, component
+
     def update_with_performance_tracking(self, entities: List[Entity], 
                                        delta_time: float = 0.0, **kwargs) -> None:
         """
@@ -53,7 +166,7 @@ class System(ABC):
         if not self.enabled:
             return
 
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
 
         try:
             self.update(entities, delta_time, **kwargs)
@@ -61,10 +174,11 @@ class System(ABC):
             print(f"❌ Erreur dans {self.name}: {e}")
             raise
 
-        end_time = time.perf_counter()
-        update_time = end_time - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        update_time = elapsed_ns / 1e9
 
         # Mise à jour statistiques performance
+        self._latency.record_ns(elapsed_ns)
         self._performance_stats["total_calls"] += 1
         self._performance_stats["total_time"] += update_time
         self._performance_stats["avg_time"] = (
@@ -73,8 +187,10 @@ class System(ABC):
         self._performance_stats["last_update_time"] = update_time
 
     def get_performance_stats(self) -> Dict[str, float]:
-        """Retourne les statistiques de performance"""
-        return self._performance_stats.copy()
+        """Retourne les statistiques de performance (percentiles inclus)"""
+        stats = self._performance_stats.copy()
+        stats.update(self._latency.get_stats())
+        return stats
 
     def reset_performance_stats(self):
         """Remet à zéro les statistiques"""
@@ -84,19 +200,45 @@ class System(ABC):
             "avg_time": 0.0,
             "last_update_time": 0.0
         }
+        self._latency.reset()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(enabled={self.enabled})"
 
+def _resolve_access(key: AccessKey):
+    """Ramène une clé d'accès à la clé de stockage du component si possible"""
+    if isinstance(key, (ComponentType, type)):
+        return ComponentRegistry.resolve_key(key) or key
+    return key
+
+def _conflicts(a: Optional[Tuple[frozenset, frozenset]],
+               b: Optional[Tuple[frozenset, frozenset]]) -> bool:
+    """Deux systems sont en conflit si l'un écrit ce que l'autre lit ou écrit"""
+    if a is None or b is None:
+        return True
+    reads_a, writes_a = a
+    reads_b, writes_b = b
+    return bool(writes_a & (reads_b | writes_b) or writes_b & reads_a)
+
 class SystemManager:
     """
     Gestionnaire centralisant tous les systems
     Responsable de l'ordre d'exécution et coordination
     """
 
-    def __init__(self):
+    def __init__(self, world: Optional[World] = None, max_workers: int = 1,
+                 deterministic: bool = False):
         self._systems: List[System] = []
         self._system_order: Dict[str, int] = {}
+        self.world = world
+
+        # Scheduler: étapes de systems sans conflit, exécutées en parallèle
+        # si max_workers > 1 (deterministic force l'ordre série, pour replays)
+        self.max_workers = max_workers
+        self.deterministic = deterministic
+        self.rng: Optional[SessionRNG] = None
+        self._schedule: Optional[List[List[System]]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def add_system(self, system: System, priority: int = 0):
         """
@@ -105,9 +247,15 @@ class SystemManager:
         """
         self._systems.append(system)
         self._system_order[system.name] = priority
+        if self.world is not None:
+            system.bind_world(self.world)
+        if self.rng is not None:
+            system.bind_rng(self.rng)
+        system.track_assets()
 
         # Tri par priorité
         self._systems.sort(key=lambda s: self._system_order.get(s.name, 0))
+        self._schedule = None
 
     def remove_system(self, system_name: str) -> bool:
         """Supprime un system par son nom"""
@@ -115,13 +263,145 @@ class SystemManager:
             if system.name == system_name:
                 del self._systems[i]
                 del self._system_order[system_name]
+                self._schedule = None
                 return True
         return False
 
     def update_all(self, entities: List[Entity], delta_time: float = 0.0, **kwargs):
-        """Met à jour tous les systems dans l'ordre de priorité"""
+        """
+        Met à jour tous les systems dans l'ordre de priorité
+        Avec un World, chaque system déclarant required_components ne reçoit
+        que les entities correspondantes et leurs colonnes (kwarg archetypes),
+        et chaque system déclarant watched_components reçoit son change set
+        """
+        if not self.is_parallel():
+            for system in self._systems:
+                self._run_system(system, entities, delta_time, kwargs)
+        else:
+            for stage in self.get_schedule():
+                if len(stage) == 1:
+                    self._run_system(stage[0], entities, delta_time, kwargs)
+                else:
+                    self._run_stage(stage, entities, delta_time, kwargs)
+
+        if self.world is not None:
+            self._prune_changes()
+
+    def _prepare(self, system: System, entities: List[Entity]) -> Tuple[List[Entity], Dict[str, Any]]:
+        """Entities et kwargs World propres au system"""
+        extra = {}
+        if self.world is None:
+            return entities, extra
+
+        if system.required_components:
+            entities = system.query()
+            extra["archetypes"] = self.world.query(*system.required_components)
+        if system.watched_components:
+            extra["changes"] = self.world.changes_since(
+                system._change_cursor, system.watched_components
+            )
+        return entities, extra
+
+    def _consume_changes(self, system: System):
+        # Les changements faits par le system lui-même sont consommés
+        if self.world is not None and system.watched_components and system.enabled:
+            system._change_cursor = self.world.change_seq
+
+    def _run_system(self, system: System, entities: List[Entity], delta_time: float,
+                    kwargs: Dict[str, Any]):
+        system_entities, extra = self._prepare(system, entities)
+        system.update_with_performance_tracking(system_entities, delta_time, **extra, **kwargs)
+        self._consume_changes(system)
+
+    def _run_stage(self, stage: List[System], entities: List[Entity], delta_time: float,
+                   kwargs: Dict[str, Any]):
+        """Exécute une étape de systems sans conflit sur le thread pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="ecs-system")
+
+        futures = []
+        for system in stage:
+            system_entities, extra = self._prepare(system, entities)
+            futures.append(self._executor.submit(
+                system.update_with_performance_tracking,
+                system_entities, delta_time, **extra, **kwargs
+            ))
+
+        # Attente de toute l'étape avant de propager la première erreur
+        errors = [future.exception() for future in futures]
+        for system in stage:
+            self._consume_changes(system)
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def refresh_assets(self) -> List[str]:
+        """
+        Recharge les systems dont un asset a changé, à appeler entre deux tours
+        (jamais pendant update_all: un tour ne voit jamais de mise à jour partielle)
+        """
+        reloaded = []
+        for system in self._systems:
+            if system.assets_changed():
+                system.reload_assets()
+                system.track_assets()
+                reloaded.append(system.name)
+        return reloaded
+
+    def set_rng(self, session_rng: SessionRNG):
+        """Attribue à chaque system son sous-flux RNG de session"""
+        self.rng = session_rng
         for system in self._systems:
-            system.update_with_performance_tracking(entities, delta_time, **kwargs)
+            system.bind_rng(session_rng)
+
+    def is_parallel(self) -> bool:
+        return self.max_workers > 1 and not self.deterministic
+
+    def set_parallel(self, max_workers: int):
+        """Change le nombre de workers (1 = exécution série)"""
+        self.shutdown()
+        self.max_workers = max_workers
+
+    def set_deterministic(self, deterministic: bool = True):
+        """Mode déterministe: ordre série strict, pour les replays"""
+        self.deterministic = deterministic
+
+    def get_schedule(self) -> List[List[System]]:
+        """
+        Étapes du DAG de dépendances: un system dépend de chaque system
+        plus prioritaire avec lequel il est en conflit d'accès
+        """
+        if self._schedule is None:
+            accesses = [system.get_access() for system in self._systems]
+            levels: List[int] = []
+            for i, access in enumerate(accesses):
+                level = 0
+                for j in range(i):
+                    if levels[j] >= level and _conflicts(accesses[j], access):
+                        level = levels[j] + 1
+                levels.append(level)
+
+            stages: List[List[System]] = [[] for _ in range(max(levels, default=-1) + 1)]
+            for system, level in zip(self._systems, levels):
+                stages[level].append(system)
+            self._schedule = stages
+        return self._schedule
+
+    def get_schedule_report(self) -> List[List[str]]:
+        """Noms des systems par étape (longueur = chemin critique)"""
+        return [[system.name for system in stage] for stage in self.get_schedule()]
+
+    def shutdown(self):
+        """Libère le thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _prune_changes(self):
+        """Purge le journal des changements déjà vus par tous les abonnés"""
+        cursors = [s._change_cursor for s in self._systems if s.watched_components and s.enabled]
+        self.world.prune_changes(min(cursors) if cursors else self.world.change_seq)
 
     def get_system(self, system_name: str) -> Optional[System]:
         """Récupère un system par son nom"""
@@ -141,5 +421,11 @@ class SystemManager:
             report[system.name] = system.get_performance_stats()
         return report
 
+    def get_query_report(self) -> Dict[str, Dict[str, int]]:
+        """Compteurs des requêtes en cache du World (hits/rebuilds/updates)"""
+        if self.world is None:
+            return {}
+        return self.world.get_query_stats()
+
     def __len__(self) -> int:
         return len(self._systems)
@@ -0,0 +1,68 @@
+"""
+Core - Templates de texte précompilés
+Répliques avec emplacements ({npc}, {player}, {location}, {clothing}) analysées
+une seule fois au chargement; le rendu est un unique str.format_map, et une
+réplique sans emplacement est retournée telle quelle
+"""
+
+from typing import Dict, Any, Iterable, Tuple
+from string import Formatter
+
+TEMPLATE_SLOTS = ("npc", "player", "location", "clothing")
+
+DEFAULT_CONTEXT = {
+    "npc": "Marcus",
+    "player": "toi",
+    "location": "ici",
+    "clothing": "tes vêtements"
+}
+
+class TemplateError(ValueError):
+    """Template mal formé ou emplacement inconnu (détecté à la compilation)"""
+
+class TextTemplate(str):
+    """
+    Réplique compilée: reste une str (comparaisons, tirage aléatoire),
+    plus render(context) sans analyse au moment du rendu
+    """
+
+    def __new__(cls, text: str):
+        template = super().__new__(cls, text)
+        try:
+            fields = tuple(name for _, name, _, _ in Formatter().parse(text) if name is not None)
+        except ValueError as e:
+            raise TemplateError(f"Template mal formé: {text!r} ({e})")
+
+        unknown = [name for name in fields if name not in TEMPLATE_SLOTS]
+        if unknown:
+            raise TemplateError(f"Emplacements inconnus {unknown} dans {text!r}")
+
+        template.fields = fields
+        template.plain = str(text)  # str simple: rien de ce module dans les sauvegardes
+        return template
+
+    def render(self, context: Dict[str, Any]) -> str:
+        if not self.fields:
+            return self.plain
+        return self.plain.format_map(context)
+
+def compile_template(text: str) -> TextTemplate:
+    return text if isinstance(text, TextTemplate) else TextTemplate(text)
+
+def compile_pool(lines: Iterable[str]) -> Tuple[TextTemplate, ...]:
+    return tuple(compile_template(line) for line in lines)
+
+def make_context(npc=None, player=None, environment=None, **overrides) -> Dict[str, str]:
+    """
+    Contexte de rendu d'un tour, valeurs par défaut pour les emplacements non fournis
+    Les valeurs qui dépendent des components (clothing) sont calculées par l'appelant
+    """
+    context = dict(DEFAULT_CONTEXT)
+    if npc is not None:
+        context["npc"] = getattr(npc, "display_name", context["npc"])
+    if environment is not None:
+        context["location"] = getattr(environment, "display_name", None) or getattr(environment, "location", context["location"])
+    if player is not None:
+        context["player"] = getattr(player, "name", None) or context["player"]
+    context.update((key, value) for key, value in overrides.items() if value is not None)
+    return context
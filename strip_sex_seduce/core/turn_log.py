@@ -0,0 +1,111 @@
+"""
+Core - Journal de tours append-only
+Un header de session puis un événement JSON par input joueur:
+input, action NPC, tirages RNG par flux, deltas de stats
+"""
+
+from typing import Dict, List, Any, Optional
+import json
+import time
+
+TURN_LOG_VERSION = 1
+
+class TurnLog:
+    """
+    Journal JSON lines en écriture streaming (mode append)
+    Une ligne écrite et flushée par événement: un crash ne perd que le tour en cours
+    """
+
+    def __init__(self, path: str, flush: bool = True):
+        self.path = path
+        self.flush = flush
+        self._file = open(path, 'a', encoding='utf-8')
+        self.events_written = 0
+        self.record_ns = 0  # Coût cumulé de l'enregistrement
+
+    def append(self, event: Dict[str, Any]):
+        """Ajoute un événement en fin de journal"""
+        start = time.perf_counter_ns()
+        self._write(event)
+        self.events_written += 1
+        self.record_ns += time.perf_counter_ns() - start
+
+    def _write(self, event: Dict[str, Any]):
+        self._file.write(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n")
+        if self.flush:
+            self._file.flush()
+
+    def sync(self):
+        """Force l'écriture sur disque (journal gardé ouvert, flush=False)"""
+        if self._file:
+            self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "events": self.events_written,
+            "avg_record_us": self.record_ns / self.events_written / 1000 if self.events_written else 0.0
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class MemoryTurnLog(TurnLog):
+    """Journal en mémoire (vérification de replay, tests)"""
+
+    def __init__(self):
+        self.path = None
+        self.flush = False
+        self._file = None
+        self.events_written = 0
+        self.record_ns = 0
+        self.events: List[Dict[str, Any]] = []
+
+    def _write(self, event: Dict[str, Any]):
+        self.events.append(event)
+
+    def close(self):
+        pass
+
+def load_sessions(path: str) -> List[Dict[str, Any]]:
+    """
+    Relit un journal: une entrée {"header", "events"} par session
+    (un même fichier peut contenir plusieurs sessions à la suite)
+    """
+    sessions: List[Dict[str, Any]] = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                break  # Dernière ligne tronquée (crash pendant l'écriture)
+
+            if event.get("type") == "session":
+                sessions.append({"header": event, "events": []})
+            elif sessions:
+                sessions[-1]["events"].append(event)
+    return sessions
+
+def stats_delta(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """Deltas numériques non nuls entre deux états de stats"""
+    delta = {}
+    for stat, value in after.items():
+        old = before.get(stat, 0)
+        if isinstance(value, (int, float)) and isinstance(old, (int, float)) and value != old:
+            delta[stat] = value - old
+    return delta
+
+def counts_delta(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, int]:
+    """Tirages RNG effectués depuis `before`, par flux"""
+    return {name: count - before.get(name, 0)
+            for name, count in after.items() if count != before.get(name, 0)}
@@ -0,0 +1,406 @@
+"""
+Core ECS - World
+Regroupe les entities par archétype (ensemble de types de components)
+et stocke chaque type de component dans une colonne contiguë par archétype
+"""
+
+from typing import Dict, List, Optional, Tuple, FrozenSet, Iterable, Union, Type, Set
+from core.component import Component, ComponentType, ComponentKey, ComponentRegistry
+from core.entity import Entity
+from core.events import EventBus
+import threading
+
+Signature = FrozenSet[ComponentKey]
+
+# Clé du change log pour les attributs d'entity (Entity.mark_dirty)
+ENTITY_ATTRS = "entity_attrs"
+
+class Archetype:
+    """
+    Groupe d'entities partageant exactement le même ensemble de components
+    La ligne i de chaque colonne correspond à entities[i]
+    """
+
+    __slots__ = ("signature", "entities", "columns")
+
+    def __init__(self, signature: Signature):
+        self.signature = signature
+        self.entities: List[Entity] = []
+        self.columns: Dict[ComponentKey, List[Component]] = {key: [] for key in signature}
+
+    def append(self, entity: Entity) -> int:
+        """Ajoute une entity en fin de colonnes, retourne sa ligne"""
+        self.entities.append(entity)
+        for key, column in self.columns.items():
+            column.append(entity._components[key])
+        return len(self.entities) - 1
+
+    def swap_remove(self, row: int) -> Optional[Entity]:
+        """
+        Retire la ligne `row` en la remplaçant par la dernière (O(1))
+        Retourne l'entity déplacée, None si c'était la dernière ligne
+        """
+        last = len(self.entities) - 1
+        moved = None
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            for column in self.columns.values():
+                column[row] = column[last]
+
+        self.entities.pop()
+        for column in self.columns.values():
+            column.pop()
+        return moved
+
+    def column(self, component_type: Union[ComponentType, Type[Component]]) -> List[Component]:
+        """Colonne d'un type de component (ComponentType ou classe)"""
+        return self.columns[ComponentRegistry.resolve_key(component_type)]
+
+    def matches(self, required: Signature) -> bool:
+        return required <= self.signature
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __repr__(self) -> str:
+        keys = sorted(ComponentRegistry.key_name(key) for key in self.signature)
+        return f"Archetype({keys}, entities={len(self.entities)})"
+
+class EntityQuery:
+    """
+    Résultat de requête mis en cache et maintenu incrémentalement
+    Le World l'actualise à chaque add/remove_component, sans rescan par frame
+    """
+
+    __slots__ = ("required", "_entities", "_rows", "hits", "rebuilds", "updates")
+
+    def __init__(self, required: Signature):
+        self.required = required
+        self._entities: List[Entity] = []
+        self._rows: Dict[str, int] = {}
+
+        # Compteurs pour valider le cache sous charge
+        self.hits = 0
+        self.rebuilds = 0
+        self.updates = 0
+
+    @property
+    def entities(self) -> List[Entity]:
+        """Entities correspondantes (liste partagée, ne pas modifier)"""
+        self.hits += 1
+        return self._entities
+
+    def rebuild(self, entities: Iterable[Entity]):
+        """Recalcul complet, uniquement à la création de la requête"""
+        self._entities = [e for e in entities if self.required <= e._components.keys()]
+        self._rows = {e.id: row for row, e in enumerate(self._entities)}
+        self.rebuilds += 1
+
+    def _sync(self, entity: Entity, signature: Signature):
+        """Ajoute ou retire une entity selon sa nouvelle signature"""
+        if self.required <= signature:
+            if entity.id not in self._rows:
+                self._rows[entity.id] = len(self._entities)
+                self._entities.append(entity)
+                self.updates += 1
+        else:
+            self._discard(entity)
+
+    def _discard(self, entity: Entity):
+        row = self._rows.pop(entity.id, None)
+        if row is None:
+            return
+        last = self._entities.pop()
+        if last is not entity:
+            self._entities[row] = last
+            self._rows[last.id] = row
+        self.updates += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "rebuilds": self.rebuilds,
+            "updates": self.updates,
+            "size": len(self._entities)
+        }
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __repr__(self) -> str:
+        keys = sorted(ComponentRegistry.key_name(key) for key in self.required)
+        return f"EntityQuery({keys}, entities={len(self._entities)})"
+
+class ChangeSet:
+    """
+    Components modifiés (mark_dirty, ajout, retrait) depuis le dernier
+    passage d'un system, indexés par type de component
+    """
+
+    __slots__ = ("_world", "_by_key")
+
+    def __init__(self, world: 'World', by_key: Dict[ComponentKey, Set[str]]):
+        self._world = world
+        self._by_key = by_key
+
+    def entity_ids(self, *component_types: Union[ComponentType, Type[Component]]) -> Set[str]:
+        """IDs des entities modifiées (tous types surveillés si aucun précisé)"""
+        if not component_types:
+            return set().union(*self._by_key.values())
+        ids = set()
+        for component_type in component_types:
+            ids |= self._by_key.get(ComponentRegistry.resolve_key(component_type), set())
+        return ids
+
+    def entities(self, *component_types: Union[ComponentType, Type[Component]]) -> List[Entity]:
+        """Entities modifiées encore présentes dans le World"""
+        found = (self._world.get_entity(entity_id) for entity_id in self.entity_ids(*component_types))
+        return [entity for entity in found if entity is not None]
+
+    def has_changes(self, *component_types: Union[ComponentType, Type[Component]]) -> bool:
+        if not component_types:
+            return any(self._by_key.values())
+        return any(self._by_key.get(ComponentRegistry.resolve_key(t)) for t in component_types)
+
+    def __contains__(self, entity: Entity) -> bool:
+        return any(entity.id in ids for ids in self._by_key.values())
+
+    def __bool__(self) -> bool:
+        return self.has_changes()
+
+    def __repr__(self) -> str:
+        counts = {ComponentRegistry.key_name(k): len(v) for k, v in self._by_key.items() if v}
+        return f"ChangeSet({counts})"
+
+class World:
+    """
+    Store central des entities d'une session
+    Les entities rattachées notifient le World à chaque add/remove_component
+    """
+
+    def __init__(self):
+        self._archetypes: Dict[Signature, Archetype] = {}
+        self._locations: Dict[str, Tuple[Archetype, int]] = {}
+
+        # Archétypes correspondant à une requête, invalidé à chaque nouvel archétype
+        self._query_cache: Dict[Signature, List[Archetype]] = {}
+
+        # Requêtes d'entities maintenues incrémentalement
+        self._entity_queries: Dict[Signature, EntityQuery] = {}
+
+        # Journal des changements: clé -> {entity_id: numéro de séquence}
+        self._change_seq = 0
+        self._changes: Dict[ComponentKey, Dict[str, int]] = {}
+        self._changes_lock = threading.Lock()  # Systems parallèles
+
+        # Abonnés hors SystemManager (sauvegarde incrémentale): séquence à conserver
+        self._retained: Dict[str, int] = {}
+
+        # Bus d'événements des entities/components rattachés (core.events)
+        self.events = EventBus()
+
+    # Gestion entities
+
+    def add_entity(self, entity: Entity) -> Entity:
+        """Rattache une entity au World"""
+        if entity.id in self._locations:
+            return entity
+
+        if entity._world is not None and entity._world is not self:
+            entity._world.remove_entity(entity)
+
+        entity._world = self
+        for key, component in entity._components.items():
+            component._world = self
+            self._record(entity.id, key)
+
+        archetype = self._get_or_create_archetype(frozenset(entity._components))
+        row = archetype.append(entity)
+        self._locations[entity.id] = (archetype, row)
+        self._sync_queries(entity, archetype.signature)
+        return entity
+
+    def add_entities(self, entities: Iterable[Entity]):
+        for entity in entities:
+            self.add_entity(entity)
+
+    def remove_entity(self, entity: Entity) -> bool:
+        """Détache une entity du World"""
+        location = self._locations.pop(entity.id, None)
+        if location is None:
+            return False
+
+        archetype, row = location
+        self._remove_row(archetype, row)
+        for query in self._entity_queries.values():
+            query._discard(entity)
+        for component in entity._components.values():
+            component._world = None
+        entity._world = None
+        return True
+
+    def get_entity(self, entity_id: str) -> Optional[Entity]:
+        location = self._locations.get(entity_id)
+        if location is None:
+            return None
+        archetype, row = location
+        return archetype.entities[row]
+
+    def entities(self) -> List[Entity]:
+        """Toutes les entities, groupées par archétype"""
+        return [entity for archetype in self._archetypes.values() for entity in archetype.entities]
+
+    # Requêtes
+
+    def query(self, *component_types: Union[ComponentType, Type[Component]]) -> List[Archetype]:
+        """Archétypes non vides possédant tous les components demandés"""
+        required = frozenset(ComponentRegistry.resolve_key(t) for t in component_types)
+
+        matching = self._query_cache.get(required)
+        if matching is None:
+            matching = [a for a in self._archetypes.values() if a.matches(required)]
+            self._query_cache[required] = matching
+
+        return [archetype for archetype in matching if archetype.entities]
+
+    def query_entities(self, *component_types: Union[ComponentType, Type[Component]]) -> List[Entity]:
+        """Entities possédant tous les components demandés"""
+        return [entity for archetype in self.query(*component_types) for entity in archetype.entities]
+
+    def entity_query(self, *component_types: Union[ComponentType, Type[Component]]) -> EntityQuery:
+        """
+        Requête mise en cache: calculée une fois, puis maintenue
+        à chaque add/remove_component des entities du World
+        """
+        required = frozenset(ComponentRegistry.resolve_key(t) for t in component_types)
+
+        query = self._entity_queries.get(required)
+        if query is None:
+            query = EntityQuery(required)
+            query.rebuild(self.query_entities(*component_types))
+            self._entity_queries[required] = query
+        return query
+
+    def get_query_stats(self) -> Dict[str, Dict[str, int]]:
+        """Compteurs hits/rebuilds/updates de chaque requête"""
+        return {
+            "+".join(sorted(ComponentRegistry.key_name(key) for key in required)): query.get_stats()
+            for required, query in self._entity_queries.items()
+        }
+
+    # Change sets
+
+    @property
+    def change_seq(self) -> int:
+        """Numéro de séquence du dernier changement enregistré"""
+        return self._change_seq
+
+    def record_change(self, component: Component):
+        """Appelé par Component.mark_dirty pour les components rattachés"""
+        key = ComponentRegistry.key_for(type(component))
+        if key is not None and component._entity_id in self._locations:
+            self._record(component._entity_id, key)
+
+    def record_entity_change(self, entity: Entity):
+        """Appelé par Entity.mark_dirty: attributs d'instance modifiés"""
+        if entity.id in self._locations:
+            self._record(entity.id, ENTITY_ATTRS)
+
+    def entity_changes_since(self, seq: int) -> Set[str]:
+        """IDs des entities dont les attributs ont changé après `seq`"""
+        log = self._changes.get(ENTITY_ATTRS)
+        return {eid for eid, s in log.items() if s > seq} if log else set()
+
+    def changes_since(self, seq: int, component_types: Iterable[Union[ComponentType, Type[Component]]]) -> ChangeSet:
+        """Change set des types demandés, postérieur à `seq`"""
+        by_key = {}
+        for component_type in component_types:
+            key = ComponentRegistry.resolve_key(component_type)
+            log = self._changes.get(key)
+            by_key[key] = {eid for eid, s in log.items() if s > seq} if log else set()
+        return ChangeSet(self, by_key)
+
+    def retain_changes(self, owner: str, seq: int):
+        """Empêche la purge des changements postérieurs à `seq` pour `owner`"""
+        self._retained[owner] = seq
+
+    def release_changes(self, owner: str):
+        self._retained.pop(owner, None)
+
+    def prune_changes(self, seq: int):
+        """Oublie les changements déjà vus par tous les systems (séquence <= seq)"""
+        if self._retained:
+            seq = min(seq, min(self._retained.values()))
+        for key in list(self._changes):
+            log = self._changes[key]
+            stale = [eid for eid, s in log.items() if s <= seq]
+            for eid in stale:
+                del log[eid]
+            if not log:
+                del self._changes[key]
+
+    def get_archetypes(self) -> List[Archetype]:
+        return list(self._archetypes.values())
+
+    # Notifications Entity
+
+    def _on_component_added(self, entity: Entity, key: ComponentKey, component: Component):
+        component._world = self
+        self._record(entity.id, key)
+
+        archetype, row = self._locations[entity.id]
+        if key in archetype.signature:
+            # Remplacement d'un component existant: même archétype
+            archetype.columns[key][row] = component
+            return
+        self._move(entity, archetype, row, archetype.signature | {key})
+
+    def _on_component_removed(self, entity: Entity, key: ComponentKey, component: Component):
+        component._world = None
+        self._record(entity.id, key)
+
+        archetype, row = self._locations[entity.id]
+        self._move(entity, archetype, row, archetype.signature - {key})
+
+    # Interne
+
+    def _move(self, entity: Entity, archetype: Archetype, row: int, signature: Signature):
+        self._remove_row(archetype, row)
+        target = self._get_or_create_archetype(signature)
+        self._locations[entity.id] = (target, target.append(entity))
+        self._sync_queries(entity, signature)
+
+    def _record(self, entity_id: str, key: ComponentKey):
+        with self._changes_lock:
+            self._change_seq += 1
+            log = self._changes.get(key)
+            if log is None:
+                log = self._changes[key] = {}
+            log[entity_id] = self._change_seq
+
+    def _sync_queries(self, entity: Entity, signature: Signature):
+        for query in self._entity_queries.values():
+            query._sync(entity, signature)
+
+    def _remove_row(self, archetype: Archetype, row: int):
+        moved = archetype.swap_remove(row)
+        if moved is not None:
+            self._locations[moved.id] = (archetype, row)
+
+    def _get_or_create_archetype(self, signature: Signature) -> Archetype:
+        archetype = self._archetypes.get(signature)
+        if archetype is None:
+            archetype = Archetype(signature)
+            self._archetypes[signature] = archetype
+            self._query_cache.clear()
+        return archetype
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity.id in self._locations
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __repr__(self) -> str:
+        return f"World(entities={len(self._locations)}, archetypes={len(self._archetypes)})"
@@ -5,11 +5,17 @@ Version adaptée au ActionComponent existant (sans description parameter)
 
 from core.entity import Entity
 from components.action import ActionComponent
+from core.assets import AssetRegistry
 from typing import Dict, List, Any, Optional
+import random
 
 class Environment(Entity):
     """Environment COMPATIBLE avec ActionComponent existant"""
 
+    # Tables statiques partagées (AssetRegistry): recréées par le constructeur, jamais sauvegardées
+    _snapshot_exclude = ("rng", "social_constraints", "location_modifiers",
+                         "contextual_actions", "atmosphere_descriptions")
+
     def __init__(self, location: str, display_name: str = None, 
                  privacy_level: float = None, escape_difficulty: float = None):
         super().__init__(f"env_{location}")
@@ -24,13 +30,19 @@ class Environment(Entity):
         self.social_visibility = self._get_social_visibility(location)
         self.intimacy_multiplier = self._get_intimacy_multiplier(location)
 
+        # Tables du lieu figées, construites une fois par process
+        assets = AssetRegistry.get(f"environment:{location}", lambda: self._build_location_assets(location))
+
         # Contraintes et règles
-        self.social_constraints = self._get_social_constraints(location)
-        self.location_modifiers = self._get_location_modifiers(location)
+        self.social_constraints = assets["social_constraints"]
+        self.location_modifiers = assets["location_modifiers"]
 
         # Actions contextuelles spécialisées
-        self.contextual_actions = self._get_contextual_actions(location)
-        self.atmosphere_descriptions = self._get_atmosphere_descriptions(location)
+        self.contextual_actions = assets["contextual_actions"]
+        self.atmosphere_descriptions = assets["atmosphere_descriptions"]
+
+        # Flux aléatoire (remplacé par le sous-flux de session)
+        self.rng = random.Random()
 
         # Setup components COMPATIBLE
         self._setup_components()
@@ -79,6 +91,15 @@ class Environment(Entity):
         }
         return multipliers.get(location, 1.0)
 
+    def _build_location_assets(self, location: str) -> Dict[str, Any]:
+        """Tables statiques d'un lieu (partagées par toutes les sessions)"""
+        return {
+            "social_constraints": self._get_social_constraints(location),
+            "location_modifiers": self._get_location_modifiers(location),
+            "contextual_actions": self._get_contextual_actions(location),
+            "atmosphere_descriptions": self._get_atmosphere_descriptions(location)
+        }
+
     def _get_social_constraints(self, location: str) -> Dict[str, Any]:
         """Contraintes sociales du lieu"""
         constraints = {
@@ -275,8 +296,7 @@ class Environment(Entity):
     # MÉTHODES UTILITY INCHANGÉES
     def get_random_atmosphere_description(self) -> str:
         """Retourne description aléatoire pour variété"""
-        import random
-        return random.choice(self.atmosphere_descriptions)
+        return self.rng.choice(self.atmosphere_descriptions)
 
     def get_available_contextual_actions(self, escalation_level: int = 1) -> List[Dict[str, Any]]:
         """Retourne actions contextuelles selon niveau escalation"""
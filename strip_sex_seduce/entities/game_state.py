@@ -4,6 +4,7 @@ Gestion progression, achievements et métadonnées session
 """
 
 from core.entity import Entity
+from core.events import LocationChanged
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import uuid
@@ -85,6 +86,7 @@ class GameState(Entity):
 
         # Check achievements liés aux tours
         self._check_turn_based_achievements()
+        self.mark_dirty()
 
     def change_location(self, new_location: str) -> bool:
         """
@@ -97,9 +99,11 @@ class GameState(Entity):
             True si changement réussi
         """
         if new_location != self.current_location:
+            old_location = self.current_location
+
             # Historique
             self.location_history.append({
-                "from": self.current_location,
+                "from": old_location,
                 "to": new_location,
                 "turn": self.turn_count
             })
@@ -115,6 +119,11 @@ class GameState(Entity):
             visited = set(self.achievements["location_reached"].keys())
             if visited >= all_locations:
                 self.unlock_achievement("all_locations")
+            self.mark_dirty()
+
+            # Notification des abonnés (bus du World de la session)
+            if self._world is not None:
+                self._world.events.emit(LocationChanged(old_location, new_location, self.turn_count))
 
             return True
         return False
@@ -131,6 +140,7 @@ class GameState(Entity):
                     "turn": self.turn_count,
                     "context": context
                 })
+            self.mark_dirty()
 
     def has_story_flag(self, flag: str) -> bool:
         """Vérifie la présence d'un flag narratif"""
@@ -141,6 +151,7 @@ class GameState(Entity):
         if new_phase != self.game_phase:
             self.add_story_flag(f"phase_{new_phase}_entered", {"major": True})
             self.game_phase = new_phase
+            self.mark_dirty()
 
     def record_player_action(self, action_type: str, success: bool, 
                            stats_before: Dict, stats_after: Dict):
@@ -170,6 +181,7 @@ class GameState(Entity):
 
         self.stats["min_volonte"] = min(self.stats["min_volonte"], volonte_after)
         self.stats["max_excitation"] = max(self.stats["max_excitation"], excitation_after)
+        self.mark_dirty()
 
     def record_npc_action(self, action: str, success: bool, 
                          escalation_level: int = 1):
@@ -188,10 +200,12 @@ class GameState(Entity):
 
         if escalation_level >= 3:
             self.stats["escalation_attempts"] += 1
+        self.mark_dirty()
 
     def record_clothing_change(self, exposure_level: int):
         """Enregistre changement vêtements"""
         self.stats["peak_exposure"] = max(self.stats["peak_exposure"], exposure_level)
+        self.mark_dirty()
 
     def unlock_achievement(self, achievement_name: str) -> bool:
         """
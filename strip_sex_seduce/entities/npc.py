@@ -6,9 +6,46 @@ Personnalité évolutive et adaptation comportementale
 from core.entity import Entity
 from components.personality import PersonalityComponent
 from components.action import ActionComponent
-from typing import Dict, List, Any, Tuple, Optional
+from core.text_templates import compile_template, make_context
+from core.action_index import register_action_catalog
+from core.history import HistoryBuffer, history_record, record_dicts
+from core.clock import tick_ns
+from typing import Dict, List, Any, Tuple, Optional, NamedTuple
 import random
-import time
+
+# Actions par niveau escalation (aussi catalogue de l'index d'actions)
+NPC_ACTION_LEVELS = {
+    1: ("compliment", "conversation_charme", "regard_insistant"),
+    2: ("contact_epaule", "rapprochement_physique"),
+    3: ("main_cuisse", "caresses_douces"),
+    4: ("baiser_leger", "caresses"),
+    5: ("baiser_profond", "caresses_intimes")
+}
+register_action_catalog("npc_levels", (action for level in sorted(NPC_ACTION_LEVELS)
+                                       for action in NPC_ACTION_LEVELS[level]), npc=True)
+
+RESISTANCE_HISTORY_SIZE = 10
+ACTION_HISTORY_SIZE = 100
+
+@history_record
+class NPCActionRecord(NamedTuple):
+    """Action choisie par le NPC (historique IA)"""
+    action: str
+    resistance: float
+    escalation: int
+    tick: int
+
+# Messages d'adaptation (stratégie, personnalité) compilés une fois
+ADAPTATION_TEMPLATES = {
+    ("extra_patient", "patient"): "Tu le sens qui ralentit le rythme, devenant encore plus attentionné...",
+    ("extra_patient", "direct"): "Il prend une grande inspiration, visiblement en train de réévaluer son approche...",
+    ("extra_patient", "mixed"): "{npc} devient plus patient, ajustant sa stratégie à ta résistance...",
+    ("confident", "direct"): "Tu sens une nouvelle assurance dans ses gestes, plus déterminé...",
+    ("confident", "patient"): "Il devient plus entreprenant, encouragé par ta réceptivité...",
+    ("confident", "mixed"): "{npc} s'enhardis, sentant que tu es plus réceptive...",
+    ("adaptive", "mixed"): "Il semble analyser tes réactions, adaptant son comportement en temps réel..."
+}
+ADAPTATION_TEMPLATES = {key: compile_template(text) for key, text in ADAPTATION_TEMPLATES.items()}
 
 class NPCMale(Entity):
     """NPC masculin avec IA adaptative avancée et feedback utilisateur"""
@@ -27,8 +64,8 @@ class NPCMale(Entity):
         self.current_escalation_level = 1
 
         # Historique adaptation pour IA
-        self.resistance_history = []
-        self.action_history = []
+        self.resistance_history = HistoryBuffer(RESISTANCE_HISTORY_SIZE)
+        self.action_history = HistoryBuffer(ACTION_HISTORY_SIZE)
         self.adaptation_messages = []
 
         # État session
@@ -36,6 +73,9 @@ class NPCMale(Entity):
         self.current_strategy = "normal"
         self.last_adaptation_time = 0
 
+        # Flux aléatoire (remplacé par le sous-flux de session)
+        self.rng = random.Random()
+
         # Setup components
         self._setup_personality(personality_type)
         self._setup_actions()
@@ -94,15 +134,7 @@ class NPCMale(Entity):
         actions = ActionComponent()
 
         # Actions par niveau escalation
-        action_sets = {
-            1: ["compliment", "conversation_charme", "regard_insistant"],
-            2: ["contact_epaule", "rapprochement_physique"],
-            3: ["main_cuisse", "caresses_douces"],
-            4: ["baiser_leger", "caresses"],
-            5: ["baiser_profond", "caresses_intimes"]
-        }
-
-        for level, action_list in action_sets.items():
+        for level, action_list in NPC_ACTION_LEVELS.items():
             for action in action_list:
                 actions.add_action(action, success_rate=0.7)
 
@@ -121,14 +153,10 @@ class NPCMale(Entity):
             Tuple (action_choisie, message_adaptation_ou_None)
         """
 
-        # Enregistrement pour analytics
+        # Enregistrement pour analytics (historique borné)
         self.resistance_history.append(player_resistance)
         self.interaction_count += 1
 
-        # Limite historique pour performance
-        if len(self.resistance_history) > 10:
-            self.resistance_history = self.resistance_history[-5:]
-
         # ANALYSE ADAPTATION NÉCESSAIRE
         adaptation_message = self._analyze_need_adaptation(player_resistance, context)
 
@@ -136,15 +164,22 @@ class NPCMale(Entity):
         chosen_action = self._select_action_by_strategy(player_resistance, context)
 
         # Historique action
-        self.action_history.append({
-            "action": chosen_action,
-            "resistance": player_resistance,
-            "escalation": self.current_escalation_level,
-            "timestamp": time.time()
-        })
+        self.action_history.append(NPCActionRecord(chosen_action, player_resistance,
+                                                   self.current_escalation_level, tick_ns()))
+        self._mark_state_changed()
 
         return chosen_action, adaptation_message
 
+    def _mark_state_changed(self):
+        """
+        Compteurs/escalation hors components: attributs marqués (sauvegarde incrémentale)
+        et PersonalityComponent signalé pour que AISystem retraite ce NPC
+        """
+        self.mark_dirty()
+        personality = self.get_component_of_type(PersonalityComponent)
+        if personality:
+            personality.mark_dirty()
+
     def _analyze_need_adaptation(self, resistance: float, context: Dict) -> Optional[str]:
         """Analyse si adaptation nécessaire et génère message"""
 
@@ -154,7 +189,7 @@ class NPCMale(Entity):
 
         # Analyse tendance résistance sur dernières actions
         if len(self.resistance_history) >= 3:
-            recent_resistance = self.resistance_history[-3:]
+            recent_resistance = self.resistance_history.latest(3)
             avg_resistance = sum(recent_resistance) / len(recent_resistance)
 
             personality = self.get_component_of_type(PersonalityComponent)
@@ -169,34 +204,29 @@ class NPCMale(Entity):
                 self.adaptations_made += 1
 
                 # Message selon personnalité
-                if self.personality_type == "patient":
-                    return "Tu le sens qui ralentit le rythme, devenant encore plus attentionné..."
-                elif self.personality_type == "direct":
-                    return "Il prend une grande inspiration, visiblement en train de réévaluer son approche..."
-                else:  # mixed
-                    return "Marcus devient plus patient, ajustant sa stratégie à ta résistance..."
+                return self._adaptation_message("extra_patient", self.personality_type)
 
             # RÉSISTANCE FAIBLE -> Adaptation confiance  
             elif avg_resistance < 0.3 and self.current_strategy != "confident":
                 self.current_strategy = "confident"
                 self.adaptations_made += 1
 
-                if self.personality_type == "direct":
-                    return "Tu sens une nouvelle assurance dans ses gestes, plus déterminé..."
-                elif self.personality_type == "patient":
-                    return "Il devient plus entreprenant, encouragé par ta réceptivité..."
-                else:  # mixed
-                    return "Marcus s'enhardis, sentant que tu es plus réceptive..."
+                return self._adaptation_message("confident", self.personality_type)
 
             # RÉSISTANCE VARIABLE -> Adaptation équilibrée
             elif len(set(recent_resistance)) >= 2 and self.current_strategy != "adaptive":
                 self.current_strategy = "adaptive"
                 self.adaptations_made += 1
 
-                return "Il semble analyser tes réactions, adaptant son comportement en temps réel..."
+                return self._adaptation_message("adaptive", "mixed")
 
         return None
 
+    def _adaptation_message(self, strategy: str, personality_type: str) -> str:
+        """Message compilé pour (stratégie, personnalité), "mixed" par défaut"""
+        template = ADAPTATION_TEMPLATES.get((strategy, personality_type)) or ADAPTATION_TEMPLATES[(strategy, "mixed")]
+        return template.render(make_context(npc=self))
+
     def _select_action_by_strategy(self, resistance: float, context: Dict) -> str:
         """Sélectionne action selon stratégie adaptée"""
 
@@ -245,7 +275,7 @@ class NPCMale(Entity):
         if not actions:
             actions = ["compliment"]  # Fallback sûr
 
-        return random.choice(actions)
+        return self.rng.choice(actions)
 
     def get_behavioral_state(self) -> Dict[str, Any]:
         """État comportemental complet pour analytics et debug"""
@@ -260,7 +290,7 @@ class NPCMale(Entity):
             "interaction_count": self.interaction_count,
             "success_rate": success_rate,
             "current_escalation": self.current_escalation_level,
-            "recent_actions": self.action_history[-3:] if self.action_history else [],
+            "recent_actions": record_dicts(self.action_history.latest(3)),
             "adaptations_made": self.adaptations_made,
             "current_strategy": self.current_strategy,
             "escalation_rate": 1.0,
@@ -287,6 +317,7 @@ class NPCMale(Entity):
             self.successful_actions += 1
         else:
             self.failed_actions += 1
+        self._mark_state_changed()
 
     def to_dict(self) -> Dict[str, Any]:
         """Sérialisation enrichie"""
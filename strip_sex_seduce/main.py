@@ -9,6 +9,7 @@ Développé selon workflow gamedev spécialisé TDD
 """
 import sys
 import os
+import argparse
 import traceback
 from datetime import datetime
 
@@ -17,6 +18,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Imports core V2.0
 from core.game_session_v2 import GameSessionV2
+from core.turn_log import TurnLog
 from utils.logger import GameLogger
 from utils.performance import PerformanceMonitor
 
@@ -85,8 +87,20 @@ def display_tutorial_hints():
     print("─" * 50)
     print("🔥 Prête à devenir la déesse de la séduction ? 🔥\n")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description=__game_title__)
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed de session (partie rejouable à l'identique)")
+    parser.add_argument("--log", default=None,
+                        help="Enregistre chaque tour dans un journal rejouable (scripts/replay.py)")
+    parser.add_argument("--load", default=None,
+                        help="Reprend une partie depuis un snapshot (.snap)")
+    return parser.parse_args()
+
 def main():
     """Fonction principale V2.0 - REVERSE SEDUCTION"""
+    args = parse_args()
+
     # Initialisation logging et monitoring
     logger = GameLogger()
     monitor = PerformanceMonitor()
@@ -104,7 +118,14 @@ def main():
         print("🎮 Initialisation V2.0 - Reverse Seduction...")
         print("🔄 Chargement systèmes révolutionnaires...")
 
-        game = GameSessionV2()
+        if args.load:
+            game = GameSessionV2.load(args.load)
+            print(f"💾 Partie reprise au tour {game.game_state.turn_count}")
+        else:
+            game = GameSessionV2(seed=args.seed)
+        logger.info(f"Seed session: {game.rng.seed}")
+        if args.log:
+            game.attach_turn_log(TurnLog(args.log))
 
         print("✅ MenuSystem - 50+ actions contextuelles")
         print("✅ InventorySystem - Items érotiques")
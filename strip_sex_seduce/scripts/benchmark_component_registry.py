@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark ComponentRegistry - lookup plat vs scan linéaire legacy
+"""
+
+import sys
+import os
+import time
+from dataclasses import dataclass
+
+# Setup path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.component import Component, ComponentRegistry
+from core.entity import Entity
+
+ITERATIONS = 20000
+
+def build_component_classes(count: int):
+    """Crée et enregistre `count` classes de components dynamiques"""
+    classes = []
+    for i in range(count):
+        cls = dataclass(type(f"BenchComponent{count}_{i}", (Component,), {}))
+        ComponentRegistry.register(cls)
+        classes.append(cls)
+    return classes
+
+def legacy_lookup(components, component_class):
+    """Ancienne résolution: parcours de tous les components"""
+    for component in components:
+        if isinstance(component, component_class):
+            return component
+    return None
+
+def benchmark_kinds(count: int):
+    """Compare les deux lookups pour une entity portant `count` components"""
+    classes = build_component_classes(count)
+    entity = Entity("bench")
+    for cls in classes:
+        entity.add_component(cls())
+
+    components = entity.get_all_components()
+    target = classes[-1]  # Pire cas pour le scan linéaire
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        entity.get_component_of_type(target)
+    registry_us = (time.perf_counter() - start) * 1e6 / ITERATIONS
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        legacy_lookup(components, target)
+    legacy_us = (time.perf_counter() - start) * 1e6 / ITERATIONS
+
+    return registry_us, legacy_us
+
+def main():
+    print("🧪 BENCHMARK COMPONENT REGISTRY")
+    print("-" * 40)
+    print(f"{'Kinds':>6} | {'Registre (µs)':>14} | {'Scan (µs)':>10} | {'Gain':>6}")
+
+    for count in (5, 10, 25, 50):
+        registry_us, legacy_us = benchmark_kinds(count)
+        ratio = legacy_us / registry_us if registry_us else 0
+        print(f"{count:>6} | {registry_us:>14.3f} | {legacy_us:>10.3f} | x{ratio:>5.1f}")
+
+    print("\n✅ Lookup par registre constant quel que soit le nombre de kinds")
+
+if __name__ == "__main__":
+    main()
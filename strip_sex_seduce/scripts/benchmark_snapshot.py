@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark snapshots - temps save/load et taille sur disque selon la longueur de session,
+coût d'un delta incrémental quand seul GameState.turn_count change
+"""
+
+import sys
+import os
+import time
+import tempfile
+from contextlib import redirect_stdout
+
+# Setup path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.headless import HeadlessRunner, RandomPolicyInput, NullOutput
+from core.game_session_v2 import GameSessionV2
+from core.snapshot import capture_session, encode_snapshot
+from core.save_journal import SaveJournal
+
+def play_session(turns: int, seed: int = 1) -> GameSessionV2:
+    runner = HeadlessRunner(RandomPolicyInput({"a": 0.5, "r": 0.5}, seed=seed), max_turns=turns, seed=seed)
+    runner.run()
+    return runner.session
+
+def measure(session: GameSessionV2, path: str, runs: int = 20):
+    start = time.perf_counter()
+    for _ in range(runs):
+        size = session.save(path)
+    save_ms = (time.perf_counter() - start) * 1000 / runs
+
+    start = time.perf_counter()
+    with redirect_stdout(NullOutput()):
+        for _ in range(runs):
+            GameSessionV2.load(path)
+    load_ms = (time.perf_counter() - start) * 1000 / runs
+
+    raw_size = len(encode_snapshot(capture_session(session), compress=False))
+    return save_ms, load_ms, size, raw_size
+
+def benchmark_deltas(session: GameSessionV2, path: str, turns: int = 200):
+    journal = SaveJournal(session, path, compact_every=turns + 1)
+    base_size = journal.save_base()
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        session.game_state.turn_count += 1
+        session.game_state.mark_dirty()
+        journal.save_delta()
+    delta_ms = (time.perf_counter() - start) * 1000 / turns
+    delta_bytes = (journal.get_stats()["bytes_written"] - base_size) / turns
+    journal.close()
+
+    print(f"\n🧪 DELTAS INCRÉMENTAUX ({turns} tours, turn_count seul modifié)")
+    print(f"Base: {base_size / 1024:.1f}Ko | Delta: {delta_bytes:.0f}o, {delta_ms:.2f}ms/tour")
+    print(f"Objectif delta << snapshot: {'✅ RÉUSSI' if delta_bytes * 10 < base_size else '❌ ÉCHEC'}")
+
+def main():
+    os.chdir(PROJECT_ROOT)
+    print("🧪 BENCHMARK SNAPSHOTS")
+    print("-" * 60)
+    print(f"{'Tours':>6} | {'Save (ms)':>9} | {'Load (ms)':>9} | {'Disque':>9} | {'Non compressé':>13}")
+
+    worst_ms = 0.0
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "bench.snap")
+        for turns in (10, 25, 100):
+            save_ms, load_ms, size, raw_size = measure(play_session(turns), path)
+            worst_ms = max(worst_ms, save_ms, load_ms)
+            print(f"{turns:>6} | {save_ms:>9.2f} | {load_ms:>9.2f} | {size / 1024:>7.1f}Ko | {raw_size / 1024:>11.1f}Ko")
+
+        print(f"\nObjectif <10ms save/load: {'✅ RÉUSSI' if worst_ms < 10 else '❌ ÉCHEC'}")
+
+        benchmark_deltas(play_session(25), path)
+
+if __name__ == "__main__":
+    main()
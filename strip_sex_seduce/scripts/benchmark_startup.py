@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark démarrage - temps jusqu'à la session prête (premier prompt),
+bundle d'assets précompilé vs lecture des JSON sources
+"""
+
+import sys
+import os
+import time
+import json
+import statistics
+import subprocess
+
+# Setup path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.asset_bundle import build_bundle, read_bundle, source_files
+
+# Process neuf: imports + chargement assets + création session, sortie console masquée
+_COLD_START = """
+import sys, os, io, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+os.chdir({root!r})
+from contextlib import redirect_stdout
+with redirect_stdout(io.StringIO()):
+    from core.asset_bundle import preload_assets
+    preload_assets(path={bundle!r})
+    from core.game_session_v2 import GameSessionV2
+    GameSessionV2(seed=1)
+print((time.perf_counter() - start) * 1000)
+"""
+
+def cold_start_ms(bundle_path: str, runs: int):
+    """Wall time du process complet et temps interne jusqu'à la session prête (médianes)"""
+    code = _COLD_START.format(root=PROJECT_ROOT, bundle=bundle_path)
+    walls, internals = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        walls.append((time.perf_counter() - start) * 1000)
+        internals.append(float(output.stdout.strip().splitlines()[-1]))
+    return statistics.median(walls), statistics.median(internals)
+
+def asset_load_ms(runs: int = 200):
+    """Chargement des assets seuls: parse JSON vs lecture du bundle"""
+    files = source_files(PROJECT_ROOT)
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        for rel in files:
+            with open(os.path.join(PROJECT_ROOT, rel), 'r', encoding='utf-8') as f:
+                json.load(f)
+    json_ms = (time.perf_counter() - start) * 1000 / runs
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        read_bundle(PROJECT_ROOT)
+    bundle_ms = (time.perf_counter() - start) * 1000 / runs
+    return len(files), json_ms, bundle_ms
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    result = build_bundle(PROJECT_ROOT)
+
+    print("🧪 BENCHMARK DÉMARRAGE")
+    print("-" * 60)
+    count, json_ms, bundle_ms = asset_load_ms()
+    print(f"Assets ({count} fichiers): JSON {json_ms:.3f}ms | bundle {bundle_ms:.3f}ms "
+          f"({result['bytes'] / 1024:.1f}Ko)")
+
+    # Un premier lancement chauffe les .pyc et le cache disque
+    cold_start_ms("assets/assets.bundle", 1)
+    json_wall, json_internal = cold_start_ms("assets/__absent__.bundle", runs)
+    bundle_wall, bundle_internal = cold_start_ms("assets/assets.bundle", runs)
+
+    print(f"\nDémarrage à froid (médiane {runs} process):")
+    print(f"{'Mode':>8} | {'Process (ms)':>12} | {'Session prête (ms)':>18}")
+    print(f"{'JSON':>8} | {json_wall:>12.1f} | {json_internal:>18.2f}")
+    print(f"{'Bundle':>8} | {bundle_wall:>12.1f} | {bundle_internal:>18.2f}")
+
+    gain = json_internal - bundle_internal
+    print(f"\nGain session prête: {gain:.2f}ms ({gain / json_internal * 100 if json_internal else 0:.1f}%)")
+    print(f"Objectif bundle < JSON: {'✅ RÉUSSI' if bundle_ms < json_ms else '❌ ÉCHEC'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark stats en lot - N joueurs, une action NPC chacun par tour:
+apply_npc_action en boucle vs apply_npc_action_batch (StatStore NumPy)
+"""
+
+import sys
+import os
+import time
+import random
+from contextlib import redirect_stdout
+from io import StringIO
+
+# Setup path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)
+
+from systems.stats_system import StatsSystem
+from entities.player import PlayerCharacter
+from core.stat_store import StatStore, NUMPY_AVAILABLE
+from components.stats import StatsComponent
+
+LOCATIONS = ["bar", "voiture", "salon", "chambre"]
+
+def run_store(system, players, turns: int) -> float:
+    """Store gardé entre les tours, components réécrits une seule fois à la fin"""
+    rng = random.Random(1)
+    actions_pool = list(system.action_index.npc_actions)
+    effect_table, location_rows = system._get_effect_arrays(), system.location_rows
+    start = time.perf_counter()
+    store = StatStore([player.get_component_of_type(StatsComponent) for player in players])
+    for _ in range(turns):
+        action_rows = [system.action_index.get_id(rng.choice(actions_pool)) for _ in players]
+        rows = [location_rows[rng.choice(LOCATIONS)] for _ in players]
+        store.apply_actions(effect_table, action_rows, rows)
+    store.flush(record_history=False)
+    return (time.perf_counter() - start) * 1000 / turns
+
+def run(system, players, turns: int, batched: bool) -> float:
+    rng = random.Random(1)
+    actions_pool = list(system.action_index.npc_actions)
+    start = time.perf_counter()
+    for _ in range(turns):
+        actions = [rng.choice(actions_pool) for _ in players]
+        locations = [rng.choice(LOCATIONS) for _ in players]
+        if batched:
+            system.apply_npc_action_batch(players, actions, locations)
+        else:
+            for player, action, location in zip(players, actions, locations):
+                system.apply_npc_action(player, action, {"location": location})
+    return (time.perf_counter() - start) * 1000 / turns
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with redirect_stdout(StringIO()):
+        system = StatsSystem()
+        loop_players = [PlayerCharacter(f"a{i}") for i in range(count)]
+        batch_players = [PlayerCharacter(f"b{i}") for i in range(count)]
+        store_players = [PlayerCharacter(f"c{i}") for i in range(count)]
+
+    print("🧪 BENCHMARK STATS EN LOT")
+    print("-" * 60)
+    if not NUMPY_AVAILABLE:
+        print("⚠️ NumPy absent: apply_npc_action_batch boucle sur apply_npc_action")
+
+    loop_ms = run(system, loop_players, turns, batched=False)
+    batch_ms = run(system, batch_players, turns, batched=True)
+
+    print(f"{count} joueurs, {turns} tours")
+    print(f"{'Boucle':>8} | {loop_ms:>8.2f} ms/tour")
+    print(f"{'Lot':>8} | {batch_ms:>8.2f} ms/tour")
+    print(f"\nAccélération lot: x{loop_ms / batch_ms:.1f}")
+
+    if NUMPY_AVAILABLE:
+        store_ms = run_store(system, store_players, turns)
+        print(f"Store persistant (flush final, sans historique): {store_ms:.2f} ms/tour, x{loop_ms / store_ms:.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark templates de texte - rendu d'une réplique NPC par tour:
+tirage statique (avant), re.sub, string.Template, TextTemplate précompilé
+"""
+
+import sys
+import os
+import re
+import time
+import random
+from string import Template
+
+# Setup path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.text_templates import compile_pool, DEFAULT_CONTEXT
+
+LINES = [
+    "{npc} se penche vers {player} avec un sourire charmeur...",
+    "Il murmure que {location} n'a jamais été aussi beau ce soir.",
+    "Ses doigts effleurent {clothing}, hésitants.",
+    "Il te regarde intensément, sans un mot.",
+    "Il rit doucement à ta remarque."
+]
+
+_SLOT = re.compile(r"\{(\w+)\}")
+
+def bench(label: str, render, runs: int) -> float:
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(runs):
+        render(rng)
+    elapsed_ns = (time.perf_counter() - start) * 1e9 / runs
+    print(f"{label:>22} | {elapsed_ns:>10.0f}")
+    return elapsed_ns
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    context = dict(DEFAULT_CONTEXT, location="le bar")
+
+    static_pool = tuple(LINES)
+    dollar_pool = tuple(Template(_SLOT.sub(r"${\1}", line)) for line in LINES)
+    compiled_pool = compile_pool(LINES)
+
+    print("🧪 BENCHMARK TEMPLATES")
+    print("-" * 60)
+    print(f"{'Méthode':>22} | {'ns / rendu':>10}")
+    static_ns = bench("Tirage statique", lambda rng: rng.choice(static_pool), runs)
+    regex_ns = bench("re.sub", lambda rng: _SLOT.sub(lambda m: context[m.group(1)], rng.choice(static_pool)), runs)
+    template_ns = bench("string.Template", lambda rng: rng.choice(dollar_pool).safe_substitute(context), runs)
+    compiled_ns = bench("TextTemplate.render", lambda rng: rng.choice(compiled_pool).render(context), runs)
+
+    overhead = compiled_ns - static_ns
+    print(f"\nSurcoût substitution précompilée: {overhead:.0f}ns par réplique")
+    faster = compiled_ns < min(regex_ns, template_ns)
+    print(f"Objectif précompilé < re.sub / string.Template: {'✅ RÉUSSI' if faster else '❌ ÉCHEC'}")
+
+if __name__ == "__main__":
+    main()
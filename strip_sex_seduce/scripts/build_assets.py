@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Compilation des assets - assets/config, assets/dialogues, assets/personalities
+→ assets/assets.bundle (un seul fichier chargé au démarrage)
+
+A relancer après modification d'un JSON: un bundle périmé est ignoré (repli JSON)
+
+Exemples:
+    python scripts/build_assets.py
+    python scripts/build_assets.py --check
+"""
+
+import sys
+import os
+import argparse
+
+# Ajout path projet
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.asset_bundle import build_bundle, read_bundle, DEFAULT_BUNDLE_PATH
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile les assets JSON en bundle")
+    parser.add_argument("--output", default=DEFAULT_BUNDLE_PATH, help="Chemin du bundle (relatif au projet)")
+    parser.add_argument("--check", action="store_true", help="Vérifie seulement que le bundle est à jour")
+    args = parser.parse_args()
+
+    if args.check:
+        assets, reason = read_bundle(PROJECT_ROOT, args.output)
+        print(f"{'✅' if assets is not None else '❌'} Bundle {args.output}: {reason}")
+        sys.exit(0 if assets is not None else 1)
+
+    result = build_bundle(PROJECT_ROOT, args.output)
+    print(f"📦 {result['files']} fichiers → {result['path']} ({result['bytes'] / 1024:.1f}Ko)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Lancement headless - sessions sans console pour benchmark throughput
+
+Exemples:
+    python scripts/headless.py --policy random --sessions 20 --seed 42
+    python scripts/headless.py --policy scripted --script a,a,r,a --loop
+    python scripts/headless.py --policy replay --replay session.log --capture
+    python scripts/headless.py --seed 7 --turns 200 --log turns.jsonl
+"""
+
+import sys
+import os
+import argparse
+
+# Ajout path projet
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.headless import (ScriptedInput, RandomPolicyInput, ReplayInput,
+                           NullOutput, CaptureOutput, run_headless_sessions)
+from core.turn_log import TurnLog
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sessions GameSessionV2 headless")
+    parser.add_argument("--policy", choices=["scripted", "random", "replay"], default="random")
+    parser.add_argument("--script", default="a,r,a,a", help="Commandes séparées par des virgules")
+    parser.add_argument("--loop", action="store_true", help="Rejoue le script en boucle")
+    parser.add_argument("--replay", help="Fichier de replay (une commande par ligne)")
+    parser.add_argument("--sessions", type=int, default=1)
+    parser.add_argument("--turns", type=int, default=100, help="Tours max par session")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed de base politique + RNG de session (session i: seed + i)")
+    parser.add_argument("--capture", action="store_true", help="Affiche la sortie de la dernière session")
+    parser.add_argument("--log", help="Journal de tours append-only (JSON lines)")
+    return parser.parse_args()
+
+def build_input_factory(args):
+    if args.policy == "scripted":
+        commands = [c.strip() for c in args.script.split(",") if c.strip()]
+        return lambda index: ScriptedInput(commands, loop=args.loop)
+    if args.policy == "replay":
+        if not args.replay:
+            raise SystemExit("❌ --replay requis avec --policy replay")
+        replay_path = os.path.abspath(args.replay)
+        return lambda index: ReplayInput(replay_path)
+    return lambda index: RandomPolicyInput(seed=None if args.seed is None else args.seed + index)
+
+def main():
+    args = parse_args()
+    input_factory = build_input_factory(args)
+    log_path = os.path.abspath(args.log) if args.log else None
+
+    # Les assets sont chargés en chemins relatifs au projet
+    os.chdir(PROJECT_ROOT)
+
+    outputs = []
+    def output_factory():
+        output = CaptureOutput() if args.capture else NullOutput()
+        outputs.append(output)
+        return output
+
+    print(f"🤖 HEADLESS: {args.sessions} session(s), politique {args.policy}")
+    print("-" * 50)
+
+    turn_log = TurnLog(log_path) if log_path else None
+    try:
+        reports = run_headless_sessions(input_factory, args.sessions, output_factory,
+                                        base_seed=args.seed, max_turns=args.turns, turn_log=turn_log)
+    finally:
+        if turn_log:
+            turn_log.close()
+
+    total_turns = sum(r["turns"] for r in reports)
+    total_time = sum(r["duration_seconds"] for r in reports)
+    worst_p99 = max((r["latency_ms"]["p99"] for r in reports), default=0.0)
+    worst_max = max((r["latency_ms"]["max"] for r in reports), default=0.0)
+
+    for index, report in enumerate(reports):
+        print(f"#{index}: {report['end_condition']} | {report['turns']} tours | "
+              f"{report['turns_per_sec']:.0f} tours/s | p99 {report['latency_ms']['p99']:.2f}ms | "
+              f"{' → '.join(report['location_path'])}")
+
+    print("-" * 50)
+    print(f"🎯 Tours joués: {total_turns}")
+    print(f"⚡ Throughput: {total_turns / total_time if total_time else 0:.0f} tours/s")
+    print(f"⏱️ Latence pire p99/max: {worst_p99:.2f}/{worst_max:.2f}ms")
+    if turn_log:
+        log_stats = turn_log.get_stats()
+        print(f"📝 Journal: {log_stats['events']} événements, {log_stats['avg_record_us']:.1f}µs/événement → {args.log}")
+
+    if args.capture and outputs:
+        print("\n📜 SORTIE DERNIÈRE SESSION:")
+        print(outputs[-1].getvalue())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Replay d'un journal de tours - reproduction des tours lents, non-régression
+
+Exemples:
+    python scripts/replay.py turns.jsonl
+    python scripts/replay.py turns.jsonl --turn 42 --show
+    python scripts/replay.py turns.jsonl --session 0 --slowest 10
+"""
+
+import sys
+import os
+import argparse
+
+# Ajout path projet
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.replay import ReplayEngine
+from core.headless import CaptureOutput
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Replay déterministe d'un journal de tours")
+    parser.add_argument("log", help="Journal JSON lines (main.py --log / scripts/headless.py --log)")
+    parser.add_argument("--session", type=int, default=-1, help="Index de session dans le journal")
+    parser.add_argument("--turn", type=int, default=None, help="Reconstruit l'état jusqu'à ce tour")
+    parser.add_argument("--slowest", type=int, default=5, help="Tours lents à comparer")
+    parser.add_argument("--show", action="store_true", help="Affiche la sortie rejouée")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    log_path = os.path.abspath(args.log)
+    os.chdir(PROJECT_ROOT)
+
+    engine = ReplayEngine(log_path, args.session)
+    print(f"🔁 REPLAY: seed {engine.seed}, {len(engine.events)} événements, dernier tour {engine.last_turn}")
+    print("-" * 50)
+
+    output = CaptureOutput() if args.show else None
+    result = engine.replay(args.turn, output=output)
+    replayed_ms = {e["turn"]: e["ms"] for e in result["events"]}
+
+    divergence = result["divergence"]
+    if divergence:
+        print(f"❌ Divergence tour {divergence['turn']} ({divergence['field']}): "
+              f"enregistré {divergence['recorded']!r} / rejoué {divergence['replayed']!r}")
+    else:
+        print(f"✅ Replay identique sur {len(result['events'])} événements")
+
+    session = result["session"]
+    stats = session.player.get_current_state_summary().get("stats", {})
+    print(f"📍 État tour {session.game_state.turn_count}: {session.current_environment.location} | {stats}")
+
+    print(f"\n⏱️ TOURS LES PLUS LENTS (enregistré → rejoué):")
+    for event in engine.slowest_turns(args.slowest):
+        replayed = replayed_ms.get(event["turn"])
+        replayed_text = f"{replayed:.2f}ms" if replayed is not None else "-"
+        print(f"   tour {event['turn']:>4} '{event['input']}': {event.get('ms', 0):.2f}ms → {replayed_text}")
+
+    if output is not None:
+        print("\n📜 SORTIE REJOUÉE:")
+        print(output.getvalue())
+
+    sys.exit(1 if divergence else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Simulation batch - milliers de sessions GameSessionV2 multi-process
+Validation équilibrage: fins de partie, tours, stats finales, parcours lieux
+
+Exemples:
+    python scripts/simulate.py --sessions 5000 --workers 32
+    python scripts/simulate.py --sessions 200 --jsonl results.jsonl
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import Counter
+from typing import Dict, List, Any, Optional
+
+# Ajout path projet
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Assets partagés, construits une fois par worker
+_WORKER_ASSETS: Dict[str, Any] = {}
+
+def _init_worker(max_turns: int):
+    """Initialisation unique par process: imports, chemins, config"""
+    os.chdir(PROJECT_ROOT)
+
+    from core.headless import HeadlessRunner, RandomPolicyInput, NullOutput
+    from core.game_session_v2 import GameSessionV2
+
+    _WORKER_ASSETS["runner_class"] = HeadlessRunner
+    _WORKER_ASSETS["policy_class"] = RandomPolicyInput
+    _WORKER_ASSETS["output"] = NullOutput()
+    _WORKER_ASSETS["config"] = GameSessionV2._load_config("assets/config/settings.json")
+    _WORKER_ASSETS["max_turns"] = max_turns
+
+def _run_chunk(first_index: int, count: int, base_seed: int) -> List[Dict[str, Any]]:
+    """Joue `count` sessions consécutives, retourne leurs résultats compacts"""
+    runner_class = _WORKER_ASSETS["runner_class"]
+    policy_class = _WORKER_ASSETS["policy_class"]
+
+    results = []
+    for index in range(first_index, first_index + count):
+        runner = runner_class(
+            policy_class(seed=base_seed + index),
+            _WORKER_ASSETS["output"],
+            max_turns=_WORKER_ASSETS["max_turns"],
+            config=_WORKER_ASSETS["config"],
+            seed=base_seed + index
+        )
+        report = runner.run()
+        results.append({
+            "session": index,
+            "end_condition": report["end_condition"],
+            "turns": report["turns"],
+            "final_stats": report["final_stats"],
+            "location_path": report["location_path"],
+            "p99_ms": report["latency_ms"]["p99"]
+        })
+    return results
+
+class SimulationAggregator:
+    """Agrégation en streaming des résultats de sessions"""
+
+    def __init__(self, jsonl_path: Optional[str] = None):
+        self.sessions = 0
+        self.total_turns = 0
+        self.min_turns: Optional[int] = None
+        self.max_turns = 0
+        self.end_conditions = Counter()
+        self.location_paths = Counter()
+        self.final_locations = Counter()
+        self.stat_totals: Dict[str, float] = {}
+        self.worst_p99_ms = 0.0
+        self._jsonl = open(jsonl_path, 'w', encoding='utf-8') if jsonl_path else None
+
+    def add(self, result: Dict[str, Any]):
+        self.sessions += 1
+        turns = result["turns"]
+        self.total_turns += turns
+        self.min_turns = turns if self.min_turns is None else min(self.min_turns, turns)
+        self.max_turns = max(self.max_turns, turns)
+        self.end_conditions[result["end_condition"]] += 1
+
+        path = result["location_path"]
+        self.location_paths[" → ".join(path)] += 1
+        self.final_locations[path[-1] if path else "?"] += 1
+
+        for stat, value in result["final_stats"].items():
+            if isinstance(value, (int, float)):
+                self.stat_totals[stat] = self.stat_totals.get(stat, 0.0) + value
+
+        self.worst_p99_ms = max(self.worst_p99_ms, result["p99_ms"])
+
+        if self._jsonl:
+            self._jsonl.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    def close(self):
+        if self._jsonl:
+            self._jsonl.close()
+            self._jsonl = None
+
+    def summary(self) -> Dict[str, Any]:
+        count = max(1, self.sessions)
+        return {
+            "sessions": self.sessions,
+            "avg_turns": self.total_turns / count,
+            "min_turns": self.min_turns or 0,
+            "max_turns": self.max_turns,
+            "end_conditions": dict(self.end_conditions),
+            "final_locations": dict(self.final_locations),
+            "top_paths": self.location_paths.most_common(5),
+            "avg_final_stats": {k: v / count for k, v in self.stat_totals.items()},
+            "worst_p99_ms": self.worst_p99_ms
+        }
+
+def plan_chunks(sessions: int, workers: int, chunk_size: int = 0) -> List[tuple]:
+    """Découpe [0, sessions) en chunks (~4 par worker par défaut)"""
+    if chunk_size <= 0:
+        chunk_size = max(1, sessions // (workers * 4))
+    return [(start, min(chunk_size, sessions - start)) for start in range(0, sessions, chunk_size)]
+
+def simulate(sessions: int, workers: int, seed: int = 0, max_turns: int = 100,
+             chunk_size: int = 0, aggregator: Optional[SimulationAggregator] = None) -> SimulationAggregator:
+    """Répartit les sessions sur le pool de process, agrège au fil de l'eau"""
+    aggregator = aggregator or SimulationAggregator()
+    chunks = plan_chunks(sessions, workers, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(max_turns,)) as executor:
+        futures = [executor.submit(_run_chunk, start, count, seed) for start, count in chunks]
+        for future in as_completed(futures):
+            for result in future.result():
+                aggregator.add(result)
+
+    return aggregator
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Simulation batch multi-process")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=0, help="Sessions par tâche (0 = auto)")
+    parser.add_argument("--turns", type=int, default=100, help="Tours max par session")
+    parser.add_argument("--seed", type=int, default=0, help="Seed de base (session i: seed + i)")
+    parser.add_argument("--jsonl", help="Écrit chaque résultat en JSON lines")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    jsonl_path = os.path.abspath(args.jsonl) if args.jsonl else None
+
+    print(f"🧪 SIMULATION: {args.sessions} sessions sur {args.workers} process")
+    print("-" * 50)
+
+    start = time.perf_counter()
+    aggregator = SimulationAggregator(jsonl_path)
+    try:
+        simulate(args.sessions, args.workers, args.seed, args.turns, args.chunk_size, aggregator)
+    finally:
+        aggregator.close()
+    elapsed = time.perf_counter() - start
+
+    summary = aggregator.summary()
+    print(f"🎯 Sessions: {summary['sessions']} en {elapsed:.1f}s "
+          f"({summary['sessions'] / elapsed if elapsed else 0:.0f} sessions/s)")
+    print(f"🔁 Tours: moy {summary['avg_turns']:.1f} | min {summary['min_turns']} | max {summary['max_turns']}")
+    print(f"🏁 Fins: {summary['end_conditions']}")
+    print(f"📍 Lieux finaux: {summary['final_locations']}")
+    for path, count in summary["top_paths"]:
+        print(f"   {count:>6} × {path}")
+    stats = ", ".join(f"{k} {v:.1f}" for k, v in summary["avg_final_stats"].items())
+    print(f"📊 Stats finales moyennes: {stats}")
+    print(f"⏱️ Pire p99 tour: {summary['worst_p99_ms']:.2f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,29 @@ Correctif: Orchestration IA + feedback + analytics
 from core.system import System
 from core.entity import Entity
 from components.personality import PersonalityComponent
+from components.stats import StatsComponent
 from entities.npc import NPCMale
 from entities.player import PlayerCharacter
-from typing import List, Dict, Any, Optional
+from core.history import HistoryBuffer, history_record
+from typing import List, Dict, Any, Optional, NamedTuple
+
+RESISTANCE_RESPONSES_SIZE = 50
+
+@history_record
+class ResistanceResponse(NamedTuple):
+    """Réponse d'un NPC à la résistance joueur (analytics)"""
+    npc_personality: str
+    resistance_level: float
+    resistance_category: str
+    escalation_level: int
+    success_rate: float
 
 class AISystem(System):
     """System orchestrant l'IA adaptative avec analytics avancées"""
 
+    watched_components = (StatsComponent, PersonalityComponent)
+    writes = (PersonalityComponent,)
+
     def __init__(self):
         super().__init__("AISystem")
 
@@ -25,7 +41,7 @@ class AISystem(System):
                 "direct": {"successes": 0, "attempts": 0}, 
                 "mixed": {"successes": 0, "attempts": 0}
             },
-            "resistance_responses": []
+            "resistance_responses": HistoryBuffer(RESISTANCE_RESPONSES_SIZE)
         }
 
         # Seuils adaptation pour fine-tuning
@@ -44,6 +60,12 @@ class AISystem(System):
         if not player or not game_state:
             return
 
+        # Résistance joueur inchangée: seuls les NPCs modifiés sont retraités
+        # (compteurs et escalation NPCMale signalés via leur PersonalityComponent)
+        changes = kwargs.get("changes")
+        if changes is not None and not changes.has_changes(StatsComponent):
+            entities = changes.entities(PersonalityComponent)
+
         # Traitement tous NPCs
         for entity in entities:
             if isinstance(entity, NPCMale):
@@ -75,19 +97,11 @@ class AISystem(System):
         # Tracking adaptations par résistance
         resistance_category = "high" if resistance > 0.7 else "medium" if resistance > 0.3 else "low"
 
-        adaptation_data = {
-            "npc_personality": npc.personality_type,
-            "resistance_level": resistance,
-            "resistance_category": resistance_category,
-            "escalation_level": npc.current_escalation_level,
-            "success_rate": npc.successful_actions / max(1, npc.interaction_count)
-        }
-
-        self.behavior_analytics["resistance_responses"].append(adaptation_data)
-
-        # Limite historique pour performance
-        if len(self.behavior_analytics["resistance_responses"]) > 50:
-            self.behavior_analytics["resistance_responses"] =                 self.behavior_analytics["resistance_responses"][-30:]
+        # Historique borné: plus anciennes réponses écrasées
+        self.behavior_analytics["resistance_responses"].append(ResistanceResponse(
+            npc.personality_type, resistance, resistance_category,
+            npc.current_escalation_level, npc.successful_actions / max(1, npc.interaction_count)
+        ))
 
     def _optimize_personality_traits(self, personality: PersonalityComponent, 
                                    npc_state: Dict[str, Any]):
@@ -205,7 +219,7 @@ class AISystem(System):
                 "direct": {"successes": 0, "attempts": 0},
                 "mixed": {"successes": 0, "attempts": 0}
             },
-            "resistance_responses": []
+            "resistance_responses": HistoryBuffer(RESISTANCE_RESPONSES_SIZE)
         }
 
 # SYSTÈME IA: Analytics + optimisation + insights pour amélioration continue
@@ -7,11 +7,12 @@ from core.system import System
 from core.entity import Entity
 from components.clothing import ClothingComponent
 from typing import List, Dict, Any, Optional
-import random
 
 class ClothingSystem(System):
     """System vêtements avec modifications graduelles et feedback"""
 
+    writes = ()
+
     def __init__(self):
         super().__init__("ClothingSystem")
 
@@ -98,14 +99,14 @@ class ClothingSystem(System):
         # Chance de modification selon escalation et lieu
         base_chance = min(0.9, escalation_level * 0.15 * location_mod)
 
-        if random.random() > base_chance:
+        if self.rng.random() > base_chance:
             return {"success": False, "description": "", "visible_change": False}
 
         # Sélection modification selon escalation
         if escalation_level in self.clothing_escalation:
             escalation_data = self.clothing_escalation[escalation_level]
-            chosen_action = random.choice(escalation_data["actions"])
-            description = random.choice(escalation_data["descriptions"])
+            chosen_action = self.rng.choice(escalation_data["actions"])
+            description = self.rng.choice(escalation_data["descriptions"])
 
             # Application modification au component
             result = self._apply_specific_clothing_change(clothing, chosen_action, escalation_level)
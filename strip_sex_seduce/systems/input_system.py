@@ -7,6 +7,8 @@ from core.entity import Entity
 from typing import List, Dict, Any
 
 class InputSystem(System):
+    writes = ()
+
     def __init__(self):
         super().__init__("InputSystem")
 
@@ -6,13 +6,16 @@ from core.entity import Entity
 from components.inventory import InventoryComponent, InventoryItem
 from components.stats import StatsComponent
 from components.seduction import SeductionComponent
+from core.assets import AssetRegistry
 from typing import List, Dict, Any, Optional
-import json
-import random
 
 class InventorySystem(System):
     """System pour gestion complète items et équipements"""
 
+    required_components = (InventoryComponent,)
+    writes = (InventoryComponent, SeductionComponent, StatsComponent)
+    asset_keys = ("assets/config/items_catalog.json",)
+
     def __init__(self):
         super().__init__("InventorySystem")
         self.item_catalog = {}
@@ -20,27 +23,27 @@ class InventorySystem(System):
         self._load_item_catalog()
 
     def _load_item_catalog(self):
-        """Charge catalogue items depuis assets"""
-        try:
-            with open("assets/config/items_catalog.json", 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                self.item_catalog = config.get("items", {})
-                self.combination_effects = config.get("combinations", {})
-        except FileNotFoundError:
-            # Catalogue par défaut
-            self.item_catalog = self._get_default_item_catalog()
-            self.combination_effects = self._get_default_combinations()
+        """Charge catalogue items depuis assets (figé, partagé entre sessions)"""
+        config = AssetRegistry.load_json("assets/config/items_catalog.json", self._get_default_config)
+        self.item_catalog = config.get("items", {})
+        self.combination_effects = config.get("combinations", {})
+
+    def reload_assets(self):
+        """Rechargement à chaud du catalogue"""
+        self._load_item_catalog()
+
+    def _get_default_config(self) -> Dict[str, Any]:
+        """Catalogue par défaut si items_catalog.json est absent"""
+        return {"items": self._get_default_item_catalog(), "combinations": self._get_default_combinations()}
 
     def update(self, entities: List[Entity], delta_time: float = 0.0, **kwargs):
         """Update système inventory"""
-        for entity in entities:
-            inventory_comp = entity.get_component_of_type(InventoryComponent)
-            if inventory_comp:
-                # Mise à jour cooldowns items
-                inventory_comp.update_cooldowns()
+        for entity, inventory_comp in self.iter_components(entities, InventoryComponent, kwargs.get("archetypes")):
+            # Mise à jour cooldowns items
+            inventory_comp.update_cooldowns()
 
-                # Vérification effets items équipés
-                self._process_equipped_items_effects(entity, inventory_comp)
+            # Vérification effets items équipés
+            self._process_equipped_items_effects(entity, inventory_comp)
 
     def use_item(self, entity: Entity, item_id: str, target_entity: Optional[Entity] = None, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Utilise un item avec effets complets"""
@@ -131,10 +134,8 @@ class InventorySystem(System):
         # Effets sur stats principales
         for effect_name, effect_value in item_effects.items():
             if effect_name == "libido_boost" and stats_comp:
-                old_arousal = getattr(stats_comp, 'excitation', 0)
-                new_arousal = min(100, old_arousal + effect_value)
-                stats_comp.excitation = new_arousal
-                effects_applied["arousal"] = {"old": old_arousal, "new": new_arousal, "change": effect_value}
+                change = stats_comp.apply_modifier("excitation", effect_value, source="item_libido_boost")
+                effects_applied["arousal"] = {"old": change["old_value"], "new": change["new_value"], "change": effect_value}
 
             elif effect_name == "confidence_boost" and seduction_comp:
                 # Boost confiance temporaire
@@ -151,10 +152,8 @@ class InventorySystem(System):
 
             elif effect_name == "disinhibition" and stats_comp:
                 # Réduction volonté temporaire
-                old_volonte = getattr(stats_comp, 'volonte', 100)
-                new_volonte = max(0, old_volonte - effect_value)
-                stats_comp.volonte = new_volonte
-                effects_applied["volonte"] = {"old": old_volonte, "new": new_volonte, "change": -effect_value}
+                change = stats_comp.apply_modifier("volonte", -effect_value, source="item_disinhibition")
+                effects_applied["volonte"] = {"old": change["old_value"], "new": change["new_value"], "change": -effect_value}
 
         # Effets spéciaux selon item
         item_category = item_data.get("category", "")
@@ -180,15 +179,13 @@ class InventorySystem(System):
         # Boost libido mutuel
         stats_comp = entity.get_component_of_type(StatsComponent)
         if stats_comp:
-            boost_amount = random.randint(15, 25)  # Variabilité
-            old_arousal = getattr(stats_comp, 'excitation', 0)
-            new_arousal = min(100, old_arousal + boost_amount)
-            stats_comp.excitation = new_arousal
+            boost_amount = self.rng.randint(15, 25)  # Variabilité
+            change = stats_comp.apply_modifier("excitation", boost_amount, source="item_aphrodisiac")
 
             effects["aphrodisiac_boost"] = {
                 "amount": boost_amount,
-                "old_arousal": old_arousal,
-                "new_arousal": new_arousal
+                "old_arousal": change["old_value"],
+                "new_arousal": change["new_value"]
             }
 
         # Effet réchauffement corporel si gingembre
@@ -208,9 +205,7 @@ class InventorySystem(System):
             stats_comp = entity.get_component_of_type(StatsComponent)
             if stats_comp:
                 self_arousal_boost = 25
-                old_arousal = getattr(stats_comp, 'excitation', 0)
-                new_arousal = min(100, old_arousal + self_arousal_boost)
-                stats_comp.excitation = new_arousal
+                stats_comp.apply_modifier("excitation", self_arousal_boost, source="item_vibrator")
 
                 effects["self_stimulation"] = {
                     "toy": "vibrator",
@@ -240,10 +235,8 @@ class InventorySystem(System):
 
         if "champagne" in alcohol_type:
             # Désinhibition progressive + ambiance romantique
-            disinhibition = random.randint(10, 15)
-            old_volonte = getattr(stats_comp, 'volonte', 100)
-            new_volonte = max(0, old_volonte - disinhibition)
-            stats_comp.volonte = new_volonte
+            disinhibition = self.rng.randint(10, 15)
+            stats_comp.apply_modifier("volonte", -disinhibition, source="item_champagne")
 
             effects["champagne_effect"] = {
                 "disinhibition": disinhibition,
@@ -253,10 +246,8 @@ class InventorySystem(System):
 
         elif "shots" in alcohol_type:
             # Désinhibition rapide intense
-            disinhibition = random.randint(20, 30)
-            old_volonte = getattr(stats_comp, 'volonte', 100)
-            new_volonte = max(0, old_volonte - disinhibition)
-            stats_comp.volonte = new_volonte
+            disinhibition = self.rng.randint(20, 30)
+            stats_comp.apply_modifier("volonte", -disinhibition, source="item_shots")
 
             effects["shots_effect"] = {
                 "disinhibition": disinhibition,
@@ -276,15 +267,13 @@ class InventorySystem(System):
             # Assume que NPC a des stats similaires
             target_stats = target_entity.get_component_of_type(StatsComponent)
             if target_stats:
-                arousal_boost = random.randint(10, 20)
-                old_arousal = getattr(target_stats, 'excitation', 0)
-                new_arousal = min(100, old_arousal + arousal_boost)
-                target_stats.excitation = new_arousal
+                arousal_boost = self.rng.randint(10, 20)
+                change = target_stats.apply_modifier("excitation", arousal_boost, source="item_target")
 
                 effects["npc_arousal_boost"] = {
                     "amount": arousal_boost,
-                    "old": old_arousal,
-                    "new": new_arousal
+                    "old": change["old_value"],
+                    "new": change["new_value"]
                 }
 
         return effects
@@ -7,29 +7,54 @@ from components.action_menu import ActionMenuComponent, MenuAction
 from components.stats import StatsComponent
 from components.seduction import SeductionComponent
 from components.progression import ProgressionComponent
+from core.assets import AssetRegistry
+from core.action_index import get_action_index, action_catalog_sources, register_action_catalog
 from typing import List, Dict, Any, Optional
-import json
+
+# Paliers d'actions contextuelles (internés dans l'index d'actions)
+MENU_ACTION_TIERS = (
+    ("base", ("compliment", "regard_insistant", "conversation_charme")),
+    ("semi_prive", ("contact_epaule", "rapprochement_physique")),
+    ("prive", ("main_cuisse", "caresses_douces")),
+    ("tres_prive", ("caresses_intimes", "baiser_leger")),
+    ("intime", ("baiser_profond", "removal_vetement", "simulation_sexuelle")),
+    ("seduction_5", ("seduction_avancee", "technique_speciale")),
+    ("seduction_10", ("maitrise_totale", "multi_orgasme"))
+)
+register_action_catalog("menu_tiers", (name for _, names in MENU_ACTION_TIERS for name in names))
 
 class MenuSystem(System):
     """System pour gestion menus contextuels avancés"""
 
+    watched_components = (StatsComponent, SeductionComponent, ProgressionComponent, ActionMenuComponent)
+    writes = (ActionMenuComponent,)
+    asset_keys = tuple(action_catalog_sources())
+
     def __init__(self):
         super().__init__("MenuSystem")
         self.menu_configs = {}
         self.action_catalog = {}
+        self._last_environment = None
         self._load_menu_configurations()
 
     def _load_menu_configurations(self):
-        """Charge configurations menus depuis assets"""
-        try:
-            with open("assets/config/actions_config.json", 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                self.action_catalog = config.get("actions", {})
-                self.menu_configs = config.get("menus", {})
-        except FileNotFoundError:
-            # Configuration par défaut
-            self.action_catalog = self._get_default_action_catalog()
-            self.menu_configs = self._get_default_menu_config()
+        """Charge configurations menus depuis assets (figées, partagées entre sessions)"""
+        config = AssetRegistry.load_json("assets/config/actions_config.json", self._get_default_config)
+        self.action_catalog = config.get("actions", {})
+        self.menu_configs = config.get("menus", {})
+
+        # Paliers en masques de bits sur les ids d'actions
+        self.action_index = get_action_index()
+        self._tier_masks = {tier: self.action_index.mask(names) for tier, names in MENU_ACTION_TIERS}
+
+    def reload_assets(self):
+        """Rechargement à chaud: menus régénérés au prochain tour"""
+        self._load_menu_configurations()
+        self._last_environment = None
+
+    def _get_default_config(self) -> Dict[str, Any]:
+        """Configuration par défaut si actions_config.json est absent"""
+        return {"actions": self._get_default_action_catalog(), "menus": self._get_default_menu_config()}
 
     def update(self, entities: List[Entity], delta_time: float = 0.0, **kwargs):
         """Update système menus"""
@@ -49,6 +74,12 @@ class MenuSystem(System):
         if not menu_comp:
             return
 
+        # Menu inchangé tant que joueur et lieu ne bougent pas
+        changes = kwargs.get("changes")
+        if changes is not None and player not in changes and environment is self._last_environment:
+            return
+        self._last_environment = environment
+
         # Mise à jour actions disponibles selon contexte
         context = self._build_context(player, environment, game_state, stats_comp, seduction_comp)
         available_actions = self._generate_contextual_actions(context, progression_comp)
@@ -70,41 +101,39 @@ class MenuSystem(System):
 
     def _generate_contextual_actions(self, context: Dict[str, Any], progression_comp) -> List[str]:
         """Génère actions disponibles selon contexte"""
-        available_actions = []
+        masks = self._tier_masks
 
         # Actions de base toujours disponibles
-        base_actions = ["compliment", "regard_insistant", "conversation_charme"]
-        available_actions.extend(base_actions)
+        available = masks["base"]
 
         # Actions selon niveau intimité/lieu
-        location = context["location"]
         privacy = context["privacy_level"]
 
         if privacy > 0.3:  # Semi-privé
-            available_actions.extend(["contact_epaule", "rapprochement_physique"])
+            available |= masks["semi_prive"]
 
         if privacy > 0.6:  # Privé
-            available_actions.extend(["main_cuisse", "caresses_douces"])
+            available |= masks["prive"]
 
         if privacy > 0.8:  # Très privé
-            available_actions.extend(["caresses_intimes", "baiser_leger"])
+            available |= masks["tres_prive"]
 
         if privacy >= 1.0:  # Intimité complète
-            available_actions.extend(["baiser_profond", "removal_vetement", "simulation_sexuelle"])
+            available |= masks["intime"]
 
         # Filtre selon progression débloquée
         if progression_comp:
-            unlocked_actions = progression_comp.unlocked_actions
-            available_actions = [action for action in available_actions if action in unlocked_actions or action in base_actions]
+            available &= self.action_index.mask(progression_comp.unlocked_actions) | masks["base"]
 
         # Actions selon niveau séduction
         seduction_level = context["seduction_level"]
         if seduction_level >= 5:
-            available_actions.extend(["seduction_avancee", "technique_speciale"])
+            available |= masks["seduction_5"]
         if seduction_level >= 10:
-            available_actions.extend(["maitrise_totale", "multi_orgasme"])
+            available |= masks["seduction_10"]
 
-        return list(set(available_actions))  # Remove duplicates
+        # Noms uniquement pour l'affichage, dans l'ordre des ids
+        return self.action_index.names_in(available)
 
     def generate_menu_display(self, menu_type: str, available_actions: List[str], context: Dict[str, Any]) -> str:
         """Génère affichage menu pour console"""
@@ -171,12 +200,12 @@ class MenuSystem(System):
             if arousal < 30:
                 dialogue_options.extend([
                     '1. "Tu me plais beaucoup..." (flirt doux)',
-                    '2. "J'ai chaud ici..." (excuse déshabillage)', 
+                    '2. "J\'ai chaud ici..." (excuse déshabillage)', 
                     '3. "Raconte-moi tes fantasmes..." (provocation)'
                 ])
             else:
                 dialogue_options.extend([
-                    '1. "J'ai envie de toi..." (direct)',
+                    '1. "J\'ai envie de toi..." (direct)',
                     '2. "Tu aimes mes seins ?" (exhibition)',
                     '3. "On pourrait aller ailleurs ?" (escalation)'
                 ])
@@ -228,10 +257,10 @@ class MenuSystem(System):
             ])
         elif privacy <= 0.8:  # Privé
             physical_options.extend([
-                '1. S'asseoir très près sur canapé',
+                '1. S\'asseoir très près sur canapé',
                 '2. Étirement sensuel provocant',
                 '3. Caresses directes sur son torse',
-                '4. Se déshabiller "pour être à l'aise"'
+                '4. Se déshabiller "pour être à l\'aise"'
             ])
         else:  # Intimité complète
             physical_options.extend([
@@ -7,9 +7,9 @@ from components.stats import StatsComponent
 from components.seduction import SeductionComponent
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
-from datetime import datetime
-import random
-import json
+from core.assets import AssetRegistry, thaw
+from core.clock import current_clock, tick_ns
+import itertools
 
 @dataclass
 class MiniGameResult:
@@ -24,19 +24,24 @@ class MiniGameResult:
 class MiniGameSystem(System):
     """System pour gestion mini-jeux intégrés"""
 
+    writes = ()
+    asset_keys = ("assets/minigames/minigame_config.json",)
+
     def __init__(self):
         super().__init__("MiniGameSystem")
         self.active_minigames = {}  # Sessions mini-jeux actives
+        self._session_ids = itertools.count(1)
         self.minigame_configs = {}
         self._load_minigame_configs()
 
     def _load_minigame_configs(self):
-        """Charge configurations mini-jeux"""
-        try:
-            with open("assets/minigames/minigame_config.json", 'r', encoding='utf-8') as f:
-                self.minigame_configs = json.load(f)
-        except FileNotFoundError:
-            self.minigame_configs = self._get_default_minigame_configs()
+        """Charge configurations mini-jeux (figées, partagées entre sessions)"""
+        self.minigame_configs = AssetRegistry.load_json("assets/minigames/minigame_config.json",
+                                                        self._get_default_minigame_configs)
+
+    def reload_assets(self):
+        """Les mini-jeux en cours gardent leur copie de config"""
+        self._load_minigame_configs()
 
     def update(self, entities: List[Entity], delta_time: float = 0.0, **kwargs):
         """Update mini-jeux actifs"""
@@ -60,7 +65,7 @@ class MiniGameSystem(System):
             return {"success": False, "error": requirements_check["reason"]}
 
         # Création session mini-jeu
-        session_id = f"{game_type}_{datetime.now().timestamp()}"
+        session_id = f"{game_type}_{next(self._session_ids)}"
         game_config = self.minigame_configs[game_type]
 
         game_session = {
@@ -69,7 +74,7 @@ class MiniGameSystem(System):
             "player_entity": player_entity,
             "npc_entity": npc_entity,
             "context": context.copy(),
-            "config": game_config.copy(),
+            "config": thaw(game_config),
             "status": "active",
             "current_step": 0,
             "player_inputs": [],
@@ -78,7 +83,8 @@ class MiniGameSystem(System):
                 "choice_scores": [],
                 "bonus_points": 0
             },
-            "start_time": datetime.now()
+            "start_turn": current_clock().turn,
+            "start_tick": tick_ns()
         }
 
         self.active_minigames[session_id] = game_session
@@ -312,7 +318,7 @@ class MiniGameSystem(System):
             base_score += 20
 
         # Variabilité
-        return base_score + random.randint(-10, 10)
+        return base_score + self.rng.randint(-10, 10)
 
     def _generate_strip_narrative(self, piece: str, timing: str, score: int) -> str:
         """Génère narrative strip-tease"""
@@ -360,10 +366,10 @@ class MiniGameSystem(System):
         """Mini-jeu dés du désir"""
         if player_input.lower() == "lancer":
             # Jet des 4 dés
-            action_die = random.choice(["baiser", "caresse", "lécher", "sucer", "pénétrer"])
-            zone_die = random.choice(["cou", "seins", "cuisses", "sexe", "anus", "bouche"])
-            intensity_die = random.choice(["doux", "normal", "intense", "sauvage"])
-            duration_die = random.choice(["5sec", "30sec", "2min", "jusqu'orgasme"])
+            action_die = self.rng.choice(["baiser", "caresse", "lécher", "sucer", "pénétrer"])
+            zone_die = self.rng.choice(["cou", "seins", "cuisses", "sexe", "anus", "bouche"])
+            intensity_die = self.rng.choice(["doux", "normal", "intense", "sauvage"])
+            duration_die = self.rng.choice(["5sec", "30sec", "2min", "jusqu'orgasme"])
 
             result_text = f"🎲 RÉSULTAT DÉS:\n"
             result_text += f"ACTION: {action_die}\n"
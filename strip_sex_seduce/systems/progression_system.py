@@ -6,30 +6,62 @@ from core.entity import Entity
 from components.progression import ProgressionComponent, Achievement, UnlockRequirement
 from components.seduction import SeductionComponent
 from components.stats import StatsComponent
+from core.assets import AssetRegistry, thaw
+from core.events import EventBus, StatChanged, LocationChanged
 from typing import List, Dict, Any, Optional
-import json
 from datetime import datetime
 
 class ProgressionSystem(System):
     """System pour gestion progression, unlocks et achievements"""
 
+    watched_components = (StatsComponent, SeductionComponent, ProgressionComponent)
+    writes = (ProgressionComponent,)
+    asset_keys = ("assets/config/progression_config.json",)
+
     def __init__(self):
         super().__init__("ProgressionSystem")
         self.unlock_conditions = {}
         self.achievement_definitions = {}
+        self._last_location = None
+
+        # Avec un World: lieu et extrêmes de stats reçus par événements (plus de relecture)
+        self._location_changed = True
+        self._stat_extremes: Dict[str, Dict[str, int]] = {}
         self._load_progression_config()
 
     def _load_progression_config(self):
-        """Charge configuration progression"""
-        try:
-            with open("assets/config/progression_config.json", 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                self.unlock_conditions = config.get("unlock_conditions", {})
-                self.achievement_definitions = config.get("achievements", {})
-        except FileNotFoundError:
-            # Configuration par défaut
-            self.unlock_conditions = self._get_default_unlock_conditions()
-            self.achievement_definitions = self._get_default_achievements()
+        """Charge configuration progression (figée, partagée entre sessions)"""
+        config = AssetRegistry.load_json("assets/config/progression_config.json", self._get_default_config)
+        self.unlock_conditions = config.get("unlock_conditions", {})
+        self.achievement_definitions = config.get("achievements", {})
+
+    def reload_assets(self):
+        """Rechargement à chaud: conditions revérifiées au prochain tour"""
+        self._load_progression_config()
+        self._last_location = None
+        self._location_changed = True
+
+    def subscribe_events(self, events: EventBus):
+        events.subscribe(StatChanged, self._on_stat_changed)
+        events.subscribe(LocationChanged, self._on_location_changed)
+
+    def _on_stat_changed(self, event: StatChanged):
+        """Extrêmes atteints depuis le dernier update (pics intermédiaires compris)"""
+        if event.stat == "excitation":
+            metric, pick = "max_arousal_reached", max
+        elif event.stat == "volonte":
+            metric, pick = "min_resistance_reached", min
+        else:
+            return
+        extremes = self._stat_extremes.setdefault(event.entity_id, {})
+        extremes[metric] = pick(extremes.get(metric, event.new_value), event.new_value)
+
+    def _on_location_changed(self, event: LocationChanged):
+        self._location_changed = True
+
+    def _get_default_config(self) -> Dict[str, Any]:
+        """Configuration par défaut si progression_config.json est absent"""
+        return {"unlock_conditions": self._get_default_unlock_conditions(), "achievements": self._get_default_achievements()}
 
     def update(self, entities: List[Entity], delta_time: float = 0.0, **kwargs):
         """Update système progression"""
@@ -43,6 +75,17 @@ class ProgressionSystem(System):
         if not progression_comp:
             return
 
+        # Rien à recalculer si ni les components du joueur ni le lieu n'ont changé
+        # (lieu: LocationChanged avec un World, sinon comparaison au dernier passage)
+        changes = kwargs.get("changes")
+        if self._events is not None:
+            location_changed, self._location_changed = self._location_changed, False
+        else:
+            location = getattr(game_state, 'current_location', None)
+            location_changed, self._last_location = location != self._last_location, location
+        if changes is not None and player not in changes and not location_changed:
+            return
+
         # Mise à jour métriques depuis autres components
         self._update_metrics_from_components(player, progression_comp, game_state)
 
@@ -65,14 +108,18 @@ class ProgressionSystem(System):
             progression_comp.update_metric("techniques_mastered", len(seduction_comp.mastered_techniques))
             progression_comp.update_metric("success_rate", seduction_comp.success_rate)
 
-        # Stats depuis StatsComponent
-        stats_comp = player.get_component_of_type(StatsComponent)
-        if stats_comp:
-            current_arousal = getattr(stats_comp, 'excitation', 0)
-            current_resistance = getattr(stats_comp, 'volonte', 100)
+        # Stats: extrêmes reçus par StatChanged, sinon relus dans StatsComponent
+        if self._events is not None:
+            for metric, value in self._stat_extremes.pop(player.id, {}).items():
+                progression_comp.update_metric(metric, value, "max" if metric == "max_arousal_reached" else "min")
+        else:
+            stats_comp = player.get_component_of_type(StatsComponent)
+            if stats_comp:
+                current_arousal = getattr(stats_comp, 'excitation', 0)
+                current_resistance = getattr(stats_comp, 'volonte', 100)
 
-            progression_comp.update_metric("max_arousal_reached", current_arousal, "max")
-            progression_comp.update_metric("min_resistance_reached", current_resistance, "min")
+                progression_comp.update_metric("max_arousal_reached", current_arousal, "max")
+                progression_comp.update_metric("min_resistance_reached", current_resistance, "min")
 
         # Stats depuis GameState
         if game_state:
@@ -160,9 +207,10 @@ class ProgressionSystem(System):
                 name=achievement_data.get("name", achievement_id),
                 description=achievement_data.get("description", ""),
                 category=achievement_data.get("category", "general"),
-                requirements=achievement_data.get("requirements", {}),
+                # Copies mutables: l'achievement vit dans le component (sauvegardé)
+                requirements=thaw(achievement_data.get("requirements", {})),
                 reward_type=achievement_data.get("reward_type", "points"),
-                reward_data=achievement_data.get("reward_data", 10),
+                reward_data=thaw(achievement_data.get("reward_data", 10)),
                 is_secret=achievement_data.get("is_secret", False)
             )
 
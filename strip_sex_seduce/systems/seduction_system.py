@@ -6,33 +6,52 @@ from core.entity import Entity
 from components.seduction import SeductionComponent, SeductionTechnique
 from components.stats import StatsComponent
 from components.progression import ProgressionComponent
-from typing import List, Dict, Any, Optional
-import random
+from typing import List, Dict, Any, Optional, Set
 import math
 
 class SeductionSystem(System):
     """System pour mécaniques séduction et calcul effectiveness"""
 
+    required_components = (SeductionComponent,)
+    watched_components = (SeductionComponent,)
+    writes = (SeductionComponent,)
+
     def __init__(self):
         super().__init__("SeductionSystem")
         self.technique_definitions = self._load_technique_definitions()
         self.effectiveness_cache = {}  # Cache calculs
 
+        # Entities avec cooldowns/effets en cours: traitées même sans changement
+        self._ticking: Set[str] = set()
+        self._last_context: Optional[Dict[str, Any]] = None
+
     def update(self, entities: List[Entity], delta_time: float = 0.0, **kwargs):
         """Update système séduction"""
-        for entity in entities:
-            seduction_comp = entity.get_component_of_type(SeductionComponent)
-            if seduction_comp:
-                # Mise à jour cooldowns techniques
-                seduction_comp.update_cooldowns()
+        context = kwargs.get('context', {})
+        changes = kwargs.get("changes")
+
+        if changes is not None and context == self._last_context:
+            # Seulement les entities modifiées ou avec timers actifs
+            targets = self.iter_changed(changes, SeductionComponent, self._ticking)
+        else:
+            targets = self.iter_components(entities, SeductionComponent, kwargs.get("archetypes"))
+        self._last_context = dict(context)
+
+        for entity, seduction_comp in list(targets):
+            # Mise à jour cooldowns techniques
+            seduction_comp.update_cooldowns()
+
+            # Decay effets temporaires
+            self._decay_temporary_effects(seduction_comp)
 
-                # Decay effets temporaires
-                self._decay_temporary_effects(seduction_comp)
+            # Calcul bonuses situationnels
+            if context:
+                self._update_situational_bonuses(entity, seduction_comp, context)
 
-                # Calcul bonuses situationnels
-                context = kwargs.get('context', {})
-                if context:
-                    self._update_situational_bonuses(entity, seduction_comp, context)
+            if seduction_comp.technique_cooldowns or getattr(seduction_comp, 'temporary_bonuses', None):
+                self._ticking.add(entity.id)
+            else:
+                self._ticking.discard(entity.id)
 
     def calculate_seduction_effectiveness(self, player_entity: Entity, action_data: Dict[str, Any], npc_entity: Entity, context: Dict[str, Any]) -> Dict[str, Any]:
         """Calcul effectiveness action séduction sur NPC"""
@@ -240,7 +259,7 @@ class SeductionSystem(System):
 
         # Calcul final avec variabilité
         final_impact = base_arousal_impact * impact_multiplier * privacy_factor
-        final_impact *= random.uniform(0.8, 1.2)  # ±20% variabilité
+        final_impact *= self.rng.uniform(0.8, 1.2)  # ±20% variabilité
 
         return max(1, int(round(final_impact)))
 
@@ -6,17 +6,110 @@ Correctif: Stats mises à jour visibles + équilibrage progression
 from core.system import System
 from core.entity import Entity
 from components.stats import StatsComponent
-from typing import List, Dict, Any, Optional
-import random
+from core.assets import AssetRegistry
+from core.action_index import get_action_index, action_catalog_sources, register_action_catalog
+from core.stat_store import StatStore, NUMPY_AVAILABLE
+from core.events import EventBus, ThresholdCrossed
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Sequence, Tuple, Union
+
+# Effet d'une action absente de balance.json
+DEFAULT_ACTION_EFFECT = {"volonte": -1, "excitation": 2}
+
+# Niveau escalation par action (1-5), 2 par défaut
+ESCALATION_LEVELS = {
+    # Niveau 1 - Actions sociales
+    "compliment": 1, "regard_insistant": 1, "conversation_charme": 1,
+
+    # Niveau 2 - Contact léger
+    "contact_epaule": 2, "rapprochement_physique": 2,
+
+    # Niveau 3 - Contact modéré
+    "main_cuisse": 3, "caresses_douces": 3,
+
+    # Niveau 4 - Actions intimes
+    "baiser_leger": 4, "caresses": 4,
+
+    # Niveau 5 - Actions très intimes
+    "baiser_profond": 5, "caresses_intimes": 5, "removal_vetement": 5
+}
 
 class StatsSystem(System):
     """System stats avec affichage temps réel et équilibrage amélioré"""
 
+    required_components = (StatsComponent,)
+    writes = (StatsComponent,)
+    asset_keys = tuple(action_catalog_sources())
+
     def __init__(self):
         super().__init__("StatsSystem")
 
-        # ÉQUILIBRAGE V2.0 - Progression fluide garantie
-        self.action_effects = {
+        # Effets et modificateurs de lieu: balance.json (rechargeable à chaud)
+        self.action_effects = {}
+        self.location_modifiers = {}
+        self.reload_assets()
+
+        # Messages de transition seuils pour feedback
+        self.threshold_messages = {
+            "vulnerable_entered": "💔 Tu te sens plus vulnérable à ses avances...",
+            "aroused_entered": "🔥 Tu ne peux plus ignorer ton excitation croissante...",
+            "submissive_entered": "😵 Ta volonté s'effrite dangereusement...",
+            "climax_ready_entered": "💥 Ton corps tout entier réclame plus..."
+        }
+
+        # Derniers seuils pour détection changements (sans World: comparaison à chaque update)
+        self._last_thresholds = {}
+
+        # Messages de seuils en attente d'affichage, par entity (avec World: ThresholdCrossed)
+        self._threshold_feedback: Dict[str, List[str]] = {}
+
+    def reload_assets(self):
+        """Effets d'actions et modificateurs de lieu depuis balance.json (défauts si absents)"""
+        balance = AssetRegistry.load_json("assets/config/balance.json", dict).get("stats_effects", {})
+        action_effects = balance.get("action_effects") or self._get_default_action_effects()
+        location_modifiers = balance.get("location_modifiers") or self._get_default_location_modifiers()
+        self.action_effects, self.location_modifiers = action_effects, location_modifiers
+
+        # Tables indexées par id d'action (index reconstruit si un catalogue change)
+        self.action_index = get_action_index()
+        names = self.action_index.names
+        self._effects_by_id = tuple(action_effects.get(name, DEFAULT_ACTION_EFFECT) for name in names)
+        self._escalation_by_id = tuple(ESCALATION_LEVELS.get(name, 2) for name in names)
+
+        # Table figée (action, lieu) -> deltas finaux: effect_table[id][ligne de lieu]
+        # Dernière ligne = action inconnue (DEFAULT_ACTION_EFFECT), lieu inconnu -> bar
+        self.location_rows: Mapping[str, int] = MappingProxyType(
+            {location: row for row, location in enumerate(location_modifiers)})
+        self._bar_row = self.location_rows.get("bar", 0)
+        self._default_action_row = len(names)
+        self.effect_table: Tuple[Tuple[Mapping[str, int], ...], ...] = tuple(
+            tuple(self._final_effects(effect, modifiers) for modifiers in location_modifiers.values())
+            for effect in self._effects_by_id + (DEFAULT_ACTION_EFFECT,))
+        self._effect_arrays = None  # Tableau NumPy du mode batch, reconstruit à la demande
+
+    @staticmethod
+    def _final_effects(effect: Dict[str, int], modifiers: Dict[str, float]) -> Mapping[str, int]:
+        """Effet de base x modificateurs du lieu (troncature int), en lecture seule"""
+        final_effects = {}
+        for stat, value in effect.items():
+            if stat == "volonte":
+                final_effects[stat] = int(value * modifiers["volonte_mult"])
+            elif stat == "excitation":
+                final_effects[stat] = int(value * modifiers["excitation_mult"])
+            else:
+                final_effects[stat] = value
+        return MappingProxyType(final_effects)
+
+    def get_effect(self, action: str, location: str = "bar") -> Mapping[str, int]:
+        """Deltas finaux d'une action NPC dans un lieu, sans rien appliquer (IA, simulations)"""
+        action_id = self.action_index.get_id(action)
+        return self.effect_table[action_id if action_id >= 0 else self._default_action_row][
+            self.location_rows.get(location, self._bar_row)]
+
+    @staticmethod
+    def _get_default_action_effects() -> Dict[str, Dict[str, int]]:
+        """ÉQUILIBRAGE V2.0 - Progression fluide garantie"""
+        return {
             # Actions douces - progression graduelle
             "compliment": {"volonte": -3, "excitation": 4},
             "regard_insistant": {"volonte": -2, "excitation": 6}, 
@@ -40,37 +133,41 @@ class StatsSystem(System):
             "removal_vetement": {"volonte": -25, "excitation": 35}
         }
 
-        # Modificateurs par lieu pour réalisme
-        self.location_modifiers = {
+    @staticmethod
+    def _get_default_location_modifiers() -> Dict[str, Dict[str, float]]:
+        """Modificateurs par lieu pour réalisme"""
+        return {
             "bar": {"volonte_mult": 1.2, "excitation_mult": 0.8},      # Plus résistance public
             "voiture": {"volonte_mult": 1.0, "excitation_mult": 1.1},   # Équilibré
             "salon": {"volonte_mult": 0.8, "excitation_mult": 1.3},     # Moins résistance privé
             "chambre": {"volonte_mult": 0.6, "excitation_mult": 1.5}    # Très excitant privé
         }
 
-        # Messages de transition seuils pour feedback
-        self.threshold_messages = {
-            "vulnerable_entered": "💔 Tu te sens plus vulnérable à ses avances...",
-            "aroused_entered": "🔥 Tu ne peux plus ignorer ton excitation croissante...",
-            "submissive_entered": "😵 Ta volonté s'effrite dangereusement...",
-            "climax_ready_entered": "💥 Ton corps tout entier réclame plus..."
-        }
+    def subscribe_events(self, events: EventBus):
+        events.subscribe(ThresholdCrossed, self._on_threshold_crossed)
 
-        # Derniers seuils pour détection changements
-        self._last_thresholds = {}
+    def _on_threshold_crossed(self, event: ThresholdCrossed):
+        """Seuil atteint: message de feedback mis en attente pour l'entity"""
+        message = self.threshold_messages.get(f"{event.threshold}_entered") if event.active else None
+        if message:
+            self._threshold_feedback.setdefault(event.entity_id, []).append(message)
+
+    def pop_threshold_messages(self, entity_id: str) -> List[str]:
+        """Messages de seuils atteints depuis le dernier appel (affichage)"""
+        return self._threshold_feedback.pop(entity_id, [])
 
     def update(self, entities: List[Entity], delta_time: float = 0.0, **kwargs):
         """Update avec gestion effets temporaires + seuils"""
 
-        # Filtrage entities avec stats
-        for entity in entities:
-            stats = entity.get_component_of_type(StatsComponent)
-            if stats and stats.is_dirty:
+        # Filtrage entities avec stats (colonnes World si disponibles)
+        for entity, stats in self.iter_components(entities, StatsComponent, kwargs.get("archetypes")):
+            if stats.is_dirty:
                 # Decay effets temporaires
                 stats.apply_temporary_effects_decay(decay_rate=0.9)
 
-                # Check transitions seuils pour feedback
-                self._check_threshold_transitions(entity, stats)
+                # Transitions seuils: événements ThresholdCrossed avec un World, sinon comparaison
+                if self._events is None:
+                    self._check_threshold_transitions(entity, stats)
 
                 stats.mark_clean()
 
@@ -98,22 +195,11 @@ class StatsSystem(System):
             "thresholds": stats.thresholds.copy()
         }
 
-        # Récupération effets base
-        base_effects = self.action_effects.get(action, {"volonte": -1, "excitation": 2})
-
-        # APPLICATION MODIFICATEURS CONTEXTUELS
+        # Effets finaux précalculés (nom -> id à l'entrée, table par id ensuite)
+        action_id = self.action_index.get_id(action)
         location = context.get("location", "bar")
-        location_mod = self.location_modifiers.get(location, self.location_modifiers["bar"])
-
-        # Calcul effets finaux avec modificateurs
-        final_effects = {}
-        for stat, value in base_effects.items():
-            if stat == "volonte":
-                final_effects[stat] = int(value * location_mod["volonte_mult"])
-            elif stat == "excitation":  
-                final_effects[stat] = int(value * location_mod["excitation_mult"])
-            else:
-                final_effects[stat] = value
+        final_effects = self.effect_table[action_id if action_id >= 0 else self._default_action_row][
+            self.location_rows.get(location, self._bar_row)]
 
         # APPLICATION RÉELLE avec feedback
         changes_made = {}
@@ -141,12 +227,59 @@ class StatsSystem(System):
             "stats_before": stats_before,
             "stats_after": stats_after,
             "changes_made": changes_made,
-            "effects_applied": final_effects,
+            "effects_applied": dict(final_effects),
             "location_modified": location != "bar",
             "visible_change": significant_change,
-            "escalation_level": self._calculate_escalation_level(action)
+            "escalation_level": self._escalation_by_id[action_id] if action_id >= 0 else 2
         }
 
+    def apply_npc_action_batch(self, players: Sequence[Entity], actions: Sequence[str],
+                               locations: Union[str, Sequence[str]] = "bar",
+                               record_history: bool = True) -> Dict[str, Any]:
+        """
+        apply_npc_action pour N joueurs à la fois (simulation en lot, scènes de foule)
+        Vectorisé via StatStore si NumPy est installé, sinon boucle: mêmes résultats
+        record_history=False (mode NumPy): pas d'historique par joueur
+
+        Returns:
+            Dict {"vectorized", "changes": {"volonte": [...], "excitation": [...]}} par joueur
+        """
+        if isinstance(locations, str):
+            locations = [locations] * len(players)
+        rows = [(player, player.get_component_of_type(StatsComponent), action, location)
+                for player, action, location in zip(players, actions, locations)]
+        rows = [row for row in rows if row[1] is not None]
+
+        if not NUMPY_AVAILABLE:
+            changes = {"volonte": [], "excitation": []}
+            for player, _, action, location in rows:
+                result = self.apply_npc_action(player, action, {"location": location})
+                for stat in changes:
+                    changes[stat].append(result["changes_made"].get(stat, 0))
+            return {"vectorized": False, "changes": changes}
+
+        default_row, bar_row = self._default_action_row, self._bar_row
+        action_rows = []
+        for _, _, action, _ in rows:
+            action_id = self.action_index.get_id(action)
+            action_rows.append(action_id if action_id >= 0 else default_row)
+
+        store = StatStore([component for _, component, _, _ in rows])
+        actual = store.apply_actions(self._get_effect_arrays(), action_rows,
+                                     [self.location_rows.get(location, bar_row) for _, _, _, location in rows],
+                                     sources=[f"npc_{action}" for _, _, action, _ in rows])
+        store.flush(record_history)
+        return {"vectorized": True, "changes": {stat: values.tolist() for stat, values in actual.items()}}
+
+    def _get_effect_arrays(self):
+        """effect_table en tableau NumPy (n_actions + 1, n_lieux, 2) [volonte, excitation]"""
+        if self._effect_arrays is None:
+            import numpy as np
+            self._effect_arrays = np.array([[[effect.get("volonte", 0), effect.get("excitation", 0)]
+                                             for effect in row] for row in self.effect_table], dtype=np.int32)
+            self._effect_arrays.setflags(write=False)
+        return self._effect_arrays
+
     def apply_player_resistance(self, player: Entity, 
                               resistance_type: str,
                               context: Dict[str, Any]) -> Dict[str, Any]:
@@ -190,7 +323,7 @@ class StatsSystem(System):
         params = resistance_params.get(resistance_type, resistance_params["soft_resistance"])
 
         # Test réussite
-        success = random.random() < params["success_chance"]
+        success = self.rng.random() < params["success_chance"]
 
         # Application selon contexte lieu  
         location = context.get("location", "bar")
@@ -224,24 +357,8 @@ class StatsSystem(System):
 
     def _calculate_escalation_level(self, action: str) -> int:
         """Calcule niveau escalation action (1-5)"""
-        escalation_map = {
-            # Niveau 1 - Actions sociales
-            "compliment": 1, "regard_insistant": 1, "conversation_charme": 1,
-
-            # Niveau 2 - Contact léger
-            "contact_epaule": 2, "rapprochement_physique": 2,
-
-            # Niveau 3 - Contact modéré 
-            "main_cuisse": 3, "caresses_douces": 3,
-
-            # Niveau 4 - Actions intimes
-            "baiser_leger": 4, "caresses": 4,
-
-            # Niveau 5 - Actions très intimes
-            "baiser_profond": 5, "caresses_intimes": 5, "removal_vetement": 5
-        }
-
-        return escalation_map.get(action, 2)  # Default niveau 2
+        action_id = self.action_index.get_id(action)
+        return self._escalation_by_id[action_id] if action_id >= 0 else 2
 
     def _check_threshold_transitions(self, entity: Entity, stats: StatsComponent):
         """Détecte transitions seuils et génère feedback"""
@@ -264,10 +381,9 @@ class StatsSystem(System):
         # Stockage pour prochaine fois
         self._last_thresholds[entity_id] = current_thresholds
 
-        # Ajout messages au contexte pour affichage
-        if messages and hasattr(entity, 'get_component_of_type'):
-            dialogue_comp = entity.get_component_of_type(type(None))  # Simplified pour perf
-            # Messages seront affichés par game_session
+        # Messages en attente d'affichage (pop_threshold_messages)
+        if messages:
+            self._threshold_feedback.setdefault(entity_id, []).extend(messages)
 
         return messages
 
@@ -302,4 +418,7 @@ class StatsSystem(System):
             "has_status": len(status_indicators) > 0
         }
 
+# Actions NPC par défaut (balance.json sans action_effects)
+register_action_catalog("stats_system", StatsSystem._get_default_action_effects(), npc=True)
+
 # OPTIMISÉ: Affichage temps réel + équilibrage + feedback seuils
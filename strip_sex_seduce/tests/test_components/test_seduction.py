@@ -0,0 +1,35 @@
+"""Tests SeductionComponent"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from components.seduction import SeductionComponent, SeductionTechnique
+from core.rng import SessionRNG
+
+class TestSeductionComponent(unittest.TestCase):
+
+    def _play(self, seed):
+        seduction = SeductionComponent()
+        seduction.learn_technique(SeductionTechnique("regard", "Regard", "subtle", 0.5, 5))
+        rng = SessionRNG(seed).stream("SeductionSystem")
+        return [seduction.use_technique("regard", {}, rng)["success"] for _ in range(20)], rng
+
+    def test_use_technique_draws_from_session_stream(self):
+        first, rng = self._play(12)
+        second, _ = self._play(12)
+
+        self.assertEqual(first, second)
+        self.assertEqual(rng.draws, 20)
+
+    def test_cooldown_applied(self):
+        seduction = SeductionComponent()
+        seduction.learn_technique(SeductionTechnique("baiser", "Baiser", "direct", 0.9, 10, cooldown_turns=2))
+        rng = SessionRNG(1).stream("SeductionSystem")
+
+        seduction.use_technique("baiser", {}, rng)
+        self.assertEqual(seduction.use_technique("baiser", {}, rng)["error"], "Technique en cooldown")
+
+if __name__ == '__main__':
+    unittest.main()
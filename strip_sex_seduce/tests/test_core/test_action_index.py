@@ -0,0 +1,69 @@
+"""Tests index des alias d'actions"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.action_index import ActionIndex, get_action_index, register_action_catalog
+from core.assets import AssetRegistry
+from systems.menu_system import MenuSystem, MENU_ACTION_TIERS
+from systems.stats_system import StatsSystem
+
+class TestActionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ActionIndex(StatsSystem._get_default_action_effects(), ["dialogue_flirt"])
+
+    def test_exact_and_alias_resolution(self):
+        self.assertEqual(self.index.resolve("main_cuisse"), "main_cuisse")
+        self.assertEqual(self.index.resolve("Embrasser_doucement"), "baiser_leger")
+        self.assertEqual(self.index.resolve("se rapprocher de lui"), "rapprochement_physique")
+        self.assertEqual(self.index.resolve("recaresser"), "caresses_douces")
+        self.assertEqual(self.index.resolve("danser"), "compliment")
+
+    def test_unknown_names_memoized(self):
+        for _ in range(3):
+            self.index.resolve("parler_doucement")
+        memo = self.index.get_stats()["memo"]
+        self.assertEqual((memo["misses"], memo["hits"]), (1, 2))
+
+    def test_dense_ids_and_masks(self):
+        npc_count = len(self.index.npc_actions)
+        self.assertEqual(self.index.names[:npc_count], self.index.npc_actions)
+        self.assertEqual(self.index.get_id("dialogue_flirt"), npc_count)
+        self.assertEqual(self.index.get_id("inconnue"), -1)
+        self.assertLess(self.index.resolve_id("embrasser"), npc_count)
+
+        mask = self.index.mask(["caresses", "compliment", "inconnue"])
+        self.assertEqual(self.index.names_in(mask), ["compliment", "caresses"])
+
+    def test_shared_index_covers_catalogs(self):
+        index = get_action_index()
+        self.assertIs(index, get_action_index())
+        self.assertTrue(index.is_npc_action("caresses_intimes"))
+        self.assertTrue(index.is_player_action("dialogue_flirt"))
+        menu_actions = [name for _, names in MENU_ACTION_TIERS for name in names]
+        self.assertNotIn(-1, [index.get_id(name) for name in menu_actions])  # Catalogue enregistré
+
+    def test_reload_replaces_id_tables_under_fixed_key(self):
+        stats, menu = StatsSystem(), MenuSystem()
+        for system in (stats, menu):
+            system.track_assets()
+        assets = AssetRegistry.get_stats()["assets"]
+
+        register_action_catalog("test_catalog", ["geste_test"])
+        try:
+            self.assertTrue(stats.assets_changed() and menu.assets_changed())
+            for system in (stats, menu):
+                system.reload_assets()
+            index = get_action_index()
+            self.assertIs(stats.action_index, index)
+            self.assertEqual(len(stats._effects_by_id), len(index.names))
+            self.assertEqual(menu._tier_masks["base"], index.mask(MENU_ACTION_TIERS[0][1]))
+            self.assertEqual(AssetRegistry.get_stats()["assets"], assets)  # Pas d'entrée par version
+        finally:
+            register_action_catalog("test_catalog", ())  # Catalogue vidé pour les autres tests
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""Tests registre d'assets partagé"""
+
+import unittest
+import tempfile
+import json
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.assets import AssetRegistry, freeze, thaw
+from core.asset_bundle import build_bundle, read_bundle
+from core.asset_watcher import AssetWatcher
+from core.system import System, SystemManager
+from systems.stats_system import StatsSystem
+from core.headless import HeadlessRunner, ScriptedInput
+
+class TestAssetRegistry(unittest.TestCase):
+
+    def test_freeze_is_read_only(self):
+        frozen = freeze({"actions": [{"name": "a"}], "tags": {"x"}})
+
+        with self.assertRaises(TypeError):
+            frozen["actions"] = []
+        self.assertEqual(frozen["actions"], ({"name": "a"},))
+        self.assertEqual(thaw(frozen), {"actions": [{"name": "a"}], "tags": {"x"}})
+
+    def test_builder_called_once(self):
+        calls = []
+        key = "test:builder_called_once"
+        AssetRegistry.invalidate(key)
+
+        first = AssetRegistry.get(key, lambda: calls.append(1) or {"v": [1, 2]})
+        second = AssetRegistry.get(key, lambda: calls.append(1) or {"v": [1, 2]})
+
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+        AssetRegistry.invalidate(key)
+
+    def test_derived_asset_replaced_under_fixed_key(self):
+        source, key = "test:derived_source", "test:derived"
+        AssetRegistry.put(source, {"v": 1})
+        build = lambda: {"v": AssetRegistry.get(source, dict)["v"] * 10}
+
+        first = AssetRegistry.get_derived(key, [source], build)
+        self.assertIs(AssetRegistry.get_derived(key, [source], build), first)
+        assets = AssetRegistry.get_stats()["assets"]
+
+        AssetRegistry.put(source, {"v": 2})
+        second = AssetRegistry.get_derived(key, [source], build)
+        self.assertEqual(second["v"], 20)
+        self.assertEqual(AssetRegistry.get_stats()["assets"], assets)  # Pas d'entrée par version
+        AssetRegistry.invalidate(key)
+        AssetRegistry.invalidate(source)
+
+    def test_sessions_share_tables(self):
+        sessions = []
+        for seed in (1, 2):
+            runner = HeadlessRunner(ScriptedInput(["a"]), max_turns=1, seed=seed)
+            runner.run()
+            sessions.append(runner.session)
+
+        first, second = sessions
+        self.assertIs(first.environments["bar"].contextual_actions,
+                      second.environments["bar"].contextual_actions)
+
+        first_dialogue = first.system_manager.get_system("DialogueSystem")
+        second_dialogue = second.system_manager.get_system("DialogueSystem")
+        self.assertIs(first_dialogue.dialogue_index, second_dialogue.dialogue_index)
+
+class TestAssetBundle(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        os.makedirs(os.path.join(self.root, "assets", "config"))
+        self._write("assets/config/balance.json", {"difficulty": 1})
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, rel, data):
+        with open(os.path.join(self.root, rel), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def test_bundle_round_trip(self):
+        build_bundle(self.root)
+        assets, reason = read_bundle(self.root)
+
+        self.assertEqual(reason, "ok")
+        self.assertEqual(assets, {"assets/config/balance.json": {"difficulty": 1}})
+
+    def test_stale_bundle_rejected(self):
+        build_bundle(self.root)
+        self._write("assets/config/balance.json", {"difficulty": 22})
+
+        self.assertEqual(read_bundle(self.root), (None, "périmé"))
+
+class _TableSystem(System):
+    asset_keys = ("assets/config/test_hot_reload.json",)
+
+    def __init__(self):
+        super().__init__("TableSystem")
+        self.reload_assets()
+
+    def reload_assets(self):
+        self.table = AssetRegistry.load_json(self.asset_keys[0], dict)
+
+    def update(self, entities, delta_time=0.0, **kwargs):
+        pass
+
+class TestHotReload(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        self.rel = _TableSystem.asset_keys[0]
+        os.makedirs(os.path.join(self.root, "assets", "config"))
+        self._write('{"volonte": 1}')
+        AssetRegistry.put(self.rel, {"volonte": 1})
+        self.watcher = AssetWatcher(root=self.root, interval=0, paths=[self.rel])
+
+    def tearDown(self):
+        AssetRegistry.invalidate(self.rel)
+        AssetRegistry.invalidate("assets/config/balance.json")
+        self.tmpdir.cleanup()
+
+    def _write(self, text):
+        with open(os.path.join(self.root, self.rel), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_changed_file_swapped_between_turns(self):
+        manager = SystemManager()
+        system = _TableSystem()
+        manager.add_system(system)
+
+        self._write('{"volonte": 22}')
+        self.assertEqual(self.watcher.poll(force=True), [self.rel])
+        self.assertEqual(system.table["volonte"], 1)  # Rien avant refresh_assets
+
+        self.assertEqual(manager.refresh_assets(), ["TableSystem"])
+        self.assertEqual(system.table["volonte"], 22)
+        self.assertEqual(manager.refresh_assets(), [])
+
+    def test_invalid_json_keeps_previous_version(self):
+        self._write('{"volonte": ')
+
+        self.assertEqual(self.watcher.poll(force=True), [])
+        self.assertEqual(AssetRegistry.load_json(self.rel)["volonte"], 1)
+        self.assertEqual(self.watcher.stats["errors"], 1)
+
+    def test_stats_system_reloads_balance(self):
+        manager = SystemManager()
+        stats_system = StatsSystem()
+        manager.add_system(stats_system)
+
+        AssetRegistry.put("assets/config/balance.json", {
+            "stats_effects": {"action_effects": {"compliment": {"volonte": -50, "excitation": 1}}}
+        })
+        manager.refresh_assets()
+
+        self.assertEqual(stats_system.action_effects["compliment"]["volonte"], -50)
+
+if __name__ == '__main__':
+    unittest.main()
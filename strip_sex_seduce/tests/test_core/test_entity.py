@@ -6,7 +6,13 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from core.entity import Entity
+from core.component import ComponentType, ComponentRegistry
 from components.stats import StatsComponent
+from components.action import ActionComponent
+from components.action_menu import ActionMenuComponent
+from components.inventory import InventoryComponent
+from components.seduction import SeductionComponent
+from components.progression import ProgressionComponent
 
 class TestEntity(unittest.TestCase):
 
@@ -32,5 +38,39 @@ class TestEntity(unittest.TestCase):
         self.assertIsNotNone(retrieved)
         self.assertEqual(retrieved, stats)
 
+    def test_v2_components_do_not_collide(self):
+        components = [
+            StatsComponent(), ActionComponent(), ActionMenuComponent(),
+            InventoryComponent(), SeductionComponent(), ProgressionComponent()
+        ]
+        for component in components:
+            self.entity.add_component(component)
+
+        self.assertEqual(len(self.entity.get_all_components()), len(components))
+        for component in components:
+            self.assertIs(self.entity.get_component_of_type(type(component)), component)
+
+    def test_lookup_by_type_or_class(self):
+        inventory = InventoryComponent()
+        self.entity.add_component(inventory)
+
+        self.assertIs(self.entity.get_component(ComponentType.INVENTORY), inventory)
+        self.assertIs(self.entity.get_component(InventoryComponent), inventory)
+        self.assertTrue(self.entity.has_component(InventoryComponent))
+        self.assertIsNone(self.entity.get_component_of_type(type(None)))
+
+        self.assertTrue(self.entity.remove_component(InventoryComponent))
+        self.assertFalse(self.entity.has_component(ComponentType.INVENTORY))
+
+    def test_subclass_resolves_to_registered_type(self):
+        class CustomStats(StatsComponent):
+            pass
+
+        self.assertEqual(ComponentRegistry.key_for(CustomStats), ComponentType.STATS)
+
+        custom = CustomStats()
+        self.entity.add_component(custom)
+        self.assertIs(self.entity.get_component_of_type(StatsComponent), custom)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+"""Tests bus d'événements"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.entity import Entity
+from core.world import World
+from core.events import EventBus, ThresholdCrossed, StatChanged, LocationChanged
+from components.stats import StatsComponent
+from entities.game_state import GameState
+from systems.inventory_system import InventorySystem
+
+class TestEventBus(unittest.TestCase):
+
+    def test_sync_and_deferred_delivery(self):
+        bus = EventBus()
+        received, deferred = [], []
+        bus.subscribe(LocationChanged, received.append)
+        bus.subscribe(LocationChanged, deferred.append, deferred=True)
+
+        event = LocationChanged("bar", "voiture", 1)
+        bus.emit(event)
+        bus.emit(StatChanged("p", "volonte", 100, 90, "test"))  # Sans abonné: ignoré
+
+        self.assertEqual(received, [event])
+        self.assertEqual((deferred, bus.pending()), ([], 1))
+        self.assertEqual(bus.flush(), 1)
+        self.assertEqual(deferred, [event])
+
+    def test_unsubscribe(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(LocationChanged, received.append)
+        self.assertTrue(bus.unsubscribe(LocationChanged, received.append))
+        self.assertFalse(bus.has_subscribers(LocationChanged))
+        bus.emit(LocationChanged("bar", "salon", 2))
+        self.assertEqual(received, [])
+
+class TestWorldEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.world = World()
+        self.events = []
+        for event_type in (ThresholdCrossed, StatChanged, LocationChanged):
+            self.world.events.subscribe(event_type, self.events.append)
+
+    def test_stats_component_emits_threshold_crossed(self):
+        stats = StatsComponent()
+        self.world.add_entity(Entity("p").add_component(stats))
+
+        stats.apply_modifier("volonte", -70, source="test")
+        stats.apply_modifier("volonte", -5, source="test")  # Aucun seuil franchi
+
+        crossed = [(e.threshold, e.active) for e in self.events if isinstance(e, ThresholdCrossed)]
+        self.assertEqual(crossed, [("vulnerable", True)])
+        self.assertEqual(sum(isinstance(e, StatChanged) for e in self.events), 2)
+
+    def test_detached_component_emits_nothing(self):
+        StatsComponent().apply_modifier("excitation", 90)
+        self.assertEqual(self.events, [])
+
+    def test_item_effects_go_through_apply_modifier(self):
+        entity = Entity("p").add_component(StatsComponent())
+        self.world.add_entity(entity)
+        item = {"effects": {"libido_boost": 10, "disinhibition": 5}}
+
+        applied = InventorySystem()._apply_item_effects(entity, item, None, {})
+
+        changes = [(e.stat, e.new_value, e.source) for e in self.events if isinstance(e, StatChanged)]
+        self.assertEqual(changes, [("excitation", 10, "item_libido_boost"), ("volonte", 95, "item_disinhibition")])
+        self.assertEqual(applied["volonte"], {"old": 100, "new": 95, "change": -5})
+
+    def test_change_location_emits(self):
+        game_state = GameState()
+        self.world.add_entity(game_state)
+        game_state.change_location("salon")
+        game_state.change_location("salon")
+        self.assertEqual(self.events, [LocationChanged("bar", "salon", 0)])
+
+if __name__ == '__main__':
+    unittest.main()
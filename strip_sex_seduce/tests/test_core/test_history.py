@@ -0,0 +1,57 @@
+"""Tests historiques bornés"""
+
+import unittest
+import pickle
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.history import HistoryBuffer
+from core.clock import SessionClock, format_tick
+from core.save_journal import _apply_fields
+from components.stats import StatsComponent, StatChange
+
+class TestHistoryBuffer(unittest.TestCase):
+
+    def test_wraps_at_capacity(self):
+        history = HistoryBuffer(3, range(5))
+
+        self.assertEqual(list(history), [2, 3, 4])
+        self.assertEqual((len(history), history.total), (3, 5))
+        self.assertEqual((history[0], history[-1]), (2, 4))
+        self.assertEqual(history[-2:], [3, 4])
+        self.assertEqual(history.latest(10), [2, 3, 4])
+
+    def test_records_keep_key_access(self):
+        stats = StatsComponent()
+        stats.apply_modifier("volonte", -10, source="test")
+
+        entry = stats.history[-1]
+        self.assertIsInstance(entry, StatChange)
+        self.assertEqual((entry["stat"], entry.actual_change), ("volonte", -10))
+        self.assertEqual(stats.to_dict()["history"][0]["source"], "test")
+
+    def test_clock_stamps_formatted_lazily(self):
+        SessionClock().start_turn(7)
+        stats = StatsComponent()
+        stats.apply_modifier("excitation", 5)
+
+        entry = stats.history[-1]
+        self.assertEqual(entry.turn, 7)
+        self.assertIsInstance(entry.tick, int)
+        self.assertEqual(entry["timestamp"], format_tick(entry.tick))
+        self.assertEqual(entry.to_dict()["timestamp"], entry.timestamp)
+
+    def test_pickle_and_append_delta(self):
+        history = HistoryBuffer(4, "abcdef")
+        restored = pickle.loads(pickle.dumps(history))
+        self.assertEqual(restored, history)
+        self.assertEqual(restored.total, 6)
+
+        state = {"history": restored}
+        _apply_fields(state, {"history": ("append", ["g", "h"])})
+        self.assertEqual(list(state["history"]), ["e", "f", "g", "h"])
+        self.assertEqual(list(restored), ["c", "d", "e", "f"])
+
+if __name__ == '__main__':
+    unittest.main()
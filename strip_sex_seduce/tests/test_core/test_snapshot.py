@@ -0,0 +1,152 @@
+"""Tests snapshots binaires de session"""
+
+import unittest
+import tempfile
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.headless import HeadlessRunner, ScriptedInput, NullOutput
+from core.game_session_v2 import GameSessionV2
+from core.snapshot import capture_session, read_snapshot, write_snapshot, restricted_loads, SnapshotError
+from core.save_journal import SaveJournal, read_journal
+from contextlib import redirect_stdout
+
+COMMANDS = ["a", "r", "a", "f", "a", "look", "a"]
+
+class TestSessionSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "session.snap")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _load(self):
+        with redirect_stdout(NullOutput()):
+            return GameSessionV2.load(self.path)
+
+    def test_round_trip_restores_full_state(self):
+        runner = HeadlessRunner(ScriptedInput(COMMANDS, loop=True), max_turns=12, seed=4)
+        runner.run()
+        runner.session.save(self.path)
+
+        restored = self._load()
+
+        self.assertEqual(capture_session(restored), capture_session(runner.session))
+        self.assertEqual(restored.game_state.turn_count, 12)
+
+    def test_resumed_session_continues_identically(self):
+        full = HeadlessRunner(ScriptedInput(COMMANDS, loop=True), max_turns=20, seed=4)
+        full_report = full.run()
+
+        first = HeadlessRunner(ScriptedInput(COMMANDS, loop=True), max_turns=6, seed=4)
+        first.run()
+        first.session.save(self.path)
+
+        # Reprise au même point du script (input 7: "a")
+        resumed = HeadlessRunner(ScriptedInput(COMMANDS[6:] + COMMANDS, loop=True), max_turns=20)
+        resumed.create_session = self._load
+        resumed_report = resumed.run()
+
+        self.assertEqual(resumed_report["final_stats"], full_report["final_stats"])
+        self.assertEqual([a["action"] for a in resumed.session.npc.action_history],
+                         [a["action"] for a in full.session.npc.action_history])
+
+    def test_corrupted_snapshot_rejected(self):
+        runner = HeadlessRunner(ScriptedInput(["a"]), max_turns=1, seed=1)
+        runner.run()
+        runner.session.save(self.path)
+
+        with open(self.path, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)[0]
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last ^ 0xFF]))
+
+        with self.assertRaises(SnapshotError):
+            read_snapshot(self.path)
+
+    @staticmethod
+    def _call_payload(module, name):
+        # Protocole 4: STACK_GLOBAL(module, name) puis REDUCE sans argument
+        strings = b"".join(b"\x8c" + bytes([len(text)]) + text.encode() for text in (module, name))
+        return b"\x80\x04" + strings + b"\x93)R."
+
+    def test_dotted_global_rejected(self):
+        # Attribut d'un module autorisé: os.getcwd() exécuté avant la correction
+        with self.assertRaises(SnapshotError):
+            restricted_loads(self._call_payload("core.snapshot", "os.getcwd"))
+
+    def test_non_class_global_rejected(self):
+        for module, name in (("core.snapshot", "write_snapshot"), ("core.snapshot", "os"),
+                             ("entities.npc", "random"), ("builtins", "eval")):
+            with self.assertRaises(SnapshotError, msg=f"{module}.{name}"):
+                restricted_loads(self._call_payload(module, name))
+
+class TestSaveJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "session.snap")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _play(self, turns):
+        runner = HeadlessRunner(ScriptedInput(COMMANDS, loop=True), max_turns=turns, seed=7)
+        runner.run()
+        return runner.session
+
+    def _load(self):
+        with redirect_stdout(NullOutput()):
+            return GameSessionV2.load(self.path)
+
+    def test_base_plus_deltas_restores_state(self):
+        session = self._play(5)
+        journal = SaveJournal(session, self.path)
+        journal.save_base()
+
+        for command in COMMANDS:
+            session._process_player_input(command)
+            session._update_systems()
+            session.game_state.advance_turn()
+            journal.save_delta()
+
+        restored = self._load()
+        expected, actual = capture_session(session), capture_session(restored)
+        expected.pop("rng"), actual.pop("rng")
+        self.assertEqual(actual, expected)
+        self.assertEqual(restored.game_state.turn_count, 5 + len(COMMANDS))
+
+    def test_delta_only_writes_changes(self):
+        session = self._play(5)
+        journal = SaveJournal(session, self.path)
+        base_size = journal.save_base()
+
+        session.game_state.turn_count += 1
+        session.game_state.mark_dirty()  # Écriture directe: signalée au change log
+        delta_size = journal.save_delta()
+
+        delta = read_journal(journal.journal_path)[-1]
+        self.assertEqual(delta["attrs"], {"game_state": {"turn_count": ("set", 6)}})
+        self.assertEqual(delta["components"], {})
+        self.assertLess(delta_size * 10, base_size)
+
+    def test_stale_journal_ignored(self):
+        session = self._play(5)
+        journal = SaveJournal(session, self.path)
+        journal.save_base()
+        session.game_state.turn_count += 3
+        journal.save_delta()
+
+        # Compaction interrompue: nouvelle base écrite, ancien journal resté en place
+        data = capture_session(session)
+        data["journal_id"] = "autre_base"
+        write_snapshot(self.path, data)
+
+        self.assertEqual(self._load().game_state.turn_count, 8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Tests SystemManager scheduler"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.entity import Entity
+from core.world import World
+from core.system import System, SystemManager
+from components.stats import StatsComponent
+from components.inventory import InventoryComponent
+from utils.performance import LatencyHistogram
+
+class StepSystem(System):
+    """Ajoute `step` aux stats, enregistre l'ordre de passage"""
+
+    def __init__(self, name, log, reads=(), writes=None, step=1):
+        super().__init__(name)
+        self.reads = reads
+        self.writes = writes
+        self.log = log
+        self.step = step
+
+    def update(self, entities, delta_time=0.0, **kwargs):
+        for entity in entities:
+            stats = entity.get_component_of_type(StatsComponent)
+            if stats and StatsComponent in (self.writes or ()):
+                stats.excitation = stats.excitation * 2 + self.step
+        self.log.append(self.name)
+
+class TestSystemManagerScheduler(unittest.TestCase):
+
+    def build(self, manager):
+        log = []
+        manager.add_system(StepSystem("stats_a", log, writes=(StatsComponent,), step=1), 1)
+        manager.add_system(StepSystem("inventory", log, writes=(InventoryComponent,)), 2)
+        manager.add_system(StepSystem("stats_b", log, writes=(StatsComponent,), step=3), 3)
+        manager.add_system(StepSystem("reader", log, reads=(StatsComponent,), writes=()), 4)
+        manager.add_system(StepSystem("legacy", log), 5)
+        return log
+
+    def test_schedule_respects_conflicts(self):
+        manager = SystemManager()
+        self.build(manager)
+        self.assertEqual(manager.get_schedule_report(), [
+            ["stats_a", "inventory"],
+            ["stats_b"],
+            ["reader"],
+            ["legacy"],
+        ])
+
+    def test_parallel_matches_serial(self):
+        results = []
+        for workers in (1, 4):
+            world = World()
+            entity = world.add_entity(Entity("p").add_component(StatsComponent()))
+            manager = SystemManager(world=world, max_workers=workers)
+            self.build(manager)
+            for _ in range(5):
+                manager.update_all([entity])
+            manager.shutdown()
+            results.append(entity.get_component_of_type(StatsComponent).excitation)
+        self.assertEqual(results[0], results[1])
+
+    def test_deterministic_mode_runs_in_priority_order(self):
+        manager = SystemManager(max_workers=4, deterministic=True)
+        log = self.build(manager)
+        manager.update_all([])
+        self.assertEqual(log, ["stats_a", "inventory", "stats_b", "reader", "legacy"])
+        self.assertFalse(manager.is_parallel())
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentiles_within_bucket_precision(self):
+        histogram = LatencyHistogram(window_size=50)
+        for value in range(1, 1001):
+            histogram.record_ns(value * 1000)
+
+        for percentile in (50, 95, 99):
+            exact = percentile * 10 * 1000
+            approx = histogram.percentile_ns(percentile)
+            self.assertGreaterEqual(approx, exact)
+            self.assertLessEqual(approx, exact * 1.125)
+
+        self.assertEqual(histogram.min_ns, 1000)
+        self.assertEqual(histogram.max_ns, 1000 * 1000)
+        self.assertEqual(histogram.window_percentile_ns(0), 951 * 1000)
+
+    def test_report_exposes_tail_latency(self):
+        manager = SystemManager()
+        manager.add_system(StepSystem("stats_a", [], writes=(StatsComponent,)))
+        for _ in range(10):
+            manager.update_all([])
+
+        stats = manager.get_performance_report()["stats_a"]
+        self.assertEqual(stats["total_calls"], 10)
+        self.assertLessEqual(stats["min_time"], stats["p50_time"])
+        self.assertLessEqual(stats["p99_time"], stats["max_time"])
+        self.assertEqual(stats["window_samples"], 10)
+
+if __name__ == '__main__':
+    unittest.main()
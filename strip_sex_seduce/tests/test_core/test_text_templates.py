@@ -0,0 +1,39 @@
+"""Tests templates de texte précompilés"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.text_templates import TextTemplate, TemplateError, compile_pool, make_context
+from entities.player import PlayerCharacter
+from entities.npc import NPCMale
+
+class TestTextTemplate(unittest.TestCase):
+
+    def test_render_fills_slots(self):
+        template = TextTemplate("{npc} te parle de {location}.")
+        self.assertEqual(template.fields, ("npc", "location"))
+        self.assertEqual(template.render({"npc": "Marcus", "location": "bar"}), "Marcus te parle de bar.")
+
+    def test_constant_line_returns_plain_str(self):
+        (template,) = compile_pool(["Il sourit."])
+        rendered = template.render({})
+        self.assertEqual(rendered, "Il sourit.")
+        self.assertIs(type(rendered), str)
+
+    def test_invalid_template_rejected_at_compile(self):
+        with self.assertRaises(TemplateError):
+            TextTemplate("{inconnu} sourit.")
+        with self.assertRaises(TemplateError):
+            TextTemplate("Il sourit {npc")
+
+    def test_context_from_entities(self):
+        player = PlayerCharacter()
+        context = make_context(npc=NPCMale(), player=player, clothing="ta jupe")
+        self.assertEqual(context["npc"], "Marcus")
+        self.assertEqual(context["clothing"], "ta jupe")
+        self.assertEqual(make_context(player=player)["clothing"], "tes vêtements")
+
+if __name__ == '__main__':
+    unittest.main()
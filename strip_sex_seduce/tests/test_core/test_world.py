@@ -0,0 +1,150 @@
+"""Tests World ECS"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.entity import Entity
+from core.world import World
+from core.system import System, SystemManager
+from core.component import ComponentType
+from components.stats import StatsComponent
+from components.inventory import InventoryComponent
+from components.personality import PersonalityComponent
+from entities.npc import NPCMale
+
+class RecordingSystem(System):
+    required_components = (StatsComponent,)
+
+    def __init__(self):
+        super().__init__("RecordingSystem")
+        self.seen = []
+
+    def update(self, entities, delta_time=0.0, **kwargs):
+        self.seen = [entity.id for entity, _ in
+                     self.iter_components(entities, StatsComponent, kwargs.get("archetypes"))]
+
+class WatchingSystem(System):
+    watched_components = (StatsComponent,)
+
+    def __init__(self):
+        super().__init__("WatchingSystem")
+        self.changed = []
+
+    def update(self, entities, delta_time=0.0, **kwargs):
+        self.changed = sorted(kwargs["changes"].entity_ids())
+
+class TestWorld(unittest.TestCase):
+
+    def setUp(self):
+        self.world = World()
+        self.a = Entity("a").add_component(StatsComponent())
+        self.b = Entity("b").add_component(StatsComponent()).add_component(InventoryComponent())
+        self.c = Entity("c")
+        self.world.add_entities([self.a, self.b, self.c])
+
+    def test_query_groups_by_archetype(self):
+        self.assertEqual(len(self.world.get_archetypes()), 3)
+        ids = sorted(e.id for e in self.world.query_entities(ComponentType.STATS))
+        self.assertEqual(ids, ["a", "b"])
+        self.assertEqual([e.id for e in self.world.query_entities(InventoryComponent)], ["b"])
+
+    def test_columns_follow_component_changes(self):
+        inventory = InventoryComponent()
+        self.a.add_component(inventory)
+        self.assertEqual(sorted(e.id for e in self.world.query_entities(InventoryComponent)), ["a", "b"])
+
+        self.b.remove_component(ComponentType.INVENTORY)
+        archetype = self.world.query(InventoryComponent)[0]
+        self.assertEqual(archetype.entities, [self.a])
+        self.assertIs(archetype.column(InventoryComponent)[0], inventory)
+
+    def test_swap_remove_keeps_rows_aligned(self):
+        entities = [Entity(f"e{i}").add_component(StatsComponent()) for i in range(5)]
+        self.world.add_entities(entities)
+        self.world.remove_entity(entities[1])
+
+        for archetype in self.world.query(StatsComponent):
+            for entity, stats in zip(archetype.entities, archetype.column(StatsComponent)):
+                self.assertIs(entity.get_component_of_type(StatsComponent), stats)
+        self.assertNotIn(entities[1], self.world)
+        self.assertIsNone(entities[1]._world)
+
+    def test_system_manager_passes_matching_entities(self):
+        manager = SystemManager(world=self.world)
+        system = RecordingSystem()
+        manager.add_system(system)
+
+        manager.update_all([self.a, self.b, self.c])
+        self.assertEqual(sorted(system.seen), ["a", "b"])
+
+    def test_entity_query_updates_incrementally(self):
+        query = self.world.entity_query(StatsComponent)
+        self.assertEqual(sorted(e.id for e in query.entities), ["a", "b"])
+
+        self.c.add_component(StatsComponent())
+        self.a.remove_component(StatsComponent)
+        self.world.remove_entity(self.b)
+
+        self.assertEqual([e.id for e in query.entities], ["c"])
+        self.assertIs(self.world.entity_query(ComponentType.STATS), query)
+
+        stats = query.get_stats()
+        self.assertEqual(stats["rebuilds"], 1)
+        self.assertEqual(stats["updates"], 3)
+        self.assertEqual(stats["hits"], 2)
+
+    def test_query_uses_world_cache(self):
+        manager = SystemManager(world=self.world)
+        system = RecordingSystem()
+        manager.add_system(system)
+
+        for _ in range(3):
+            manager.update_all([])
+        entities = system.query()
+        entities.clear()  # Copie: la requête du World reste intacte
+
+        report = manager.get_query_report()["stats"]
+        self.assertEqual(report["rebuilds"], 1)
+        self.assertEqual(report["hits"], 4)
+        self.assertEqual(sorted(e.id for e in system.query()), ["a", "b"])
+
+    def test_filter_entities_filters_argument(self):
+        system = RecordingSystem()
+        SystemManager(world=self.world).add_system(system)
+
+        self.assertEqual(system.filter_entities([self.b, self.c], [ComponentType.STATS]), [self.b])
+        self.assertEqual(system.filter_entities([], [ComponentType.STATS]), [])
+
+    def test_change_sets_follow_mark_dirty(self):
+        manager = SystemManager(world=self.world)
+        system = WatchingSystem()
+        manager.add_system(system)
+
+        manager.update_all([])
+        self.assertEqual(system.changed, ["a", "b"])  # Attachement initial
+
+        manager.update_all([])
+        self.assertEqual(system.changed, [])
+
+        self.b.get_component_of_type(StatsComponent).mark_dirty()
+        self.b.get_component_of_type(InventoryComponent).mark_dirty()  # Non surveillé
+        manager.update_all([])
+        self.assertEqual(system.changed, ["b"])
+
+        manager.update_all([])
+        self.assertEqual(system.changed, [])
+        self.assertEqual(self.world._changes, {})
+
+    def test_npc_counters_mark_personality_changed(self):
+        npc = NPCMale()
+        self.world.add_entity(npc)
+        seq = self.world.change_seq
+
+        npc.record_action_result(True)
+        changes = self.world.changes_since(seq, (PersonalityComponent,))
+        self.assertIn(npc, changes)
+
+if __name__ == '__main__':
+    unittest.main()
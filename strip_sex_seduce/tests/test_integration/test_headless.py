@@ -0,0 +1,90 @@
+"""Tests intégration sessions headless"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import tempfile
+from contextlib import redirect_stdout
+from components.stats import StatsComponent
+from core.headless import HeadlessRunner, ScriptedInput, RandomPolicyInput, CaptureOutput
+from core.turn_log import TurnLog, load_sessions
+
+class TestHeadlessRunner(unittest.TestCase):
+
+    def test_scripted_session_without_console(self):
+        output = CaptureOutput()
+        runner = HeadlessRunner(ScriptedInput(["aide", "a", "r", "quit"]), output)
+
+        report = runner.run()
+
+        self.assertEqual(report["end_condition"], "quit")
+        self.assertEqual(report["turns"], 3)
+        self.assertEqual(report["location_path"][0], "bar")
+        self.assertIn("GUIDE", output.getvalue())
+
+    def test_random_policy_reports_throughput(self):
+        report = HeadlessRunner(RandomPolicyInput(seed=3), max_turns=10).run()
+
+        self.assertIsNotNone(report["end_condition"])
+        self.assertGreater(report["turns"], 0)
+        self.assertGreater(report["turns_per_sec"], 0)
+        self.assertLessEqual(report["latency_ms"]["p50"], report["latency_ms"]["max"])
+
+    def test_same_seed_replays_identically(self):
+        def play(seed):
+            output = CaptureOutput()
+            report = HeadlessRunner(RandomPolicyInput(seed=seed), output, max_turns=30, seed=seed).run()
+            return output.getvalue(), report["final_stats"], report["location_path"]
+
+        self.assertEqual(play(11), play(11))
+
+    def test_turn_log_flushed_on_input_exhausted(self):
+        handle, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(handle)
+        try:
+            log = TurnLog(path, flush=False)
+            report = HeadlessRunner(ScriptedInput(["a", "r"]), turn_log=log).run()
+            self.assertEqual(report["end_condition"], "input_exhausted")
+
+            # Journal encore ouvert (appartient à l'appelant) mais déjà écrit sur disque
+            self.assertEqual(len(load_sessions(path)[0]["events"]), 2)
+            log.close()
+        finally:
+            os.remove(path)
+
+    def test_play_turn_outcomes(self):
+        runner = HeadlessRunner(ScriptedInput(["a"]), max_turns=1)
+        runner.run()
+        session = runner.session
+        turn = session.game_state.turn_count
+        session.running = True
+
+        with redirect_stdout(CaptureOutput()):
+            idle = session.play_turn(lambda: "aide")
+            played = session.play_turn(lambda: "a")
+            exhausted = session.play_turn(lambda: None)
+
+        self.assertEqual((idle.played, idle.end_condition), (False, None))
+        self.assertEqual((played.played, played.end_condition), (True, None))
+        self.assertIsNone(exhausted.player_input)
+        self.assertEqual(session.game_state.turn_count, turn + 1)
+
+    def test_threshold_feedback_displayed_once(self):
+        runner = HeadlessRunner(ScriptedInput(["a"]), max_turns=1)
+        runner.run()
+        session = runner.session
+        session.player.get_component_of_type(StatsComponent).apply_modifier("volonte", -80, source="test")
+
+        output = CaptureOutput()
+        with redirect_stdout(output):
+            session._display_threshold_feedback()
+            session._display_threshold_feedback()  # Messages consommés: rien de plus
+
+        stats_system = session.system_manager.get_system("StatsSystem")
+        self.assertEqual(output.lines(), [stats_system.threshold_messages["vulnerable_entered"]])
+        self.assertEqual(stats_system._threshold_feedback, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Tests intégration journal de tours et replay"""
+
+import unittest
+import tempfile
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.headless import HeadlessRunner, RandomPolicyInput
+from core.turn_log import TurnLog, load_sessions
+from core.replay import ReplayEngine
+
+class TestTurnLogReplay(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _record(self, seed=5, max_turns=40):
+        with TurnLog(self.path) as log:
+            HeadlessRunner(RandomPolicyInput(seed=seed), max_turns=max_turns,
+                           seed=seed, turn_log=log).run()
+
+    def test_log_is_appended_per_session(self):
+        self._record(seed=1)
+        self._record(seed=2)
+
+        sessions = load_sessions(self.path)
+        self.assertEqual([s["header"]["seed"] for s in sessions], [1, 2])
+        first_turn = sessions[0]["events"][0]
+        self.assertEqual(first_turn["turn"], 0)
+        self.assertIn("npc_action", first_turn)
+        self.assertIn("npc", first_turn["rng"])
+
+    def test_replay_matches_recording(self):
+        self._record()
+        engine = ReplayEngine(self.path)
+
+        result = engine.replay()
+
+        self.assertIsNone(result["divergence"])
+        self.assertEqual(len(result["events"]), len(engine.events))
+
+    def test_replay_until_turn(self):
+        self._record()
+        result = ReplayEngine(self.path).replay(until_turn=5)
+
+        self.assertIsNone(result["divergence"])
+        self.assertEqual(result["events"][-1]["turn"], 5)
+
+if __name__ == '__main__':
+    unittest.main()
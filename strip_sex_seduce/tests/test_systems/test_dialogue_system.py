@@ -0,0 +1,120 @@
+"""Tests DialogueSystem - cache de pools de répliques"""
+
+import unittest
+import random
+import json
+import sys
+import os
+from types import SimpleNamespace
+from contextlib import redirect_stdout
+from io import StringIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from systems.dialogue_system import (DialogueSystem, build_dialogue_index, dialogue_source_files,
+                                     DEFAULT_FALLBACK_TEXT, RESISTANCE_BANDS)
+from entities.player import PlayerCharacter
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "baseline_dialogues.json")
+
+class TestDialogueCache(unittest.TestCase):
+
+    def setUp(self):
+        with redirect_stdout(StringIO()):
+            self.system = DialogueSystem()
+        self.system.rng = random.Random(3)
+        self.bar = SimpleNamespace(location="bar")
+
+    def test_cached_pool_keeps_variety(self):
+        texts = {self.system.generate_npc_action_text("compliment", None, self.bar) for _ in range(30)}
+
+        self.assertGreater(len(texts), 1)
+        stats = self.system.get_cache_stats()
+        self.assertEqual(stats["cache_misses"], 1)
+        self.assertEqual(stats["cache_hits"], 29)
+        self.assertEqual(stats["pool_sizes"]["compliment/bar/medium_resistance"],
+                         len(self.system.dialogue_index[("bar", "compliment", "medium_resistance")]))
+
+    def test_clothing_slot_from_player(self):
+        player = PlayerCharacter()
+        self.assertEqual(DialogueSystem._outer_clothing(player), "ton chemisier")
+        self.assertIsNone(DialogueSystem._outer_clothing(None))
+
+    def test_lru_evicts_oldest_pool(self):
+        self.system.dialogue_cache.max_size = 2
+        for location in ("bar", "voiture", "salon"):
+            self.system.generate_npc_action_text("compliment", None, SimpleNamespace(location=location))
+
+        stats = self.system.get_cache_stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertNotIn("compliment/bar/medium_resistance", stats["pool_sizes"])
+
+class TestDialogueIndex(unittest.TestCase):
+
+    SOURCES = {
+        "assets/dialogues/bar.json": {
+            "location": "bar",
+            "actions": {"compliment": {"low_resistance": ["bar bas"], "base": ["bar tous"]}},
+            "fallbacks": {"contact_epaule": "secours bar"}
+        },
+        "assets/dialogues/salon.json": {
+            "location": "salon",
+            "actions": {"caresses": {"high_resistance": ["salon haut"]}},
+            "fallbacks": {"caresses": "secours salon"}
+        }
+    }
+
+    def setUp(self):
+        with redirect_stdout(StringIO()):
+            self.index = build_dialogue_index(self.SOURCES)
+
+    def test_band_lines_include_base(self):
+        self.assertEqual(self.index[("bar", "compliment", "low_resistance")], ("bar bas", "bar tous"))
+        self.assertEqual(self.index[("bar", "compliment", "high_resistance")], ("bar tous",))
+
+    def test_fallback_chain_resolved(self):
+        # Pas de réplique au salon: celles du bar
+        self.assertEqual(self.index[("salon", "compliment", "low_resistance")], ("bar bas", "bar tous"))
+        # Niveau absent partout: réplique de secours du lieu, puis geste générique
+        self.assertEqual(self.index[("salon", "caresses", "low_resistance")], ("secours salon",))
+        self.assertEqual(self.index[("salon", "contact_epaule", "low_resistance")], (DEFAULT_FALLBACK_TEXT,))
+
+class TestDialogueAssets(unittest.TestCase):
+    """Index construit depuis assets/dialogues == pools des templates Python d'origine"""
+
+    @staticmethod
+    def _baseline_pool(baseline, location, action, band):
+        # Résolution de l'ancien _generate_rich_text, sans le tirage
+        templates = baseline["dialogue_templates"]
+        bands = templates.get(location, templates["bar"]).get(action)
+        if bands and band in bands:
+            return tuple(bands[band])
+        if location != "bar" and band in templates["bar"].get(action, {}):
+            return tuple(templates["bar"][action][band])
+        fallbacks = baseline["fallback_by_location"]
+        return (fallbacks.get(location, fallbacks["bar"]).get(action, DEFAULT_FALLBACK_TEXT),)
+
+    def test_index_matches_baseline_templates(self):
+        with open(BASELINE_PATH, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        sources = {}
+        for rel in dialogue_source_files():
+            with open(os.path.join(root, rel), 'r', encoding='utf-8') as f:
+                sources[rel] = json.load(f)
+        with redirect_stdout(StringIO()):
+            index = build_dialogue_index(sources)
+
+        locations = set(baseline["dialogue_templates"])
+        actions = {action for by_action in baseline["dialogue_templates"].values() for action in by_action}
+        actions.update(action for by_action in baseline["fallback_by_location"].values() for action in by_action)
+        self.assertEqual({location for location, _, _ in index}, locations)
+        self.assertEqual({action for _, action, _ in index}, actions)
+
+        for (location, action, band), pool in index.items():
+            self.assertEqual(tuple(line.plain for line in pool),
+                             self._baseline_pool(baseline, location, action, band),
+                             (location, action, band))
+        self.assertEqual(len(index), len(locations) * len(actions) * len(RESISTANCE_BANDS))
+
+if __name__ == '__main__':
+    unittest.main()
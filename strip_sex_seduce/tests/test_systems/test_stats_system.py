@@ -0,0 +1,73 @@
+"""Tests StatsSystem - table d'effets et application en lot"""
+
+import unittest
+import sys
+import os
+from contextlib import redirect_stdout
+from io import StringIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from systems.stats_system import StatsSystem, DEFAULT_ACTION_EFFECT
+from components.stats import StatsComponent
+from entities.player import PlayerCharacter
+from core.stat_store import StatStore, NUMPY_AVAILABLE
+
+ACTIONS = ["compliment", "main_cuisse", "caresses_intimes", "action_inconnue"]
+LOCATIONS = ["bar", "salon", "chambre", "parking"]
+
+class TestEffectTable(unittest.TestCase):
+
+    def setUp(self):
+        with redirect_stdout(StringIO()):
+            self.system = StatsSystem()
+
+    def test_table_matches_modifiers(self):
+        effect = self.system.get_effect("main_cuisse", "chambre")
+        base = self.system.action_effects["main_cuisse"]
+        modifiers = self.system.location_modifiers["chambre"]
+        self.assertEqual(effect["volonte"], int(base["volonte"] * modifiers["volonte_mult"]))
+        self.assertEqual(effect["excitation"], int(base["excitation"] * modifiers["excitation_mult"]))
+
+    def test_fallbacks_and_read_only(self):
+        self.assertEqual(self.system.get_effect("compliment", "parking"), self.system.get_effect("compliment", "bar"))
+        unknown = self.system.get_effect("action_inconnue", "bar")
+        self.assertEqual(unknown["volonte"], int(DEFAULT_ACTION_EFFECT["volonte"] * 1.2))
+        with self.assertRaises(TypeError):
+            unknown["volonte"] = 0
+
+class TestStatsBatch(unittest.TestCase):
+
+    def setUp(self):
+        with redirect_stdout(StringIO()):
+            self.system = StatsSystem()
+            self.players = [PlayerCharacter(f"p{i}") for i in range(len(ACTIONS))]
+            self.reference = [PlayerCharacter(f"r{i}") for i in range(len(ACTIONS))]
+
+    def test_batch_matches_single_application(self):
+        for _ in range(6):
+            self.system.apply_npc_action_batch(self.players, ACTIONS, LOCATIONS)
+            for player, action, location in zip(self.reference, ACTIONS, LOCATIONS):
+                self.system.apply_npc_action(player, action, {"location": location})
+
+        for player, reference in zip(self.players, self.reference):
+            stats = player.get_component_of_type(StatsComponent)
+            expected = reference.get_component_of_type(StatsComponent)
+            self.assertEqual((stats.volonte, stats.excitation), (expected.volonte, expected.excitation))
+            self.assertEqual(stats.thresholds, expected.thresholds)
+            self.assertEqual([(e.stat, e.actual_change, e.source) for e in stats.history],
+                             [(e.stat, e.actual_change, e.source) for e in expected.history])
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "NumPy non installé")
+    def test_store_clamps_and_flushes(self):
+        components = [StatsComponent(volonte=5), StatsComponent(excitation=98)]
+        store = StatStore(components)
+        actual = store.apply_deltas([-10, 0], [0, 10])
+        store.flush()
+
+        self.assertEqual(actual["volonte"].tolist(), [-5, 0])
+        self.assertEqual((components[0].volonte, components[1].excitation), (0, 100))
+        self.assertTrue(components[0].thresholds["submissive"])
+        self.assertTrue(components[1].thresholds["climax_ready"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,3 +25,22 @@ class DebugTools:
             print(f"  Calls: {stats['total_calls']}")
             print(f"  Avg time: {stats['avg_time']*1000:.2f}ms")
             print(f"  Last time: {stats['last_update_time']*1000:.2f}ms")
+            if "p50_time" in stats:
+                print(f"  p50/p95/p99: {stats['p50_time']*1000:.2f}/"
+                      f"{stats['p95_time']*1000:.2f}/{stats['p99_time']*1000:.2f}ms")
+                print(f"  Min/Max: {stats['min_time']*1000:.2f}/{stats['max_time']*1000:.2f}ms")
+                print(f"  Window ({stats['window_samples']}) p99/max: "
+                      f"{stats['window_p99_time']*1000:.2f}/{stats['window_max_time']*1000:.2f}ms")
+
+    @staticmethod
+    def print_query_report(system_manager):
+        """Affiche compteurs des requêtes entities en cache"""
+        report = system_manager.get_query_report()
+
+        print("\n=== QUERY CACHE REPORT ===")
+        for query_name, stats in report.items():
+            print(f"{query_name}:")
+            print(f"  Hits: {stats['hits']}")
+            print(f"  Rebuilds: {stats['rebuilds']}")
+            print(f"  Updates: {stats['updates']}")
+            print(f"  Size: {stats['size']}")
@@ -4,7 +4,8 @@ PerformanceMonitor - Monitoring performance mémoire/temps
 
 import time
 import tracemalloc
-from typing import Dict, List, Any
+from collections import deque, OrderedDict
+from typing import Dict, List, Any, Hashable, Optional
 
 class PerformanceMonitor:
     def __init__(self):
@@ -40,3 +41,153 @@ class PerformanceMonitor:
             "avg_response_ms": avg_loop_time,
             "total_loops": len(self.loop_times)
         }
+
+class LatencyHistogram:
+    """
+    Histogramme de latences à buckets logarithmiques, mémoire fixe
+    8 sous-buckets par puissance de 2 (erreur relative < 12.5%),
+    plus une fenêtre glissante des derniers échantillons
+    """
+
+    SUB_BUCKET_BITS = 3
+    MAX_EXPONENT = 40  # 2^40 ns ~ 18 min, au-delà: dernier bucket
+
+    def __init__(self, window_size: int = 256):
+        self._sub = 1 << self.SUB_BUCKET_BITS
+        self._buckets = [0] * ((self.MAX_EXPONENT + 1) * self._sub)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self._window = deque(maxlen=window_size)
+
+    def record_ns(self, value_ns: int):
+        """Enregistre une durée en nanosecondes (O(1))"""
+        if value_ns < 0:
+            value_ns = 0
+
+        self._buckets[self._bucket_index(value_ns)] += 1
+        self._window.append(value_ns)
+
+        if self.count == 0 or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.total_ns += value_ns
+
+    def record(self, seconds: float):
+        self.record_ns(int(seconds * 1e9))
+
+    def _bucket_index(self, value_ns: int) -> int:
+        if value_ns < self._sub:
+            return value_ns
+        exponent = value_ns.bit_length() - 1 - self.SUB_BUCKET_BITS
+        if exponent >= self.MAX_EXPONENT:
+            return len(self._buckets) - 1
+        # Bits de poids fort après le bit de tête = sous-bucket
+        mantissa = (value_ns >> exponent) - self._sub
+        return (exponent + 1) * self._sub + mantissa
+
+    def _bucket_upper_ns(self, index: int) -> int:
+        if index < self._sub:
+            return index
+        exponent = index // self._sub - 1
+        mantissa = index % self._sub
+        return ((self._sub + mantissa + 1) << exponent) - 1
+
+    def percentile_ns(self, percentile: float) -> int:
+        """Percentile (0-100) approché par la borne haute du bucket"""
+        if self.count == 0:
+            return 0
+        target = max(1, int(self.count * percentile / 100.0 + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(self._buckets):
+            seen += bucket_count
+            if seen >= target:
+                return min(max(self._bucket_upper_ns(index), self.min_ns), self.max_ns)
+        return self.max_ns
+
+    def window_percentile_ns(self, percentile: float) -> int:
+        """Percentile exact sur la fenêtre glissante"""
+        if not self._window:
+            return 0
+        ordered = sorted(self._window)
+        rank = min(len(ordered) - 1, max(0, int(len(ordered) * percentile / 100.0 + 0.5) - 1))
+        return ordered[rank]
+
+    def get_stats(self) -> Dict[str, float]:
+        """Statistiques en secondes, cohérentes avec avg_time des systems"""
+        return {
+            "min_time": self.min_ns / 1e9,
+            "max_time": self.max_ns / 1e9,
+            "p50_time": self.percentile_ns(50) / 1e9,
+            "p95_time": self.percentile_ns(95) / 1e9,
+            "p99_time": self.percentile_ns(99) / 1e9,
+            "window_samples": len(self._window),
+            "window_p50_time": self.window_percentile_ns(50) / 1e9,
+            "window_p99_time": self.window_percentile_ns(99) / 1e9,
+            "window_max_time": (max(self._window) if self._window else 0) / 1e9
+        }
+
+    def reset(self):
+        self._buckets = [0] * len(self._buckets)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self._window.clear()
+
+class LRUCache:
+    """
+    Cache borné, éviction du moins récemment utilisé (O(1) par accès)
+    Compte hits, misses et évictions
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Vide le cache (les compteurs sont conservés)"""
+        self._entries.clear()
+
+    def items(self):
+        return self._entries.items()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_size": self.max_size
+        }